@@ -0,0 +1,122 @@
+"""
+Relay connections backed by keyset pagination.
+
+``KeysetConnectionField`` pages the queryset a resolver returns with
+``first``/``after`` and ``last``/``before``, seeking on the ordering the
+resolver already applied (plus a primary key tie-breaker) rather than
+slicing with OFFSET. Page sizes are capped by graphene-django's
+``RELAY_CONNECTION_MAX_LIMIT`` so one query can't materialize every row.
+"""
+
+import graphene
+from django.db import models
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLError
+
+from apps.core import keyset
+from .loaders import get_loaders
+
+PAGINATION_ARGS = ("first", "last", "after", "before")
+
+
+class KeysetConnectionField(graphene.relay.ConnectionField):
+    """A connection field that keyset-paginates the resolver's queryset."""
+
+    @classmethod
+    def connection_resolver(cls, resolver, connection_type, root, info, **args):
+        pagination = {name: args.pop(name, None) for name in PAGINATION_ARGS}
+        queryset = resolver(root, info, **args)
+
+        if isinstance(connection_type, graphene.NonNull):
+            connection_type = connection_type.of_type
+        if queryset is None or isinstance(queryset, connection_type):
+            return queryset
+
+        assert isinstance(queryset, models.QuerySet), (
+            f"{cls.__name__} resolvers must return a QuerySet. "
+            f'Received "{queryset}".'
+        )
+        return keyset_connection(connection_type, queryset, info, **pagination)
+
+
+def keyset_connection(
+    connection_type, queryset, info, first=None, last=None, after=None, before=None
+):
+    """Build one page of ``connection_type`` from an ordered ``queryset``."""
+    limit = _page_size(info, first, last)
+    ordering = keyset.unique_ordering(
+        queryset.query.order_by or queryset.model._meta.ordering
+    )
+    backward = last is not None
+
+    if after:
+        queryset = queryset.filter(
+            keyset.seek_filter(
+                queryset.model, ordering, _position(queryset.model, ordering, after)
+            )
+        )
+    if before:
+        inverted = [keyset.invert(field) for field in ordering]
+        queryset = queryset.filter(
+            keyset.seek_filter(
+                queryset.model, inverted, _position(queryset.model, ordering, before)
+            )
+        )
+    if backward:
+        queryset = keyset.order_queryset(
+            queryset, [keyset.invert(field) for field in ordering]
+        )
+    else:
+        queryset = keyset.order_queryset(queryset, ordering)
+
+    rows = list(queryset[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+
+    # Nested relations batch over the whole page, not one edge at a time.
+    get_loaders(info).register(rows)
+
+    edges = [
+        connection_type.Edge(
+            node=row,
+            cursor=keyset.encode_cursor(keyset.position_of(row, ordering)),
+        )
+        for row in rows
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=graphene.relay.PageInfo(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=has_more if backward else bool(after),
+            has_next_page=bool(before) if backward else has_more,
+        ),
+    )
+
+
+def _page_size(info, first, last):
+    if first is not None and last is not None:
+        raise GraphQLError("Pass either `first` or `last`, not both.")
+
+    max_limit = graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+    for name, value in (("first", first), ("last", last)):
+        if value is None:
+            continue
+        if value < 0:
+            raise GraphQLError(f"Argument '{name}' must be a non-negative integer.")
+        if max_limit and value > max_limit:
+            raise GraphQLError(
+                f"Requesting {value} records on the `{info.field_name}` "
+                f"connection exceeds the `{name}` limit of {max_limit} records."
+            )
+        return value
+    return max_limit
+
+
+def _position(model, ordering, cursor):
+    try:
+        return keyset.parse_position(model, ordering, keyset.decode_cursor(cursor))
+    except Exception:
+        raise GraphQLError("Invalid cursor.")
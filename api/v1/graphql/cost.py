@@ -0,0 +1,172 @@
+"""
+Static query cost and depth limits.
+
+``QueryCostRule`` measures every operation from the document alone and
+rejects it before execution when it costs more than
+``GRAPHQL_MAX_QUERY_COST`` or nests deeper than
+``GRAPHQL_MAX_QUERY_DEPTH``:
+
+- A field that selects an object costs 1 and a scalar costs nothing, unless
+  ``GRAPHQL_FIELD_COSTS`` weights it as ``"Type.field"``.
+- A field's sub-selection is multiplied by how many items it can return. A
+  connection returns its literal ``first``/``last``, or the page cap if
+  neither is given or either is a variable. A plain list is assumed to
+  return ``GRAPHQL_LIST_SIZE_ESTIMATE`` items.
+- Aliases are counted separately. Introspection fields are not counted.
+
+The measurement is stored on the operation node as ``cost``. Documents are
+cached once validated, so later requests read it without measuring again.
+"""
+
+from typing import NamedTuple
+
+from django.conf import settings
+from graphene_django.settings import graphene_settings
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    get_named_type,
+    get_nullable_type,
+    is_leaf_type,
+    is_list_type,
+)
+from graphql.validation import ValidationRule
+
+
+class QueryCost(NamedTuple):
+    cost: int
+    depth: int
+
+    def as_extension(self):
+        return {
+            "requested": self.cost,
+            "maximum": settings.GRAPHQL_MAX_QUERY_COST,
+            "depth": self.depth,
+            "maximumDepth": settings.GRAPHQL_MAX_QUERY_DEPTH,
+        }
+
+
+class QueryCostRule(ValidationRule):
+    """Rejects operations over the configured cost or depth."""
+
+    def enter_operation_definition(self, node, *_args):
+        root = self.context.schema.get_root_type(node.operation)
+        if root is None:
+            return
+        node.cost = _Measure(self.context, node).measure(root)
+
+        name = f"'{node.name.value}'" if node.name else "Operation"
+        if node.cost.depth > settings.GRAPHQL_MAX_QUERY_DEPTH:
+            self.report_error(
+                GraphQLError(
+                    f"{name} is nested {node.cost.depth} levels deep; "
+                    f"the limit is {settings.GRAPHQL_MAX_QUERY_DEPTH}.",
+                    node,
+                    extensions={
+                        "code": "QUERY_TOO_DEEP",
+                        "cost": node.cost.as_extension(),
+                    },
+                )
+            )
+        if node.cost.cost > settings.GRAPHQL_MAX_QUERY_COST:
+            self.report_error(
+                GraphQLError(
+                    f"{name} costs {node.cost.cost}; "
+                    f"the limit is {settings.GRAPHQL_MAX_QUERY_COST}.",
+                    node,
+                    extensions={
+                        "code": "QUERY_TOO_COSTLY",
+                        "cost": node.cost.as_extension(),
+                    },
+                )
+            )
+
+
+class _Measure:
+    def __init__(self, context, operation):
+        self.context = context
+        self.weights = settings.GRAPHQL_FIELD_COSTS
+        self.list_size = settings.GRAPHQL_LIST_SIZE_ESTIMATE
+        self.page_size = graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+        self.selection_set = operation.selection_set
+
+    def measure(self, root):
+        return QueryCost(*self._selections(self.selection_set, root, 0, frozenset()))
+
+    def _selections(self, selection_set, parent_type, depth, fragments):
+        cost, deepest = 0, depth
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field_cost, field_depth = self._field(
+                    selection, parent_type, depth, fragments
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                field_cost, field_depth = self._selections(
+                    selection.selection_set,
+                    self._condition(selection, parent_type),
+                    depth,
+                    fragments,
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.context.get_fragment(name)
+                # Cycles are reported by NoFragmentCyclesRule; don't recurse.
+                if fragment is None or name in fragments:
+                    continue
+                field_cost, field_depth = self._selections(
+                    fragment.selection_set,
+                    self._condition(fragment, parent_type),
+                    depth,
+                    fragments | {name},
+                )
+            else:
+                continue
+            cost += field_cost
+            deepest = max(deepest, field_depth)
+        return cost, deepest
+
+    def _field(self, node, parent_type, depth, fragments):
+        name = node.name.value
+        fields = getattr(parent_type, "fields", {})
+        if name.startswith("__") or name not in fields:
+            return 0, depth
+
+        field_type = fields[name].type
+        named_type = get_named_type(field_type)
+        default_weight = 0 if is_leaf_type(named_type) else 1
+        cost = self.weights.get(f"{parent_type.name}.{name}", default_weight)
+        if node.selection_set is None:
+            return cost, depth + 1
+
+        child_cost, child_depth = self._selections(
+            node.selection_set, named_type, depth + 1, fragments
+        )
+        multiplier = self._multiplier(node, parent_type, field_type)
+        return cost + multiplier * child_cost, child_depth
+
+    def _multiplier(self, node, parent_type, field_type):
+        if get_named_type(field_type).name.endswith("Connection"):
+            for argument in node.arguments:
+                if argument.name.value not in ("first", "last"):
+                    continue
+                # A variable counts as the page cap: the cost is cached with
+                # the document, so it can't depend on one request's values.
+                if not isinstance(argument.value, IntValueNode):
+                    break
+                value = max(int(argument.value.value), 0)
+                return min(value, self.page_size or value)
+            return self.page_size or self.list_size
+        # The connection already counted its page; edges is that page.
+        if parent_type.name.endswith("Connection") and node.name.value == "edges":
+            return 1
+        if is_list_type(get_nullable_type(field_type)):
+            return self.list_size
+        return 1
+
+    def _condition(self, node, parent_type):
+        if node.type_condition is None:
+            return parent_type
+        return self.context.schema.get_type(node.type_condition.name.value)
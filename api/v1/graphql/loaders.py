@@ -0,0 +1,215 @@
+"""
+Per-request DataLoaders for GraphQL relations.
+
+graphene-django resolves a foreign key with one query per parent object,
+so a list of N transactions asking for ``account`` and ``category`` costs
+2N extra queries. The loaders here batch every relation into a single
+``IN`` query per level instead.
+
+Execution is synchronous, so loaders cannot defer work until siblings have
+asked for their keys. Instead, ``DataLoaderMiddleware`` registers every
+model instance a resolver returns, and the first ``load`` for a relation
+fetches the keys of all registered instances of that model at once.
+Loaded objects are registered in turn, so nested relations batch too.
+Relations a resolver already joined or prefetched (see ``projection``) are
+used as they are.
+"""
+
+from collections import defaultdict
+
+from django.db import models
+from graphql import GraphQLList, get_nullable_type
+
+from apps.categories.tree import CategoryTree
+
+
+class ForeignKeyLoader:
+    """Loads a forward foreign key for every registered instance at once."""
+
+    def __init__(self, loaders, field):
+        self.loaders = loaders
+        self.field = field
+        self.cache = {}
+
+    def load(self, instance):
+        attname = self.field.attname
+        key = getattr(instance, attname)
+        if key is None:
+            return None
+        if self.field.is_cached(instance):
+            # Joined by the resolver's select_related, with the fields it
+            # selected there.
+            related = self.field.get_cached_value(instance)
+            self.loaders.register([related])
+            return related
+        if key not in self.cache:
+            keys = {key}
+            for sibling in self.loaders.registered(self.field.model):
+                # Siblings projected without the key would each load it.
+                sibling_key = sibling.__dict__.get(attname)
+                if sibling_key is not None and sibling_key not in self.cache:
+                    keys.add(sibling_key)
+            related = self.field.related_model._base_manager.in_bulk(
+                keys, field_name=self.field.target_field.name
+            )
+            for batch_key in keys:
+                self.cache[batch_key] = related.get(batch_key)
+            self.loaders.register(related.values())
+        return self.cache[key]
+
+
+class ReverseForeignKeyLoader:
+    """Loads a reverse foreign key (one-to-many) for every registered parent."""
+
+    def __init__(self, loaders, rel):
+        self.loaders = loaders
+        self.rel = rel
+        self.cache = {}
+        self.prefetched = set()
+
+    def load(self, instance):
+        prefetched = getattr(instance, "_prefetched_objects_cache", {})
+        accessor = self.rel.get_accessor_name()
+        if accessor in prefetched:
+            if instance.pk not in self.prefetched:
+                # Register every parent's children at once, so their own
+                # relations batch over the whole page.
+                for parent in [*self.loaders.registered(self.rel.model), instance]:
+                    children = getattr(parent, "_prefetched_objects_cache", {})
+                    if accessor in children and parent.pk not in self.prefetched:
+                        self.prefetched.add(parent.pk)
+                        self.loaders.register(children[accessor])
+            return list(prefetched[accessor])
+        if instance.pk not in self.cache:
+            keys = {instance.pk}
+            for sibling in self.loaders.registered(self.rel.model):
+                if sibling.pk not in self.cache:
+                    keys.add(sibling.pk)
+            remote = self.rel.field
+            children = list(
+                self.rel.related_model._default_manager.filter(
+                    **{f"{remote.attname}__in": keys}
+                )
+            )
+            grouped = defaultdict(list)
+            for child in children:
+                grouped[getattr(child, remote.attname)].append(child)
+            for batch_key in keys:
+                self.cache[batch_key] = grouped.get(batch_key, [])
+            self.loaders.register(children)
+        return self.cache[instance.pk]
+
+
+class ComputedLoader:
+    """Computes a value for every registered instance at once with ``batch``."""
+
+    def __init__(self, loaders, model, batch):
+        self.loaders = loaders
+        self.model = model
+        self.batch = batch
+        self.cache = {}
+
+    def load(self, instance):
+        if instance.pk not in self.cache:
+            pending = {instance.pk: instance}
+            deferred = instance.get_deferred_fields()
+            for sibling in self.loaders.registered(self.model):
+                # Skip siblings projected narrower than ``instance``; the
+                # batch would load their missing columns one at a time.
+                if sibling.pk not in self.cache and (
+                    sibling.get_deferred_fields() <= deferred
+                ):
+                    pending.setdefault(sibling.pk, sibling)
+            results = self.batch(list(pending.values()))
+            for batch_key in pending:
+                self.cache[batch_key] = results.get(batch_key)
+        return self.cache[instance.pk]
+
+
+class DataLoaders:
+    """The loaders and registered instances for one GraphQL request."""
+
+    def __init__(self):
+        self._registered = defaultdict(dict)
+        self._loaders = {}
+
+    def register(self, instances):
+        for instance in instances:
+            if isinstance(instance, models.Model):
+                model = instance._meta.concrete_model
+                self._registered[model].setdefault(instance.pk, instance)
+
+    def registered(self, model):
+        return self._registered[model._meta.concrete_model].values()
+
+    def load(self, instance, name):
+        """Return ``instance.<name>`` (a FK target or a list of children)."""
+        model = instance._meta.concrete_model
+        loader = self._loaders.get((model, name))
+        if loader is None:
+            field = model._meta.get_field(name)
+            if field.one_to_many:
+                loader = ReverseForeignKeyLoader(self, field)
+            else:
+                loader = ForeignKeyLoader(self, field)
+            self._loaders[(model, name)] = loader
+        self.register([instance])
+        return loader.load(instance)
+
+    def compute(self, instance, name, batch):
+        """
+        Return ``batch(instances)[instance.pk]``, computing the value for all
+        registered instances of the model in one call.
+        """
+        model = instance._meta.concrete_model
+        loader = self._loaders.get((model, name))
+        if loader is None:
+            loader = ComputedLoader(self, model, batch)
+            self._loaders[(model, name)] = loader
+        self.register([instance])
+        return loader.load(instance)
+
+    def prime(self, model, name, batch, values):
+        """Seed ``compute(..., name, batch)`` with precomputed ``{pk: value}``."""
+        model = model._meta.concrete_model
+        loader = self._loaders.get((model, name))
+        if loader is None:
+            loader = ComputedLoader(self, model, batch)
+            self._loaders[(model, name)] = loader
+        loader.cache.update(values)
+
+
+def get_loaders(info):
+    """Return the request's DataLoaders, creating them on first use."""
+    context = info.context
+    loaders = getattr(context, "dataloaders", None)
+    if loaders is None:
+        loaders = DataLoaders()
+        context.dataloaders = loaders
+    return loaders
+
+
+def get_category_tree(info):
+    """Return the request user's category tree, loading it on first use."""
+    context = info.context
+    tree = getattr(context, "category_tree", None)
+    if tree is None:
+        tree = CategoryTree.for_user(context.user)
+        context.category_tree = tree
+    return tree
+
+
+class DataLoaderMiddleware:
+    """Register the model instances every resolver returns with the loaders."""
+
+    def resolve(self, next, root, info, **kwargs):
+        result = next(root, info, **kwargs)
+        if isinstance(result, models.Model):
+            get_loaders(info).register([result])
+        elif isinstance(result, (models.QuerySet, list, tuple)) and isinstance(
+            get_nullable_type(info.return_type), GraphQLList
+        ):
+            # Lists are iterated in full by the executor anyway.
+            result = list(result)
+            get_loaders(info).register(result)
+        return result
@@ -1,6 +1,12 @@
 import graphene
 from datetime import datetime
+from apps.accounts.models import Account
 from apps.transactions.models import Transaction
+from apps.transactions.services import (
+    create_transaction,
+    delete_transaction,
+    update_transaction,
+)
 from ..types.transactions import TransactionType
 from ..authentication import login_required
 
@@ -40,7 +46,9 @@ class CreateTransaction(graphene.Mutation):
         user = info.context.user
 
         try:
-            transaction = Transaction.objects.create(
+            if not Account.objects.filter(pk=account_id, user=user).exists():
+                return CreateTransaction(success=False, errors=["Account not found"])
+            transaction = create_transaction(
                 user=user,
                 account_id=account_id,
                 category_id=category_id,
@@ -95,25 +103,30 @@ class UpdateTransaction(graphene.Mutation):
 
         try:
             transaction = Transaction.objects.get(pk=id, user=user)
+            changes = {}
             if account_id is not None:
-                transaction.account_id = account_id
+                if not Account.objects.filter(pk=account_id, user=user).exists():
+                    return UpdateTransaction(
+                        success=False, errors=["Account not found"]
+                    )
+                changes["account_id"] = account_id
             if category_id is not None:
-                transaction.category_id = category_id
+                changes["category_id"] = category_id
             if amount is not None:
-                transaction.amount = amount
+                changes["amount"] = amount
             if currency is not None:
-                transaction.currency = currency
+                changes["currency"] = currency
             if transaction_type is not None:
-                transaction.transaction_type = transaction_type
+                changes["transaction_type"] = transaction_type
             if date is not None:
-                transaction.date = date
+                changes["date"] = date
             if description is not None:
-                transaction.description = description
+                changes["description"] = description
             if notes is not None:
-                transaction.notes = notes
+                changes["notes"] = notes
             if payment_method is not None:
-                transaction.payment_method = payment_method
-            transaction.save()
+                changes["payment_method"] = payment_method
+            update_transaction(transaction, **changes)
             return UpdateTransaction(success=True, transaction=transaction, errors=[])
         except Transaction.DoesNotExist:
             return UpdateTransaction(success=False, errors=["Transaction not found"])
@@ -136,7 +149,7 @@ class DeleteTransaction(graphene.Mutation):
 
         try:
             transaction = Transaction.objects.get(pk=id, user=user)
-            transaction.delete()
+            delete_transaction(transaction)
             return DeleteTransaction(success=True, errors=[])
         except Transaction.DoesNotExist:
             return DeleteTransaction(success=False, errors=["Transaction not found"])
@@ -0,0 +1,178 @@
+"""
+Automatic persisted queries and the parsed-document cache.
+
+Clients following the Apollo APQ protocol send only the SHA-256 hash of an
+operation in ``extensions.persistedQuery.sha256Hash``. An unknown hash is
+answered with ``PERSISTED_QUERY_NOT_FOUND``, and the client retries once
+with the query text, which registers it in the shared cache for every
+process.
+
+Every document that parses and validates is kept in a per-process LRU
+keyed by its hash, so repeated operations skip both steps whether or not
+the client sends the hash. With ``GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST``
+set to a JSON file mapping hashes to queries, only those operations run.
+They are parsed and validated once, when the list is loaded.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLError, parse, validate
+
+PERSISTED_QUERY_KEY = "graphql-persisted-query:{sha256}"
+PERSISTED_QUERY_TIMEOUT = 30 * 24 * 60 * 60
+
+
+def query_hash(query):
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def persisted_query_hash(request, data):
+    """The ``sha256Hash`` a request's APQ extension names, or ``None``."""
+    extensions = request.GET.get("extensions") or data.get("extensions")
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+    if not isinstance(extensions, dict):
+        return None
+    persisted = extensions.get("persistedQuery")
+    if not isinstance(persisted, dict) or persisted.get("version") != 1:
+        return None
+    return persisted.get("sha256Hash")
+
+
+class DocumentCache:
+    """A thread-safe LRU of validated documents keyed by query hash."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha256):
+        with self._lock:
+            document = self._documents.get(sha256)
+            if document is not None:
+                self._documents.move_to_end(sha256)
+            return document
+
+    def set(self, sha256, document):
+        with self._lock:
+            self._documents[sha256] = document
+            self._documents.move_to_end(sha256)
+            while len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+documents = DocumentCache(settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+
+
+def get_document(schema, query, sha256=None, rules=None):
+    """
+    The validated document for ``query`` or the persisted query ``sha256``.
+
+    Returns ``(document, errors)``: ``(None, [])`` when the request names
+    no operation at all, and ``(None, errors)`` when the operation is
+    unknown, disallowed, or fails to parse or validate.
+    """
+    allow_list = get_allow_list(schema, rules)
+    if allow_list is not None:
+        if sha256 is None and query:
+            sha256 = query_hash(query)
+        if sha256 is None:
+            return None, []
+        document = allow_list.get(sha256)
+        if document is None:
+            return None, [
+                _error("Operation is not allowed.", "PERSISTED_QUERY_NOT_ALLOWED")
+            ]
+        return document, []
+
+    if not query:
+        if sha256 is None:
+            return None, []
+        document = documents.get(sha256)
+        if document is not None:
+            return document, []
+        query = cache.get(PERSISTED_QUERY_KEY.format(sha256=sha256))
+        if query is None:
+            return None, [_error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")]
+        register = False
+    else:
+        if sha256 is not None and sha256 != query_hash(query):
+            return None, [
+                _error(
+                    "Provided sha does not match query.",
+                    "PERSISTED_QUERY_HASH_MISMATCH",
+                )
+            ]
+        register = sha256 is not None
+        sha256 = query_hash(query)
+        document = documents.get(sha256)
+        if document is not None:
+            if register:
+                _register(sha256, query)
+            return document, []
+
+    document, errors = _parse_and_validate(schema, query, rules)
+    if document is not None:
+        documents.set(sha256, document)
+        if register:
+            _register(sha256, query)
+    return document, errors
+
+
+@lru_cache(maxsize=None)
+def get_allow_list(schema, rules=None):
+    """The allow-listed documents by hash, or ``None`` with no allow-list."""
+    path = settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as manifest:
+        queries = json.load(manifest)
+
+    allowed = {}
+    for sha256, query in queries.items():
+        if sha256 != query_hash(query):
+            raise ImproperlyConfigured(
+                f"Allow-listed query {sha256} has the wrong hash."
+            )
+        document, errors = _parse_and_validate(schema, query, rules)
+        if errors:
+            raise ImproperlyConfigured(
+                f"Allow-listed query {sha256} is invalid: {errors[0].message}"
+            )
+        allowed[sha256] = document
+    return allowed
+
+
+def _parse_and_validate(schema, query, rules=None):
+    try:
+        document = parse(query)
+    except GraphQLError as error:
+        return None, [error]
+    errors = validate(schema, document, rules, graphene_settings.MAX_VALIDATION_ERRORS)
+    if errors:
+        return None, errors
+    return document, []
+
+
+def _register(sha256, query):
+    cache.set(PERSISTED_QUERY_KEY.format(sha256=sha256), query, PERSISTED_QUERY_TIMEOUT)
+
+
+def _error(message, code):
+    return GraphQLError(message, extensions={"code": code})
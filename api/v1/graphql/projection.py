@@ -0,0 +1,164 @@
+"""
+Selection-aware querysets for GraphQL resolvers.
+
+A resolver's queryset loads every column of its model, while a query
+usually selects a few fields. ``project`` reads the selection from
+``info.field_nodes`` (looking through a connection's ``edges { node }``)
+and narrows the queryset to match:
+
+- Model fields load their columns with ``.only()``.
+- Forward relations with a sub-selection are joined with
+  ``select_related``, projected to the related fields selected.
+- Reverse relations are prefetched with a projected ``Prefetch``.
+
+Fields that aren't model fields declare the columns they read in the
+type's ``field_sources``. Without one the queryset is left unprojected,
+since a deferred column would cost a query per row. The loaders use joined
+and prefetched relations instead of loading them again.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from graphene.relay import Connection
+from graphene.utils.str_converters import to_snake_case
+from graphql import FieldNode, FragmentSpreadNode, InlineFragmentNode, get_named_type
+
+
+def project(queryset, info):
+    """Restrict ``queryset`` to what the resolved field selects."""
+    object_type = get_named_type(info.return_type)
+    field_nodes = info.field_nodes
+    graphene_type = getattr(object_type, "graphene_type", None)
+    if isinstance(graphene_type, type) and issubclass(graphene_type, Connection):
+        edges = _selected(info, field_nodes).get("edges", [])
+        field_nodes = _selected(info, edges).get("node", [])
+        edge_type = get_named_type(object_type.fields["edges"].type)
+        object_type = get_named_type(edge_type.fields["node"].type)
+    return _project(queryset, info, object_type, field_nodes)
+
+
+def _project(queryset, info, object_type, field_nodes, extra_fields=()):
+    plan = _plan(queryset.model, info, object_type, field_nodes)
+    if plan is None:
+        return queryset
+
+    paths, related, prefetches = plan
+    paths.update(extra_fields)
+    model = queryset.model
+    for ordering in queryset.query.order_by or model._meta.ordering:
+        name = ordering.lstrip("-") if isinstance(ordering, str) else ""
+        if name and "__" not in name:
+            paths.add(model._meta.pk.name if name == "pk" else name)
+
+    queryset = queryset.select_related(None)
+    if related:
+        queryset = queryset.select_related(*related)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset.only(*paths)
+
+
+def _plan(model, info, object_type, field_nodes, prefix=""):
+    """
+    ``(paths, related, prefetches)`` for the selection on ``model``, or
+    ``None`` if a selected field's columns can't be determined.
+    """
+    graphene_type = getattr(object_type, "graphene_type", None)
+    sources = getattr(graphene_type, "field_sources", {})
+    paths = {f"{prefix}{model._meta.pk.name}"}
+    related = set()
+    selected = _selected(info, field_nodes)
+    # Reverse relations a field reads (a budget's categories, for its
+    # progress) are prefetched whole, even where they're selected too.
+    whole = {
+        path
+        for name in selected
+        for path in sources.get(to_snake_case(name), ())
+        if not _is_column(model, path)
+    }
+    selected_names = {to_snake_case(name) for name in selected}
+    prefetches = [
+        f"{prefix}{path}" for path in sorted(whole) if path not in selected_names
+    ]
+
+    for name, nodes in selected.items():
+        if name.startswith("__"):
+            continue
+        field_name = to_snake_case(name)
+        if field_name in sources:
+            for path in sources[field_name]:
+                if path in whole:
+                    continue
+                if "__" in path:
+                    related.add(f"{prefix}{path.split('__')[0]}")
+                paths.add(f"{prefix}{path}")
+            continue
+        try:
+            model_field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+
+        if not model_field.is_relation:
+            paths.add(f"{prefix}{field_name}")
+            continue
+
+        child_type = get_named_type(object_type.fields[name].type)
+        child_nodes = [node for node in nodes if node.selection_set is not None]
+        if model_field.concrete and not model_field.many_to_many:
+            path = f"{prefix}{field_name}"
+            related.add(path)
+            child = _plan(
+                model_field.related_model, info, child_type, child_nodes, f"{path}__"
+            )
+            if child is None:
+                # Joined whole; naming a column as well would defer the rest.
+                paths.add(path)
+                continue
+            child_paths, child_related, child_prefetches = child
+            paths |= child_paths
+            related |= child_related
+            prefetches += child_prefetches
+        else:
+            children = model_field.related_model._default_manager.all()
+            if field_name in whole:
+                # Every column, but still join what the selection reaches.
+                child = _plan(model_field.related_model, info, child_type, child_nodes)
+                if child is not None:
+                    _, child_related, child_prefetches = child
+                    if child_related:
+                        children = children.select_related(*child_related)
+                    children = children.prefetch_related(*child_prefetches)
+            else:
+                # Prefetching groups children by their foreign key.
+                extra = (model_field.field.name,) if model_field.one_to_many else ()
+                children = _project(children, info, child_type, child_nodes, extra)
+            prefetches.append(Prefetch(f"{prefix}{field_name}", queryset=children))
+
+    return paths, related, prefetches
+
+
+def _is_column(model, path):
+    return model._meta.get_field(path.split("__")[0]).concrete
+
+
+def _selected(info, field_nodes):
+    """The fields under ``field_nodes``, grouped by name across aliases."""
+    fields = {}
+    for node in field_nodes:
+        if node.selection_set is not None:
+            _collect(info, node.selection_set, fields, set())
+    return fields
+
+
+def _collect(info, selection_set, fields, visited):
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            fields.setdefault(selection.name.value, []).append(selection)
+        elif isinstance(selection, InlineFragmentNode):
+            _collect(info, selection.selection_set, fields, visited)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = info.fragments.get(name)
+            if fragment is not None and name not in visited:
+                visited.add(name)
+                _collect(info, fragment.selection_set, fields, visited)
@@ -6,6 +6,7 @@ from .transactions import TransactionQueries
 from .budgets import BudgetQueries
 from .goals import GoalQueries
 from .notifications import NotificationQueries
+from .dashboard import DashboardQueries
 
 __all__ = [
     "AuthQueries",
@@ -16,4 +17,5 @@ __all__ = [
     "BudgetQueries",
     "GoalQueries",
     "NotificationQueries",
+    "DashboardQueries",
 ]
@@ -1,25 +1,28 @@
 import graphene
 from apps.accounts.models import Account
-from ..types.accounts import AccountType
+from ..types.accounts import AccountType, AccountConnection
 from ..authentication import login_required
+from ..connections import KeysetConnectionField
+from ..projection import project
 
 
 class AccountQueries(graphene.ObjectType):
     account = graphene.Field(AccountType, id=graphene.UUID())
-    accounts = graphene.List(AccountType, is_active=graphene.Boolean())
+    accounts = KeysetConnectionField(AccountConnection, is_active=graphene.Boolean())
 
     @login_required
     def resolve_account(self, info, id):
         """Retrieve a specific account by ID (user must own it)."""
+        queryset = project(Account.objects.filter(user=info.context.user), info)
         try:
-            return Account.objects.get(pk=id, user=info.context.user)
+            return queryset.get(pk=id)
         except Account.DoesNotExist:
             return None
 
     @login_required
     def resolve_accounts(self, info, is_active=None):
-        """Retrieve all accounts for the authenticated user."""
+        """Retrieve a page of accounts for the authenticated user."""
         queryset = Account.objects.filter(user=info.context.user)
         if is_active is not None:
             queryset = queryset.filter(is_active=is_active)
-        return queryset
+        return project(queryset.order_by("-created_at"), info)
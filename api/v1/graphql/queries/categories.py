@@ -4,6 +4,8 @@ from django.db.models import Q
 from apps.categories.models import Category
 from ..types.categories import CategoryType
 from ..authentication import login_required
+from ..loaders import get_category_tree
+from ..projection import project
 
 
 class CategoryQueries(graphene.ObjectType):
@@ -17,7 +19,7 @@ class CategoryQueries(graphene.ObjectType):
     def resolve_category(self, info, id):
         """Retrieve a category by ID (system categories or user's own)."""
         try:
-            return Category.objects.get(
+            return project(Category.objects.all(), info).get(
                 Q(pk=id),
                 Q(is_system=True) | Q(user=info.context.user),
             )
@@ -26,10 +28,12 @@ class CategoryQueries(graphene.ObjectType):
 
     @login_required
     def resolve_categories(self, info, category_type=None):
-        """Retrieve all available categories (system + user's own)."""
-        queryset = Category.objects.filter(
-            Q(is_system=True) | Q(user=info.context.user)
-        ).filter(is_active=True)
+        """Retrieve all available categories (system + user's own), by name."""
+        categories = list(get_category_tree(info))
         if category_type:
-            queryset = queryset.filter(category_type=category_type)
-        return queryset
+            categories = [
+                category
+                for category in categories
+                if category.category_type == category_type
+            ]
+        return categories
@@ -0,0 +1,27 @@
+import graphene
+from graphene.utils.str_converters import to_snake_case
+from graphql.language import FieldNode
+
+from apps.analytics.dashboard import SECTIONS, build_dashboard
+from ..types.dashboard import DashboardType
+from ..authentication import login_required
+
+
+class DashboardQueries(graphene.ObjectType):
+    dashboard = graphene.Field(DashboardType)
+
+    @login_required
+    def resolve_dashboard(self, info):
+        """Build the dashboard sections the query selects, concurrently."""
+        return build_dashboard(info.context.user, _selected_sections(info))
+
+
+def _selected_sections(info):
+    """Section names selected on the field, or ``None`` if fragments hide them."""
+    sections = set()
+    for node in info.field_nodes:
+        for selection in node.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return None
+            sections.add(to_snake_case(selection.name.value))
+    return sections & set(SECTIONS)
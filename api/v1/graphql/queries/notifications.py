@@ -1,25 +1,30 @@
 import graphene
 from apps.notifications.models import Notification
-from ..types.notifications import NotificationType
+from ..types.notifications import NotificationType, NotificationConnection
 from ..authentication import login_required
+from ..connections import KeysetConnectionField
+from ..projection import project
 
 
 class NotificationQueries(graphene.ObjectType):
     notification = graphene.Field(NotificationType, id=graphene.UUID())
-    notifications = graphene.List(NotificationType, is_read=graphene.Boolean())
+    notifications = KeysetConnectionField(
+        NotificationConnection, is_read=graphene.Boolean()
+    )
 
     @login_required
     def resolve_notification(self, info, id):
         """Retrieve a specific notification by ID (user must own it)."""
+        queryset = project(Notification.objects.filter(user=info.context.user), info)
         try:
-            return Notification.objects.get(pk=id, user=info.context.user)
+            return queryset.get(pk=id)
         except Notification.DoesNotExist:
             return None
 
     @login_required
     def resolve_notifications(self, info, is_read=None):
-        """Retrieve all notifications for the authenticated user."""
+        """Retrieve a page of notifications for the authenticated user."""
         queryset = Notification.objects.filter(user=info.context.user)
         if is_read is not None:
             queryset = queryset.filter(is_read=is_read)
-        return queryset.order_by("-created_at")
+        return project(queryset.order_by("-created_at"), info)
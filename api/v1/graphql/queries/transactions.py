@@ -1,13 +1,15 @@
 import graphene
 from apps.transactions.models import Transaction
-from ..types.transactions import TransactionType
+from ..types.transactions import TransactionType, TransactionConnection
 from ..authentication import login_required
+from ..connections import KeysetConnectionField
+from ..projection import project
 
 
 class TransactionQueries(graphene.ObjectType):
     transaction = graphene.Field(TransactionType, id=graphene.UUID())
-    transactions = graphene.List(
-        TransactionType,
+    transactions = KeysetConnectionField(
+        TransactionConnection,
         transaction_type=graphene.String(),
         account_id=graphene.UUID(),
         category_id=graphene.UUID(),
@@ -16,8 +18,9 @@ class TransactionQueries(graphene.ObjectType):
     @login_required
     def resolve_transaction(self, info, id):
         """Retrieve a specific transaction by ID (user must own it)."""
+        queryset = project(Transaction.objects.filter(user=info.context.user), info)
         try:
-            return Transaction.objects.get(pk=id, user=info.context.user)
+            return queryset.get(pk=id)
         except Transaction.DoesNotExist:
             return None
 
@@ -25,7 +28,7 @@ class TransactionQueries(graphene.ObjectType):
     def resolve_transactions(
         self, info, transaction_type=None, account_id=None, category_id=None
     ):
-        """Retrieve all transactions for the authenticated user."""
+        """Retrieve a page of transactions for the authenticated user."""
         queryset = Transaction.objects.filter(user=info.context.user)
         if transaction_type:
             queryset = queryset.filter(transaction_type=transaction_type)
@@ -33,4 +36,4 @@ class TransactionQueries(graphene.ObjectType):
             queryset = queryset.filter(account_id=account_id)
         if category_id:
             queryset = queryset.filter(category_id=category_id)
-        return queryset.order_by("-date", "-created_at")
+        return project(queryset.order_by("-date", "-created_at"), info)
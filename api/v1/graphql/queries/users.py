@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 
 from ..types.users import UserType
 from ..authentication import login_required
+from ..projection import project
 
 User = get_user_model()
 
@@ -15,7 +16,7 @@ class UserQueries(graphene.ObjectType):
     def resolve_user(self, info, id):
         """Retrieve current authenticated user (only your own data)."""
         try:
-            return User.objects.get(pk=id)
+            return project(User.objects.all(), info).get(pk=id)
         except User.DoesNotExist:
             return None
 
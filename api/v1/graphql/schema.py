@@ -9,6 +9,7 @@ from .queries import (
     BudgetQueries,
     GoalQueries,
     NotificationQueries,
+    DashboardQueries,
 )
 from .mutations import (
     CreateAccount,
@@ -40,6 +41,7 @@ class Query(
     BudgetQueries,
     GoalQueries,
     NotificationQueries,
+    DashboardQueries,
     graphene.ObjectType,
 ):
     pass
@@ -1,18 +1,33 @@
 from .users import UserType
-from .accounts import AccountType
+from .accounts import AccountType, AccountConnection
 from .categories import CategoryType
-from .transactions import TransactionType
-from .budgets import BudgetType, BudgetCategoryType
-from .goals import GoalType
-from .notifications import NotificationType
+from .transactions import TransactionType, TransactionConnection
+from .budgets import (
+    BudgetType,
+    BudgetConnection,
+    BudgetCategoryType,
+    BudgetProgressType,
+    CategoryProgressType,
+)
+from .goals import GoalType, GoalConnection
+from .dashboard import DashboardType
+from .notifications import NotificationType, NotificationConnection
 
 __all__ = [
     "UserType",
     "AccountType",
+    "AccountConnection",
     "CategoryType",
     "TransactionType",
+    "TransactionConnection",
     "BudgetType",
+    "BudgetConnection",
     "BudgetCategoryType",
+    "BudgetProgressType",
+    "CategoryProgressType",
     "GoalType",
+    "GoalConnection",
+    "DashboardType",
     "NotificationType",
+    "NotificationConnection",
 ]
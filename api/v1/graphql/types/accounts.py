@@ -18,3 +18,8 @@ class AccountType(DjangoObjectType):
             "created_at",
             "updated_at",
         )
+
+
+class AccountConnection(graphene.relay.Connection):
+    class Meta:
+        node = AccountType
@@ -2,6 +2,8 @@ import graphene
 from graphene_django import DjangoObjectType
 
 from apps.budgets.models import Budget, BudgetCategory
+from apps.budgets.services import budget_progress
+from ..loaders import get_loaders
 
 
 class BudgetCategoryType(DjangoObjectType):
@@ -16,8 +18,39 @@ class BudgetCategoryType(DjangoObjectType):
             "updated_at",
         )
 
+    def resolve_category(self, info):
+        return get_loaders(info).load(self, "category")
+
+
+class CategoryProgressType(graphene.ObjectType):
+    budget_category = graphene.Field(BudgetCategoryType)
+    allocated_amount = graphene.Decimal()
+    spent = graphene.Decimal()
+    remaining = graphene.Decimal()
+    percentage_used = graphene.Float()
+
+
+class BudgetProgressType(graphene.ObjectType):
+    spent = graphene.Decimal()
+    remaining = graphene.Decimal()
+    percentage_used = graphene.Float()
+    categories = graphene.List(graphene.NonNull(CategoryProgressType))
+
 
 class BudgetType(DjangoObjectType):
+    progress = graphene.Field(BudgetProgressType)
+
+    field_sources = {
+        "progress": (
+            "user",
+            "currency",
+            "start_date",
+            "end_date",
+            "total_amount",
+            "categories",
+        )
+    }
+
     class Meta:
         model = Budget
         fields = (
@@ -28,6 +61,18 @@ class BudgetType(DjangoObjectType):
             "start_date",
             "end_date",
             "is_active",
+            "categories",
             "created_at",
             "updated_at",
         )
+
+    def resolve_categories(self, info):
+        return get_loaders(info).load(self, "categories")
+
+    def resolve_progress(self, info):
+        return get_loaders(info).compute(self, "progress", budget_progress)
+
+
+class BudgetConnection(graphene.relay.Connection):
+    class Meta:
+        node = BudgetType
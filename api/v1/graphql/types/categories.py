@@ -2,9 +2,15 @@ import graphene
 from graphene_django import DjangoObjectType
 
 from apps.categories.models import Category
+from ..loaders import get_category_tree, get_loaders
 
 
 class CategoryType(DjangoObjectType):
+    children = graphene.List(graphene.NonNull(lambda: CategoryType))
+
+    # Parents and children come from the category tree, not a join.
+    field_sources = {"parent": ("parent",), "children": ()}
+
     class Meta:
         model = Category
         fields = (
@@ -17,3 +23,15 @@ class CategoryType(DjangoObjectType):
             "created_at",
             "updated_at",
         )
+
+    def resolve_parent(self, info):
+        if self.parent_id is None:
+            return None
+        parent = get_category_tree(info).get(self.parent_id)
+        if parent is None:
+            # Inactive parents are not in the tree.
+            parent = get_loaders(info).load(self, "parent")
+        return parent
+
+    def resolve_children(self, info):
+        return get_category_tree(info).children(self)
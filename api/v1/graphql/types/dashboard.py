@@ -0,0 +1,54 @@
+import graphene
+
+from apps.budgets.models import Budget
+from apps.budgets.services import budget_progress
+from ..loaders import get_loaders
+from .accounts import AccountType
+from .budgets import BudgetType
+from .goals import GoalType
+from .notifications import NotificationType
+
+
+class CurrencyTotalType(graphene.ObjectType):
+    currency = graphene.String()
+    total = graphene.Float()
+
+
+class NetWorthType(graphene.ObjectType):
+    by_currency = graphene.List(graphene.NonNull(CurrencyTotalType))
+    accounts_count = graphene.Int()
+
+    def resolve_by_currency(self, info):
+        return [
+            CurrencyTotalType(currency=currency, total=total)
+            for currency, total in self["by_currency"].items()
+        ]
+
+
+class IncomeVsExpensesType(graphene.ObjectType):
+    income = graphene.Float()
+    expenses = graphene.Float()
+    net = graphene.Float()
+    savings_rate = graphene.Float()
+
+
+class NotificationSummaryType(graphene.ObjectType):
+    unread_count = graphene.Int()
+    latest = graphene.List(graphene.NonNull(NotificationType))
+
+
+class DashboardType(graphene.ObjectType):
+    """The home screen; only the sections a query selects are built."""
+
+    accounts = graphene.List(graphene.NonNull(AccountType))
+    net_worth = graphene.Field(NetWorthType)
+    income_vs_expenses = graphene.Field(IncomeVsExpensesType)
+    budgets = graphene.List(graphene.NonNull(BudgetType))
+    goals = graphene.List(graphene.NonNull(GoalType))
+    notifications = graphene.Field(NotificationSummaryType)
+
+    def resolve_budgets(self, info):
+        # The section already holds each budget's progress.
+        progress = {item.budget.pk: item for item in self["budgets"]}
+        get_loaders(info).prime(Budget, "progress", budget_progress, progress)
+        return [item.budget for item in self["budgets"]]
@@ -7,6 +7,9 @@ from apps.goals.models import Goal
 class GoalType(DjangoObjectType):
     progress_percentage = graphene.Float()
 
+    # Columns read by fields that aren't model fields (see ``projection``).
+    field_sources = {"progress_percentage": ("target_amount", "current_amount")}
+
     class Meta:
         model = Goal
         fields = (
@@ -26,3 +29,8 @@ class GoalType(DjangoObjectType):
         if self.target_amount > 0:
             return round((self.current_amount / self.target_amount) * 100, 2)
         return 0
+
+
+class GoalConnection(graphene.relay.Connection):
+    class Meta:
+        node = GoalType
@@ -15,3 +15,8 @@ class NotificationType(DjangoObjectType):
             "created_at",
             "updated_at",
         )
+
+
+class NotificationConnection(graphene.relay.Connection):
+    class Meta:
+        node = NotificationType
@@ -2,6 +2,7 @@ import graphene
 from graphene_django import DjangoObjectType
 
 from apps.transactions.models import Transaction
+from ..loaders import get_loaders
 
 
 class TransactionType(DjangoObjectType):
@@ -21,3 +22,14 @@ class TransactionType(DjangoObjectType):
             "created_at",
             "updated_at",
         )
+
+    def resolve_account(self, info):
+        return get_loaders(info).load(self, "account")
+
+    def resolve_category(self, info):
+        return get_loaders(info).load(self, "category")
+
+
+class TransactionConnection(graphene.relay.Connection):
+    class Meta:
+        node = TransactionType
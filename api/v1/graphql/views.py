@@ -8,10 +8,28 @@ endpoints.
 
 from typing import Dict, Any
 
-from django.http import JsonResponse
+from django.db import connection, transaction
+from django.http import HttpResponseBadRequest, HttpResponseNotAllowed, JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.utils.decorators import method_decorator
-from graphene_django.views import GraphQLView as BaseGraphQLView
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.utils.utils import set_rollback
+from graphene_django.views import GraphQLView as BaseGraphQLView, HttpError
+from graphql import (
+    ExecutionResult,
+    OperationType,
+    execute,
+    get_operation_ast,
+    specified_rules,
+)
+from graphql.type import validate_schema
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.core.encoding import dumps
+from apps.users.authentication import authenticate_jwt
+from .cost import QueryCostRule
+from .persisted import get_document, persisted_query_hash
 
 
 class SecureGraphQLView(BaseGraphQLView):
@@ -31,6 +49,15 @@ class SecureGraphQLView(BaseGraphQLView):
         """
         Override dispatch to enforce authentication before processing the request.
         """
+        # Bearer tokens resolve through the same cached JWT authentication as
+        # the REST API; without one, the session user (if any) stands.
+        try:
+            authenticated = authenticate_jwt(request)
+        except AuthenticationFailed:
+            authenticated = None
+        if authenticated is not None:
+            request.user, request.auth = authenticated
+
         # Check if user is authenticated
         if not request.user or not request.user.is_authenticated:
             # Check if this is a query request (not schema introspection from unauthenticated users)
@@ -62,11 +89,137 @@ class SecureGraphQLView(BaseGraphQLView):
         # This is the secure default approach
         return True
 
+    validation_rules = (*specified_rules, QueryCostRule)
+
+    def get_response(self, request, data, show_graphiql=False):
+        """
+        graphene-django's ``get_response``, plus the result's ``extensions``
+        (the operation's cost) in the response body.
+        """
+        query, variables, operation_name, id = self.get_graphql_params(request, data)
+
+        execution_result = self.execute_graphql_request(
+            request, data, query, variables, operation_name, show_graphiql
+        )
+
+        if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+            set_rollback()
+
+        status_code = 200
+        if not execution_result:
+            return None, status_code
+
+        response = {}
+        if execution_result.errors:
+            set_rollback()
+            response["errors"] = [self.format_error(e) for e in execution_result.errors]
+
+        if execution_result.errors and any(
+            not getattr(e, "path", None) for e in execution_result.errors
+        ):
+            status_code = 400
+        else:
+            response["data"] = execution_result.data
+
+        if execution_result.extensions:
+            response["extensions"] = execution_result.extensions
+
+        if self.batch:
+            response["id"] = id
+            response["status"] = status_code
+
+        return self.json_encode(request, response, pretty=show_graphiql), status_code
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        """
+        Execute with the document from the persisted-query cache.
+
+        Mirrors graphene-django's implementation, except that parsing and
+        validation go through ``persisted.get_document``, which skips both
+        for operations already seen.
+        """
+        sha256 = persisted_query_hash(request, data)
+        if not query and sha256 is None:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseBadRequest("Must provide query string."))
+
+        schema = self.schema.graphql_schema
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        rules = tuple(self.validation_rules) if self.validation_rules else None
+        document, errors = get_document(schema, query, sha256, rules)
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if (
+            request.method.lower() == "get"
+            and operation_ast is not None
+            and operation_ast.operation != OperationType.QUERY
+        ):
+            if show_graphiql:
+                return None
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    f"Can only perform a {operation_ast.operation.value} "
+                    "operation from a POST request.",
+                )
+            )
+
+        try:
+            execute_options = {
+                "root_value": self.get_root_value(request),
+                "context_value": self.get_context(request),
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                execute_options["execution_context_class"] = (
+                    self.execution_context_class
+                )
+
+            if (
+                operation_ast is not None
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(schema, document, **execute_options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+            else:
+                result = execute(schema, document, **execute_options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+        cost = getattr(operation_ast, "cost", None)
+        if cost is not None:
+            result.extensions = {
+                **(result.extensions or {}),
+                "cost": cost.as_extension(),
+            }
+        return result
+
     @staticmethod
     def get_context(request):
         """Ensure request context is properly set for GraphQL."""
         return request
 
+    def json_encode(self, request, d, pretty=False):
+        """Encode responses with the same fast encoder as the REST API."""
+        pretty = self.pretty or pretty or request.GET.get("pretty")
+        return dumps(d, indent=pretty, sort_keys=pretty).decode()
+
 
 class DevelopmentGraphQLView(SecureGraphQLView):
     """
@@ -0,0 +1,139 @@
+import hashlib
+import math
+from datetime import datetime, time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from apps.core.cache import (
+    get_data_version,
+    get_version,
+    version_timestamp,
+    versioned_cache_key,
+)
+
+
+def cache_by_data_version(view_method):
+    """
+    Cache a read-only action's response data per user and query string.
+
+    Keys embed the user's data version, which transaction, account and
+    budget writes bump (see ``apps.analytics.signals``), so stale entries
+    are simply never read again and no key scanning is needed. They embed
+    the local date too, since windowed actions such as "the last 30 days"
+    change at midnight without a write.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = versioned_cache_key(
+            request.user.pk,
+            f"{self.basename}:{view_method.__name__}",
+            [
+                *request.query_params.lists(),
+                ("localdate", [timezone.localdate().isoformat()]),
+            ],
+        )
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.ANALYTICS_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
+
+
+def conditional_by_data_version(view_method):
+    """
+    Answer conditional GETs from the user's data version, before any query.
+
+    The ETag digests the data version (plus ``conditional_version_keys`` on
+    the view), the date, the full path and the negotiated media type, and
+    Last-Modified is when the newest of those versions was issued. A
+    request whose ``If-None-Match`` or ``If-Modified-Since`` still matches
+    gets a 304 without the action running; other responses carry the ETag,
+    and Last-Modified once its second has passed. The date is part of the tag because windowed actions such as
+    "the last 30 days" change at midnight without a write.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        versions = [get_data_version(request.user.pk)]
+        versions.extend(
+            get_version(key) for key in getattr(self, "conditional_version_keys", ())
+        )
+        today = timezone.localdate()
+        etag = quote_etag(
+            hashlib.md5(
+                repr(
+                    (
+                        request.user.pk,
+                        versions,
+                        today,
+                        request.get_full_path(),
+                        request.accepted_media_type,
+                    )
+                ).encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+        )
+        last_modified = _last_modified(versions, today)
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        else:
+            response = not_modified
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_vary_headers(response, ["Authorization", "Accept"])
+        return response
+
+    return wrapper
+
+
+def _last_modified(versions, today):
+    timestamps = [version_timestamp(version) for version in versions]
+    if None in timestamps:
+        return None
+    midnight = timezone.make_aware(datetime.combine(today, time.min))
+    # HTTP dates have whole seconds: round up, so the date is never before
+    # the change, and leave it out until that second has passed, since a
+    # second write within it would carry the same date.
+    last_modified = math.ceil(max(*timestamps, midnight.timestamp()))
+    if last_modified > timezone.now().timestamp():
+        return None
+    return last_modified
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for a viewset's list and detail routes.
+
+    For viewsets whose data is covered by the user's data version (see
+    ``apps.analytics.signals``). Set ``conditional_version_keys`` for data
+    with its own version, such as the shared system categories.
+    """
+
+    conditional_version_keys = ()
+
+    @conditional_by_data_version
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_by_data_version
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
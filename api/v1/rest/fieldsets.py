@@ -0,0 +1,143 @@
+"""
+Sparse fieldsets for the REST API.
+
+``?fields=id,amount`` limits a read to the listed fields, and on list
+routes ``?expand=account`` adds the related objects a serializer only nests
+on request (its ``Meta.expandable_fields``). ``SparseFieldsetMixin`` also
+projects the queryset with ``.only()`` to the columns the chosen fields
+read, so a smaller payload is a narrower query as well.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Drops fields not selected by the ``fields`` and ``expand`` context keys.
+
+    ``Meta.expandable_fields`` maps an ``?expand=`` name to the field it
+    adds. With no ``expand`` in the context (writes, detail routes, use
+    outside a view) every field is rendered. Nested serializers always
+    render in full.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+
+        expand = self.context.get("expand")
+        if expand is not None:
+            expandable = getattr(self.Meta, "expandable_fields", {})
+            for name, field_name in expandable.items():
+                if name not in expand:
+                    fields.pop(field_name, None)
+
+        selected = self.context.get("fields")
+        if selected:
+            for field_name in list(fields):
+                if field_name not in selected:
+                    del fields[field_name]
+        return fields
+
+
+class SparseFieldsetMixin:
+    """
+    ViewSet support for ``?fields=`` and ``?expand=`` on reads.
+
+    List and detail querysets load only the columns the selected serializer
+    fields read, plus ``projection_fields`` (the owner, for object
+    permissions) and the ordering columns keyset pagination reads back.
+    Method fields declare their columns in the serializer's
+    ``Meta.field_sources``; without one the queryset is left unprojected.
+    """
+
+    projection_fields = ("user",)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        request = getattr(self, "request", None)
+        if request is not None and request.method == "GET":
+            context["fields"] = _query_list(request, "fields")
+            if self.action == "list":
+                context["expand"] = _query_list(request, "expand") or set()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in ("list", "retrieve"):
+            queryset = project(queryset, self.get_serializer(), self.projection_fields)
+        return queryset
+
+
+def project(queryset, serializer, extra_fields=()):
+    """
+    Restrict ``queryset`` to the columns ``serializer`` reads.
+
+    Related objects the serializer reads through are joined with
+    ``select_related`` (replacing the queryset's own joins, which would
+    otherwise clash with the deferred foreign keys); reverse relations are
+    left to the caller's prefetches. Returns ``queryset`` unchanged if a field's columns can't be
+    determined.
+    """
+    model = queryset.model
+    paths = {model._meta.pk.name}
+    related = set()
+    whole = set()
+    sources = getattr(serializer.Meta, "field_sources", {})
+
+    for field_name, field in serializer.fields.items():
+        if field_name in sources:
+            for path in sources[field_name]:
+                if "__" in path:
+                    related.add(path.split("__")[0])
+                paths.add(path)
+            continue
+        if field.source == "*" or isinstance(field, serializers.SerializerMethodField):
+            return queryset
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            return queryset
+        if not model_field.concrete:
+            continue
+        if len(field.source_attrs) > 1:
+            related.add(field.source_attrs[0])
+            paths.add("__".join(field.source_attrs))
+        else:
+            if isinstance(field, serializers.BaseSerializer):
+                related.add(field.source)
+                whole.add(field.source)
+            paths.add(field.source)
+
+    for name in extra_fields:
+        try:
+            model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        paths.add(name)
+    for ordering in queryset.query.order_by or model._meta.ordering:
+        name = ordering.lstrip("-") if isinstance(ordering, str) else ""
+        if name and "__" not in name:
+            paths.add(model._meta.pk.name if name == "pk" else name)
+
+    # A relation a nested serializer renders is loaded whole; naming one of
+    # its columns as well would defer the rest.
+    paths = {
+        path for path in paths if path.split("__")[0] not in whole or "__" not in path
+    }
+    queryset = queryset.select_related(None)
+    if related:
+        queryset = queryset.select_related(*related)
+    return queryset.only(*paths)
+
+
+def _query_list(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    return {item.strip() for item in value.split(",") if item.strip()}
@@ -1,6 +1,8 @@
 import django_filters
+from rest_framework import filters
 
 from apps.transactions.models import Transaction
+from apps.transactions.search import search_transactions
 from apps.accounts.models import Account
 from apps.budgets.models import Budget
 from apps.goals.models import Goal
@@ -23,6 +25,16 @@ class TransactionFilter(django_filters.FilterSet):
         ]
 
 
+class TransactionSearchFilter(filters.SearchFilter):
+    """``?search=`` backed by full-text and trigram indexes on PostgreSQL."""
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_transactions(queryset, terms)
+
+
 class AccountFilter(django_filters.FilterSet):
     class Meta:
         model = Account
@@ -0,0 +1,159 @@
+from collections import namedtuple
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.core import keyset
+
+KeysetCursor = namedtuple("KeysetCursor", ["position", "reverse"])
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (seek) pagination over a multi-column ordering.
+
+    DRF's CursorPagination only seeks on the first ordering field and falls
+    back to OFFSET for ties. This class seeks on the full ordering tuple,
+    taken from the view's ``ordering`` plus a primary key tie-breaker, so
+    every page is an index range scan and there is no COUNT(*) query.
+    Cursors are opaque, URL-safe tokens.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request, queryset.model)
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [keyset.invert(field) for field in ordering]
+        queryset = keyset.order_queryset(queryset, ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(
+                keyset.seek_filter(queryset.model, ordering, self.cursor.position)
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_more = len(results) > self.page_size
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        """The view's default ordering, made unique with a primary key tie-breaker."""
+        return keyset.unique_ordering(self.ordering or getattr(view, "ordering", None))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return self.encode_cursor(None)
+        return self.encode_cursor(
+            KeysetCursor(keyset.position_of(self.page[-1], self.ordering), False)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return self.encode_cursor(None)
+        return self.encode_cursor(
+            KeysetCursor(keyset.position_of(self.page[0], self.ordering), True)
+        )
+
+    def decode_cursor(self, request, model=None):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = keyset.decode_cursor(encoded)
+            position = keyset.parse_position(model, self.ordering, payload["p"])
+            reverse = bool(payload.get("r"))
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        return KeysetCursor(position, reverse)
+
+    def encode_cursor(self, cursor):
+        if cursor is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        payload = {"p": cursor.position}
+        if cursor.reverse:
+            payload["r"] = 1
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, keyset.encode_cursor(payload)
+        )
+
+
+class OptInKeysetPagination(PageNumberPagination):
+    """
+    Page-number pagination by default, keyset pagination on request.
+
+    Clients opt in with ``?pagination=cursor`` (or by following a link that
+    already carries a ``cursor``). Page-number responses are unchanged. In
+    cursor mode the view's default ordering always applies, since a keyset
+    is only valid for the ordering it was taken from.
+    """
+
+    mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.wants_keyset(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def wants_keyset(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.keyset is not None:
+            return self.keyset.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'cursor' for keyset pagination.",
+                "schema": {"type": "string", "enum": ["page", "cursor"]},
+            }
+        )
+        parameters.extend(self.keyset_class().get_schema_operation_parameters(view))
+        return parameters
@@ -0,0 +1,14 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from apps.core.encoding import JSONDecodeError, loads
+
+
+class FastJSONParser(JSONParser):
+    """``JSONParser`` on orjson; bodies must be UTF-8, as RFC 8259 requires."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return loads(stream.read())
+        except JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,25 @@
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.encoding import dumps
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` on the shared orjson encoder.
+
+    Output is compact UTF-8 unless the client asks for an indent, and raw
+    ``Decimal`` values (from aggregates, say) render as exact strings, the
+    same as ``DecimalField``.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        ret = dumps(data, indent=bool(indent))
+        # Like JSONRenderer, keep the output safe to embed in a <script>.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
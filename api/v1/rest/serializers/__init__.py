@@ -1,18 +1,29 @@
 from .accounts import AccountSerializer
-from .budgets import BudgetCategorySerializer, BudgetSerializer
+from .budgets import (
+    BudgetCategorySerializer,
+    BudgetProgressListSerializer,
+    BudgetProgressSerializer,
+    BudgetSerializer,
+)
 from .categories import CategorySerializer
+from .dashboard import DashboardSerializer
 from .goals import GoalSerializer
 from .notifications import NotificationSerializer
-from .transactions import TransactionSerializer
-from .users import UserSerializer
+from .transactions import TransactionImportSerializer, TransactionSerializer
+from .users import TokenRefreshSerializer, UserSerializer
 
 __all__ = [
     "AccountSerializer",
     "BudgetSerializer",
+    "BudgetProgressSerializer",
+    "BudgetProgressListSerializer",
     "BudgetCategorySerializer",
     "CategorySerializer",
+    "DashboardSerializer",
     "GoalSerializer",
     "NotificationSerializer",
+    "TransactionImportSerializer",
     "TransactionSerializer",
+    "TokenRefreshSerializer",
     "UserSerializer",
 ]
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from apps.accounts.models import Account
+from ..fieldsets import SparseFieldsetSerializerMixin
 
 
-class AccountSerializer(serializers.ModelSerializer):
+class AccountSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Account
         fields = [
@@ -1,9 +1,13 @@
 from rest_framework import serializers
 
 from apps.budgets.models import Budget, BudgetCategory
+from apps.budgets.services import budget_progress
+from ..fieldsets import SparseFieldsetSerializerMixin
 
 
-class BudgetCategorySerializer(serializers.ModelSerializer):
+class BudgetCategorySerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = BudgetCategory
         fields = [
@@ -17,8 +21,36 @@ class BudgetCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class BudgetSerializer(serializers.ModelSerializer):
+class CategoryProgressSerializer(serializers.Serializer):
+    id = serializers.UUIDField(source="budget_category.id")
+    category = serializers.UUIDField(source="budget_category.category_id")
+    allocated_amount = serializers.DecimalField(max_digits=15, decimal_places=2)
+    spent = serializers.DecimalField(max_digits=15, decimal_places=2)
+    remaining = serializers.DecimalField(max_digits=15, decimal_places=2)
+    percentage_used = serializers.DecimalField(max_digits=7, decimal_places=2)
+
+
+class BudgetProgressSerializer(serializers.Serializer):
+    spent = serializers.DecimalField(max_digits=15, decimal_places=2)
+    remaining = serializers.DecimalField(max_digits=15, decimal_places=2)
+    percentage_used = serializers.DecimalField(max_digits=7, decimal_places=2)
+    categories = CategoryProgressSerializer(many=True)
+
+
+class BudgetProgressListSerializer(BudgetProgressSerializer):
+    budget_id = serializers.UUIDField(source="budget.id")
+    name = serializers.CharField(source="budget.name")
+    total_amount = serializers.DecimalField(
+        source="budget.total_amount", max_digits=15, decimal_places=2
+    )
+    currency = serializers.CharField(source="budget.currency")
+    start_date = serializers.DateField(source="budget.start_date")
+    end_date = serializers.DateField(source="budget.end_date")
+
+
+class BudgetSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     categories = BudgetCategorySerializer(many=True, read_only=True)
+    progress = serializers.SerializerMethodField()
 
     class Meta:
         model = Budget
@@ -31,10 +63,25 @@ class BudgetSerializer(serializers.ModelSerializer):
             "end_date",
             "is_active",
             "categories",
+            "progress",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        field_sources = {
+            "progress": ("user", "currency", "start_date", "end_date", "total_amount")
+        }
+
+    def get_progress(self, obj):
+        """Progress for every budget on the page, computed on the first row."""
+        progress = self.context.get("budget_progress")
+        if progress is None or obj.pk not in progress:
+            budgets = [obj]
+            if isinstance(self.parent, serializers.ListSerializer):
+                budgets = list(self.parent.instance)
+            progress = budget_progress(budgets)
+            self.context["budget_progress"] = progress
+        return BudgetProgressSerializer(progress[obj.pk]).data
 
     def create(self, validated_data):
         validated_data["user"] = self.context["request"].user
@@ -1,9 +1,26 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
+from apps.categories.cache import get_system_category
 from apps.categories.models import Category
+from apps.categories.tree import CategoryTree
+from ..fieldsets import SparseFieldsetSerializerMixin
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategoryRelatedField(serializers.PrimaryKeyRelatedField):
+    """A category primary key, resolved from cache for system categories."""
+
+    def to_internal_value(self, data):
+        try:
+            category = get_system_category(Category._meta.pk.to_python(data))
+        except DjangoValidationError:
+            category = None
+        if category is not None:
+            return category
+        return super().to_internal_value(data)
+
+
+class CategorySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     children = serializers.SerializerMethodField()
 
     class Meta:
@@ -20,12 +37,24 @@ class CategorySerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "is_system", "created_at", "updated_at"]
+        # Children come from the category tree, not the row.
+        field_sources = {"children": ()}
 
     def get_children(self, obj):
-        if obj.children.exists():
-            return CategorySerializer(obj.children.all(), many=True).data
+        children = self.get_category_tree(obj).children(obj)
+        if children:
+            return CategorySerializer(children, many=True, context=self.context).data
         return []
 
+    def get_category_tree(self, obj):
+        """One tree per serialization, shared by every row and nesting level."""
+        tree = self.context.get("category_tree")
+        if tree is None:
+            request = self.context.get("request")
+            tree = CategoryTree.for_user(request.user if request else obj.user)
+            self.context["category_tree"] = tree
+        return tree
+
     def create(self, validated_data):
         validated_data["user"] = self.context["request"].user
         return super().create(validated_data)
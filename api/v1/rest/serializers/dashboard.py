@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from .accounts import AccountSerializer
+from .budgets import BudgetProgressListSerializer
+from .goals import GoalSerializer
+from .notifications import NotificationSerializer
+
+
+class NotificationSummarySerializer(serializers.Serializer):
+    unread_count = serializers.IntegerField()
+    latest = NotificationSerializer(many=True)
+
+
+class DashboardSerializer(serializers.Serializer):
+    """Renders ``build_dashboard`` output; sections not built are omitted."""
+
+    accounts = AccountSerializer(many=True, required=False)
+    net_worth = serializers.DictField(required=False)
+    income_vs_expenses = serializers.DictField(required=False)
+    budgets = BudgetProgressListSerializer(many=True, required=False)
+    goals = GoalSerializer(many=True, required=False)
+    notifications = NotificationSummarySerializer(required=False)
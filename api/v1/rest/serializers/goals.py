@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from apps.goals.models import Goal
+from ..fieldsets import SparseFieldsetSerializerMixin
 
 
-class GoalSerializer(serializers.ModelSerializer):
+class GoalSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     progress_percentage = serializers.SerializerMethodField()
 
     class Meta:
@@ -22,6 +23,7 @@ class GoalSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        field_sources = {"progress_percentage": ("target_amount", "current_amount")}
 
     def get_progress_percentage(self, obj):
         if obj.target_amount > 0:
@@ -1,9 +1,12 @@
 from rest_framework import serializers
 
 from apps.notifications.models import Notification
+from ..fieldsets import SparseFieldsetSerializerMixin
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Notification
         fields = [
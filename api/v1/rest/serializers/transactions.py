@@ -1,12 +1,28 @@
 from rest_framework import serializers
 
+from apps.accounts.models import Account
+from apps.categories.models import Category
 from apps.transactions.models import Transaction
+from apps.transactions.services import create_transaction, update_transaction
+from ..fieldsets import SparseFieldsetSerializerMixin
 from .accounts import AccountSerializer
-from .categories import CategorySerializer
+from .categories import CategoryRelatedField, CategorySerializer
 
 
-class TransactionSerializer(serializers.ModelSerializer):
+class TransactionSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """
+    Lists show the account and category by id and name; ``?expand=account``
+    and ``?expand=category`` nest the full objects, as detail routes do.
+    """
+
+    account_name = serializers.CharField(source="account.name", read_only=True)
     account_detail = AccountSerializer(source="account", read_only=True)
+    category = CategoryRelatedField(
+        queryset=Category.objects.all(), allow_null=True, required=False
+    )
+    category_name = serializers.CharField(
+        source="category.name", read_only=True, allow_null=True
+    )
     category_detail = CategorySerializer(source="category", read_only=True)
 
     class Meta:
@@ -14,8 +30,10 @@ class TransactionSerializer(serializers.ModelSerializer):
         fields = [
             "id",
             "account",
+            "account_name",
             "account_detail",
             "category",
+            "category_name",
             "category_detail",
             "amount",
             "currency",
@@ -28,6 +46,7 @@ class TransactionSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        expandable_fields = {"account": "account_detail", "category": "category_detail"}
 
     def validate_account(self, value):
         user = self.context["request"].user
@@ -38,10 +57,28 @@ class TransactionSerializer(serializers.ModelSerializer):
     def validate_category(self, value):
         if value and not value.is_system:
             user = self.context["request"].user
-            if value.user != user:
+            if value.user_id != user.pk:
                 raise serializers.ValidationError("Category does not belong to you")
         return value
 
     def create(self, validated_data):
         validated_data["user"] = self.context["request"].user
-        return super().create(validated_data)
+        return create_transaction(**validated_data)
+
+    def update(self, instance, validated_data):
+        return update_transaction(instance, **validated_data)
+
+
+class TransactionImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    account = serializers.PrimaryKeyRelatedField(
+        queryset=Account.objects.all(), required=False
+    )
+    batch_size = serializers.IntegerField(min_value=1, max_value=10000, required=False)
+    background = serializers.BooleanField(default=False)
+
+    def validate_account(self, value):
+        user = self.context["request"].user
+        if value.user != user:
+            raise serializers.ValidationError("Account does not belong to you")
+        return value
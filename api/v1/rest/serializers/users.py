@@ -1,10 +1,14 @@
+from dj_rest_auth.jwt_auth import CookieTokenRefreshSerializer
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from apps.users.tokens import RefreshToken
+from ..fieldsets import SparseFieldsetSerializerMixin
+
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
@@ -37,3 +41,9 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "language",
         ]
         read_only_fields = ["id", "email"]
+
+
+class TokenRefreshSerializer(CookieTokenRefreshSerializer):
+    """dj-rest-auth's refresh, with the filter-backed blacklist check."""
+
+    token_class = RefreshToken
@@ -11,6 +11,7 @@ from .views import (
     GoalViewSet,
     NotificationViewSet,
     AnalyticsViewSet,
+    DashboardViewSet,
 )
 
 router = DefaultRouter()
@@ -23,6 +24,7 @@ router.register(r"budget-categories", BudgetCategoryViewSet, basename="budget-ca
 router.register(r"goals", GoalViewSet, basename="goal")
 router.register(r"notifications", NotificationViewSet, basename="notification")
 router.register(r"analytics", AnalyticsViewSet, basename="analytics")
+router.register(r"dashboard", DashboardViewSet, basename="dashboard")
 
 urlpatterns = [
     path("", include(router.urls)),
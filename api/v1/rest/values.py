@@ -0,0 +1,191 @@
+"""
+Serializer-free list rendering.
+
+A list page rendered by a ``ModelSerializer`` builds a model instance per
+row, then walks every serializer field through ``get_attribute`` and
+``to_representation``. For flat, read-only listings that is most of the
+response time. ``ValuesListMixin`` answers those lists from
+``values_list()`` rows instead: the serializer's fields are compiled once
+per request into ``(name, column, converter)`` steps, and each row becomes a
+dict by running the steps over a tuple. Each converter is the field's own
+``to_representation``, or nothing where that would return the database
+value unchanged, so the rendered bytes match the serializer path.
+"""
+
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from apps.core import keyset
+
+# Fields whose to_representation returns database values unchanged.
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class RowPlan:
+    """
+    A serializer's readable fields compiled against ``values_list()`` rows.
+
+    ``columns`` are the lookups to select; ``to_dict`` turns one row into
+    the dict the serializer would have produced. Method fields are called
+    with a namespace of the columns named in ``Meta.field_sources``.
+    """
+
+    def __init__(self, columns, steps):
+        self.columns = columns
+        self.steps = steps
+
+    def to_dict(self, row):
+        data = {}
+        for name, index, convert in self.steps:
+            if index is None:
+                data[name] = convert(row)
+                continue
+            value = row[index]
+            if value is None or convert is None:
+                data[name] = value
+            else:
+                data[name] = convert(value)
+        return data
+
+    def to_list(self, rows):
+        return [self.to_dict(row) for row in rows]
+
+
+def compile_rows(serializer):
+    """
+    Compile ``serializer``'s fields to a ``RowPlan``.
+
+    Returns ``None`` if a field can't be read from columns: nested
+    serializers, ``source="*"`` fields, properties, reverse relations and
+    method fields without ``Meta.field_sources``.
+    """
+    model = serializer.Meta.model
+    sources = getattr(serializer.Meta, "field_sources", {})
+    columns = []
+    steps = []
+
+    def column(lookup):
+        if lookup not in columns:
+            columns.append(lookup)
+        return columns.index(lookup)
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField):
+            if name not in sources:
+                return None
+            paths = (model._meta.pk.name, *sources[name])
+            if any("__" in path for path in paths):
+                return None
+            method = getattr(serializer, field.method_name)
+            fields = [(path, column(path)) for path in paths]
+            fields.append(("pk", fields[0][1]))
+            steps.append((name, None, _method_converter(method, fields)))
+            continue
+        if isinstance(field, serializers.BaseSerializer) or field.source == "*":
+            return None
+        if not _is_column(model, field.source_attrs):
+            return None
+        steps.append((name, column("__".join(field.source_attrs)), _converter(field)))
+    return RowPlan(columns, steps)
+
+
+class ValuesListMixin:
+    """
+    Render list GETs from ``values_list()`` rows instead of serializers.
+
+    Falls back to the serializer when the selected fields can't be compiled
+    (an ``?expand=`` nesting a related object, for example). Filtering,
+    ordering and pagination are unchanged; keyset pagination reads its
+    cursor columns from the same rows.
+
+    Off unless a view sets ``values_list_enabled = True``. Only opt in once
+    the serializer's output is checked to be plain field mappings (methods
+    declaring their ``field_sources``), with a parity test against the
+    serializer path; overridden ``to_representation`` and other hooks are
+    not run here.
+    """
+
+    values_list_enabled = False
+
+    def list(self, request, *args, **kwargs):
+        plan = compile_rows(self.get_serializer()) if self.values_list_enabled else None
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Named rows also carry the columns keyset cursors are built from.
+        ordering = keyset.field_names(keyset.unique_ordering(self.ordering))
+        extra = [name for name in ordering if name not in plan.columns]
+        rows = queryset.values_list(*plan.columns, *extra, named=True)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(plan.to_list(page))
+        return Response(plan.to_list(rows))
+
+
+def _is_column(model, attrs):
+    """Whether ``attrs`` walks forward relations to a concrete field."""
+    for index, attr in enumerate(attrs):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return False
+        if not field.concrete:
+            return False
+        if index < len(attrs) - 1:
+            if not field.is_relation or field.many_to_many:
+                return False
+            model = field.related_model
+    return True
+
+
+def _converter(field):
+    if isinstance(field, serializers.UUIDField):
+        return str if field.uuid_format == "hex_verbose" else field.to_representation
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field:
+        return field.pk_field.to_representation
+    if isinstance(field, serializers.ChoiceField):
+        # Unknown stored values pass through; known ones map to their key.
+        lookup = field.choice_strings_to_values
+        return lambda value: lookup.get(str(value), value) if value != "" else value
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return None
+    return field.to_representation
+
+
+def _datetime_converter(field):
+    """``DateTimeField.to_representation`` with the timezone looked up once."""
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or tz is None:
+        return field.to_representation
+
+    def convert(value):
+        if timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(tz).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return convert
+
+
+def _method_converter(method, fields):
+    def convert(row):
+        return method(SimpleNamespace(**{name: row[index] for name, index in fields}))
+
+    return convert
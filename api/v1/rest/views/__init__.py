@@ -4,8 +4,9 @@ from .categories import CategoryViewSet
 from .goals import GoalViewSet
 from .notifications import NotificationViewSet
 from .transactions import TransactionViewSet
-from .users import UserViewSet
+from .users import TokenRefreshView, UserViewSet
 from .analytics import AnalyticsViewSet
+from .dashboard import DashboardViewSet
 
 __all__ = [
     "AccountViewSet",
@@ -15,6 +16,8 @@ __all__ = [
     "GoalViewSet",
     "NotificationViewSet",
     "TransactionViewSet",
+    "TokenRefreshView",
     "UserViewSet",
     "AnalyticsViewSet",
+    "DashboardViewSet",
 ]
@@ -2,17 +2,23 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 
 from apps.accounts.models import Account
+from ..caching import ConditionalGetMixin
+from ..fieldsets import SparseFieldsetMixin
 from ..serializers.accounts import AccountSerializer
 from ..permissions import IsOwner
 from ..filters import AccountFilter
+from ..values import ValuesListMixin
 
 
-class AccountViewSet(viewsets.ModelViewSet):
+class AccountViewSet(
+    ConditionalGetMixin, ValuesListMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for managing user accounts.
     """
 
     serializer_class = AccountSerializer
+    values_list_enabled = True
     permission_classes = [IsAuthenticated, IsOwner]
     filterset_class = AccountFilter
     search_fields = ["name", "institution"]
@@ -1,161 +1,137 @@
 from datetime import timedelta
-from django.db.models import Sum, Count
-from django.db.models.functions import TruncDate, TruncMonth
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from apps.transactions.models import Transaction
-from apps.accounts.models import Account
+from apps.analytics.models import FinancialSnapshot
+from apps.analytics import services
+from ..caching import cache_by_data_version, conditional_by_data_version
 
 
 class AnalyticsViewSet(viewsets.ViewSet):
     """
     ViewSet for analytics and insights.
+
+    Transaction-based actions read the daily ``FinancialSnapshot`` rollup,
+    so their cost grows with the number of days in the window rather than
+    the number of transactions. ``?currency=`` narrows any of them to one
+    currency. Responses are cached per user until their data changes.
     """
 
     permission_classes = [IsAuthenticated]
 
+    def _snapshots(self, request, start_date):
+        queryset = FinancialSnapshot.objects.filter(
+            user=request.user, created_for_date__gte=start_date
+        )
+        currency = request.query_params.get("currency")
+        if currency:
+            queryset = queryset.filter(currency=currency)
+        return queryset
+
     @action(detail=False, methods=["get"])
+    @conditional_by_data_version
+    @cache_by_data_version
     def spending_trends(self, request):
         """
         Get spending trends over time (last 30 days by default).
         """
         days = int(request.query_params.get("days", 30))
-        start_date = timezone.now().date() - timedelta(days=days)
+        start_date = timezone.localdate() - timedelta(days=days)
 
-        transactions = (
-            Transaction.objects.filter(
-                user=request.user,
-                transaction_type="expense",
-                date__gte=start_date,
-            )
-            .annotate(day=TruncDate("date"))
-            .values("day")
-            .annotate(total=Sum("amount"), count=Count("id"))
+        trends = (
+            self._snapshots(request, start_date)
+            .values(day=F("created_for_date"))
+            .annotate(total=Sum("total_expense"), count=Sum("expense_count"))
+            .filter(count__gt=0)
             .order_by("day")
         )
 
-        return Response(list(transactions))
+        return Response(list(trends))
 
     @action(detail=False, methods=["get"])
+    @conditional_by_data_version
+    @cache_by_data_version
     def category_breakdown(self, request):
         """
         Get spending breakdown by category.
         """
         days = int(request.query_params.get("days", 30))
-        start_date = timezone.now().date() - timedelta(days=days)
+        start_date = timezone.localdate() - timedelta(days=days)
 
-        transactions = (
-            Transaction.objects.filter(
-                user=request.user,
-                transaction_type="expense",
-                date__gte=start_date,
-            )
+        breakdown = (
+            self._snapshots(request, start_date)
             .values("category__name")
-            .annotate(total=Sum("amount"), count=Count("id"))
+            .annotate(total=Sum("total_expense"), count=Sum("expense_count"))
+            .filter(count__gt=0)
             .order_by("-total")
         )
 
-        return Response(list(transactions))
+        return Response(list(breakdown))
 
     @action(detail=False, methods=["get"])
+    @conditional_by_data_version
+    @cache_by_data_version
     def income_vs_expenses(self, request):
         """
         Get income vs expenses comparison.
         """
         days = int(request.query_params.get("days", 30))
-        start_date = timezone.now().date() - timedelta(days=days)
-
-        income = (
-            Transaction.objects.filter(
-                user=request.user,
-                transaction_type="income",
-                date__gte=start_date,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
-
-        expenses = (
-            Transaction.objects.filter(
-                user=request.user,
-                transaction_type="expense",
-                date__gte=start_date,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
+        start_date = timezone.localdate() - timedelta(days=days)
 
         return Response(
-            {
-                "income": income,
-                "expenses": expenses,
-                "net": income - expenses,
-                "savings_rate": (
-                    round(((income - expenses) / income) * 100, 2) if income > 0 else 0
-                ),
-            }
+            services.income_vs_expenses(
+                request.user, start_date, request.query_params.get("currency")
+            )
         )
 
     @action(detail=False, methods=["get"])
+    @conditional_by_data_version
+    @cache_by_data_version
     def net_worth(self, request):
         """
         Calculate net worth based on all account balances.
         """
-        accounts = Account.objects.filter(user=request.user, is_active=True)
-
-        total_by_currency = {}
-        for account in accounts:
-            currency = account.currency
-            if currency not in total_by_currency:
-                total_by_currency[currency] = 0
-            total_by_currency[currency] += float(account.balance)
-
-        return Response(
-            {
-                "by_currency": total_by_currency,
-                "accounts_count": accounts.count(),
-            }
-        )
+        return Response(services.net_worth(request.user))
 
     @action(detail=False, methods=["get"])
+    @conditional_by_data_version
+    @cache_by_data_version
     def monthly_summary(self, request):
         """
         Get monthly summary for the last 6 months.
         """
         months = int(request.query_params.get("months", 6))
-        start_date = timezone.now().date() - timedelta(days=months * 30)
-
-        transactions = (
-            Transaction.objects.filter(
-                user=request.user,
-                date__gte=start_date,
+        start_date = timezone.localdate() - timedelta(days=months * 30)
+
+        totals = (
+            self._snapshots(request, start_date)
+            .annotate(month=TruncMonth("created_for_date"))
+            .values("month")
+            .annotate(
+                income=Sum("total_income"),
+                expenses=Sum("total_expense"),
+                count=Sum("income_count") + Sum("expense_count"),
             )
-            .annotate(month=TruncMonth("date"))
-            .values("month", "transaction_type")
-            .annotate(total=Sum("amount"))
-            .order_by("month", "transaction_type")
+            .filter(count__gt=0)
+            .order_by("month")
         )
 
-        # Organize by month
-        monthly_data = {}
-        for tx in transactions:
-            month_key = tx["month"].strftime("%Y-%m")
-            if month_key not in monthly_data:
-                monthly_data[month_key] = {
-                    "month": month_key,
-                    "income": 0,
-                    "expenses": 0,
+        monthly_data = []
+        for row in totals:
+            income = float(row["income"])
+            expenses = float(row["expenses"])
+            monthly_data.append(
+                {
+                    "month": row["month"].strftime("%Y-%m"),
+                    "income": income,
+                    "expenses": expenses,
+                    "net": income - expenses,
                 }
+            )
 
-            if tx["transaction_type"] == "income":
-                monthly_data[month_key]["income"] = float(tx["total"])
-            else:
-                monthly_data[month_key]["expenses"] = float(tx["total"])
-
-        # Calculate net for each month
-        for month_data in monthly_data.values():
-            month_data["net"] = month_data["income"] - month_data["expenses"]
-
-        return Response(list(monthly_data.values()))
+        return Response(monthly_data)
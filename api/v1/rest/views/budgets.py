@@ -1,17 +1,26 @@
-from django.db.models import Sum
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from apps.budgets.models import Budget, BudgetCategory
-from apps.transactions.models import Transaction
-from ..serializers.budgets import BudgetSerializer, BudgetCategorySerializer
+from apps.budgets.services import budget_progress
+from ..fieldsets import SparseFieldsetMixin
+from ..caching import (
+    ConditionalGetMixin,
+    cache_by_data_version,
+    conditional_by_data_version,
+)
+from ..serializers.budgets import (
+    BudgetCategorySerializer,
+    BudgetProgressListSerializer,
+    BudgetSerializer,
+)
 from ..permissions import IsOwner
 from ..filters import BudgetFilter
 
 
-class BudgetViewSet(viewsets.ModelViewSet):
+class BudgetViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing budgets.
     """
@@ -28,41 +37,41 @@ class BudgetViewSet(viewsets.ModelViewSet):
             "categories__category"
         )
 
+    @action(detail=False, methods=["get"])
+    @conditional_by_data_version
+    @cache_by_data_version
+    def progress(self, request):
+        """
+        Get spending progress for every active budget and its categories.
+        """
+        budgets = self.filter_queryset(self.get_queryset()).filter(is_active=True)
+        progress = budget_progress(budgets)
+        serializer = BudgetProgressListSerializer(progress.values(), many=True)
+        return Response(serializer.data)
+
     @action(detail=True, methods=["get"])
     def summary(self, request, pk=None):
         """
         Get budget summary with spending progress.
         """
         budget = self.get_object()
-
-        # Calculate total spent within budget period
-        spent = (
-            Transaction.objects.filter(
-                user=request.user,
-                transaction_type="expense",
-                date__gte=budget.start_date,
-                date__lte=budget.end_date,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
+        progress = budget_progress([budget])[budget.pk]
 
         return Response(
             {
                 "budget_id": budget.id,
                 "name": budget.name,
                 "total_amount": budget.total_amount,
-                "spent": spent,
-                "remaining": budget.total_amount - spent,
-                "percentage_used": (
-                    round((spent / budget.total_amount) * 100, 2)
-                    if budget.total_amount > 0
-                    else 0
-                ),
+                "spent": progress.spent,
+                "remaining": progress.remaining,
+                "percentage_used": progress.percentage_used,
             }
         )
 
 
-class BudgetCategoryViewSet(viewsets.ModelViewSet):
+class BudgetCategoryViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for managing budget categories.
     """
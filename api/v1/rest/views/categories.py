@@ -2,12 +2,15 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
 
+from apps.categories.cache import SYSTEM_CATEGORIES_VERSION_KEY
 from apps.categories.models import Category
+from ..caching import ConditionalGetMixin
+from ..fieldsets import SparseFieldsetMixin
 from ..serializers.categories import CategorySerializer
 from ..permissions import IsOwner
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing categories.
     Returns system categories and user's custom categories.
@@ -18,6 +21,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
     search_fields = ["name"]
     ordering_fields = ["name", "created_at"]
     ordering = ["name"]
+    conditional_version_keys = (SYSTEM_CATEGORIES_VERSION_KEY,)
 
     def get_queryset(self):
         # Return system categories and user's own categories
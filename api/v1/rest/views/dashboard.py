@@ -0,0 +1,32 @@
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+
+from apps.analytics.dashboard import SECTIONS, build_dashboard
+from ..serializers.dashboard import DashboardSerializer
+
+
+class DashboardViewSet(viewsets.ViewSet):
+    """
+    The home screen in one request.
+
+    Returns accounts, net worth, income vs expenses, active budget progress,
+    open goals and unread notifications. ``?sections=accounts,goals``
+    limits the response to the listed sections.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request):
+        sections = None
+        if request.query_params.get("sections"):
+            sections = request.query_params["sections"].split(",")
+            unknown = sorted(set(sections) - set(SECTIONS))
+            if unknown:
+                return Response(
+                    {"sections": [f"Unknown sections: {', '.join(unknown)}"]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        dashboard = build_dashboard(request.user, sections)
+        return Response(DashboardSerializer(dashboard).data)
@@ -2,17 +2,23 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 
 from apps.goals.models import Goal
+from ..caching import ConditionalGetMixin
+from ..fieldsets import SparseFieldsetMixin
 from ..serializers.goals import GoalSerializer
 from ..permissions import IsOwner
 from ..filters import GoalFilter
+from ..values import ValuesListMixin
 
 
-class GoalViewSet(viewsets.ModelViewSet):
+class GoalViewSet(
+    ConditionalGetMixin, ValuesListMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for managing financial goals.
     """
 
     serializer_class = GoalSerializer
+    values_list_enabled = True
     permission_classes = [IsAuthenticated, IsOwner]
     filterset_class = GoalFilter
     search_fields = ["name"]
@@ -4,16 +4,19 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from apps.notifications.models import Notification
+from ..fieldsets import SparseFieldsetMixin
 from ..serializers.notifications import NotificationSerializer
 from ..permissions import IsOwner
+from ..values import ValuesListMixin
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(ValuesListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing notifications.
     """
 
     serializer_class = NotificationSerializer
+    values_list_enabled = True
     permission_classes = [IsAuthenticated, IsOwner]
     ordering_fields = ["created_at", "is_read"]
     ordering = ["-created_at"]
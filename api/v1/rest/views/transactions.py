@@ -1,32 +1,66 @@
+from decimal import Decimal
+from uuid import uuid4
+
+from django.core.files.storage import default_storage
 from django.db.models import Sum, Q
-from rest_framework import viewsets, status
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import filters, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from apps.transactions.exports import EXPORT_FORMATS
+from apps.transactions.imports import StatementError, StatementImporter
 from apps.transactions.models import Transaction
-from ..serializers.transactions import TransactionSerializer
+from apps.transactions.services import delete_transaction
+from apps.transactions.tasks import import_statement
+from ..fieldsets import SparseFieldsetMixin
+from ..serializers.transactions import (
+    TransactionImportSerializer,
+    TransactionSerializer,
+)
 from ..permissions import IsOwner
-from ..filters import TransactionFilter
+from ..filters import TransactionFilter, TransactionSearchFilter
+from ..pagination import OptInKeysetPagination
+from ..values import ValuesListMixin
 
 
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(ValuesListMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing transactions.
+
+    Supports keyset pagination on (date, created_at, id) with
+    ``?pagination=cursor`` for constant-cost deep paging. ``?search=``
+    uses the full-text and trigram indexes on PostgreSQL.
     """
 
     serializer_class = TransactionSerializer
+    values_list_enabled = True
     permission_classes = [IsAuthenticated, IsOwner]
+    filter_backends = [
+        DjangoFilterBackend,
+        filters.OrderingFilter,
+        TransactionSearchFilter,
+    ]
     filterset_class = TransactionFilter
     search_fields = ["description", "notes"]
     ordering_fields = ["date", "amount", "created_at"]
     ordering = ["-date", "-created_at"]
+    pagination_class = OptInKeysetPagination
 
     def get_queryset(self):
-        return Transaction.objects.filter(user=self.request.user).select_related(
-            "account", "category"
+        return (
+            Transaction.objects.filter(user=self.request.user)
+            .select_related("account", "category")
+            .defer("search_vector")
         )
 
+    def perform_destroy(self, instance):
+        delete_transaction(instance)
+
     @action(detail=False, methods=["get"])
     def summary(self, request):
         """
@@ -34,18 +68,12 @@ class TransactionViewSet(viewsets.ModelViewSet):
         """
         queryset = self.filter_queryset(self.get_queryset())
 
-        income = (
-            queryset.filter(transaction_type="income").aggregate(total=Sum("amount"))[
-                "total"
-            ]
-            or 0
-        )
-        expenses = (
-            queryset.filter(transaction_type="expense").aggregate(total=Sum("amount"))[
-                "total"
-            ]
-            or 0
-        )
+        income = queryset.filter(transaction_type="income").aggregate(
+            total=Sum("amount")
+        )["total"] or Decimal("0")
+        expenses = queryset.filter(transaction_type="expense").aggregate(
+            total=Sum("amount")
+        )["total"] or Decimal("0")
 
         return Response(
             {
@@ -55,6 +83,81 @@ class TransactionViewSet(viewsets.ModelViewSet):
             }
         )
 
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Stream the user's transactions as CSV or NDJSON.
+
+        Honours the same filters as the list endpoint. Use
+        ``?file_format=ndjson`` for newline-delimited JSON (default: csv).
+        """
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {"file_format": [f"Choose one of: {', '.join(EXPORT_FORMATS)}"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        content_type, generate = EXPORT_FORMATS[file_format]
+
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(generate(queryset), content_type=content_type)
+        filename = f"transactions-{timezone.now():%Y%m%d}.{file_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+        serializer_class=TransactionImportSerializer,
+    )
+    def import_statement(self, request):
+        """
+        Import transactions from a CSV bank or mobile money statement.
+
+        Expects a multipart ``file``, plus an optional ``account`` used for
+        rows without an account column and an optional ``batch_size``.
+        Invalid rows are skipped and reported with their line numbers.
+
+        With ``background`` set, the file is queued for a worker and the
+        response is 202; the user is notified when the import finishes.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if serializer.validated_data["background"]:
+            account = serializer.validated_data.get("account")
+            path = default_storage.save(
+                f"imports/{uuid4().hex}.csv", serializer.validated_data["file"]
+            )
+            import_statement.delay(
+                request.user.pk,
+                path,
+                account_id=account.pk if account else None,
+                batch_size=serializer.validated_data.get("batch_size"),
+            )
+            return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
+
+        importer = StatementImporter(
+            request.user,
+            account=serializer.validated_data.get("account"),
+            batch_size=serializer.validated_data.get("batch_size"),
+        )
+        try:
+            result = importer.run(serializer.validated_data["file"])
+        except StatementError as e:
+            return Response({"file": [str(e)]}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "created": result.created,
+                "skipped": result.skipped,
+                "errors": result.errors,
+            },
+            status=status.HTTP_201_CREATED if result.created else status.HTTP_200_OK,
+        )
+
     @action(detail=False, methods=["get"])
     def by_category(self, request):
         """
@@ -1,15 +1,21 @@
+from dj_rest_auth.jwt_auth import get_refresh_view
 from django.contrib.auth import get_user_model
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from ..serializers.users import UserSerializer, UserProfileSerializer
+from ..fieldsets import SparseFieldsetMixin
+from ..serializers.users import (
+    TokenRefreshSerializer,
+    UserSerializer,
+    UserProfileSerializer,
+)
 
 User = get_user_model()
 
 
-class UserViewSet(viewsets.ReadOnlyModelViewSet):
+class UserViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing user information.
     """
@@ -35,3 +41,14 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data)
+
+
+class TokenRefreshView(get_refresh_view()):
+    """
+    dj-rest-auth's token refresh view (cookie support included).
+
+    Rotated refresh tokens are checked against the blacklist through
+    ``apps.users.blacklist`` rather than with a query per refresh.
+    """
+
+    serializer_class = TokenRefreshSerializer
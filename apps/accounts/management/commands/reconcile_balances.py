@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import Account
+from apps.accounts.services import reconcile_balances
+
+
+class Command(BaseCommand):
+    help = "Recompute account balances from transaction history in chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of accounts to recompute per database round trip",
+        )
+        parser.add_argument(
+            "--user",
+            help="Only reconcile accounts belonging to this user email",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted balances without writing them",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Account.objects.all()
+        if options["user"]:
+            queryset = queryset.filter(user__email=options["user"])
+
+        drifted = reconcile_balances(
+            queryset,
+            chunk_size=options["chunk_size"],
+            dry_run=options["dry_run"],
+        )
+
+        for account_id, stored, computed in drifted:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"↻ Account {account_id}: stored {stored}, computed {computed}"
+                )
+            )
+
+        verb = "Found" if options["dry_run"] else "Fixed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n✓ Reconciliation complete! {verb} {len(drifted)} drifted balances"
+            )
+        )
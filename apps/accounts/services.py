@@ -0,0 +1,98 @@
+from decimal import Decimal
+
+from django.db import transaction as db_transaction
+from django.db.models import Case, DecimalField, F, Sum, Value, When
+from django.utils import timezone
+
+from apps.core.cache import bump_data_version
+from .models import Account
+
+
+def apply_balance_deltas(deltas):
+    """
+    Apply signed balance deltas ({account_id: Decimal}) to accounts.
+
+    Each account is updated with a single ``F()`` expression so concurrent
+    writers never overwrite each other. Accounts are touched in a stable
+    order to avoid lock-ordering deadlocks between concurrent requests.
+    """
+    now = timezone.now()
+    for account_id in sorted(deltas, key=str):
+        delta = deltas[account_id]
+        if not delta:
+            continue
+        Account.objects.filter(pk=account_id).update(
+            balance=F("balance") + delta, updated_at=now
+        )
+
+
+def computed_balance():
+    """Signed sum of an account's transactions (income minus expenses)."""
+    return Sum(
+        Case(
+            When(
+                transactions__transaction_type="income",
+                then=F("transactions__amount"),
+            ),
+            When(
+                transactions__transaction_type="expense",
+                then=-F("transactions__amount"),
+            ),
+            default=Value(Decimal("0")),
+            output_field=DecimalField(max_digits=15, decimal_places=2),
+        )
+    )
+
+
+def reconcile_balances(queryset=None, chunk_size=500, dry_run=False):
+    """
+    Recompute account balances from transaction history in chunks.
+
+    Accounts are walked in primary-key order. Each chunk is locked, summed
+    with one grouped aggregate and written back in a single ``bulk_update``,
+    so concurrent transaction writes either land before the sum or apply
+    their delta on top of the reconciled value.
+
+    Returns a list of ``(account_id, stored, computed)`` for drifted accounts.
+    """
+    if queryset is None:
+        queryset = Account.objects.all()
+    queryset = queryset.order_by("pk")
+
+    drifted = []
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(page.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        with db_transaction.atomic():
+            locked = Account.objects.select_for_update().filter(pk__in=pks)
+            list(locked.values_list("pk", flat=True))
+            rows = (
+                Account.objects.filter(pk__in=pks)
+                .annotate(computed=computed_balance())
+                .values_list("pk", "balance", "computed")
+            )
+
+            updates = []
+            for pk, stored, computed in rows:
+                computed = computed or Decimal("0")
+                if stored != computed:
+                    drifted.append((pk, stored, computed))
+                    updates.append(Account(pk=pk, balance=computed))
+
+            if updates and not dry_run:
+                Account.objects.bulk_update(updates, ["balance"])
+                owners = Account.objects.filter(
+                    pk__in=[account.pk for account in updates]
+                ).values_list("user_id", flat=True)
+                for user_id in set(owners):
+                    bump_data_version(user_id)
+
+        if len(pks) < chunk_size:
+            break
+
+    return drifted
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .services import reconcile_balances
+
+
+@shared_task(priority=9)
+def reconcile_account_balances(chunk_size=500, dry_run=False):
+    """Repair balance drift; returns the number of drifted accounts."""
+    return len(reconcile_balances(chunk_size=chunk_size, dry_run=dry_run))
@@ -6,8 +6,17 @@ from .models import FinancialSnapshot
 
 @admin.register(FinancialSnapshot)
 class FinancialSnapshotAdmin(ModelAdmin):
-    list_display = ("created_for_date", "total_income", "total_expense", "created_at")
-    list_filter = ("created_at", "created_for_date")
+    list_display = (
+        "created_for_date",
+        "user",
+        "category",
+        "currency",
+        "total_income",
+        "total_expense",
+    )
+    list_filter = ("currency", "created_for_date")
+    search_fields = ("user__email",)
+    list_select_related = ("user", "category")
     date_hierarchy = "created_for_date"
     readonly_fields = ("created_at",)
     ordering = ("-created_for_date",)
@@ -0,0 +1,140 @@
+"""
+The home screen dashboard, assembled in one call.
+
+Every section is an independent read with its own cache timeout (see
+``DASHBOARD_CACHE_TIMEOUTS``). Cached sections are fetched with a single
+``get_many`` under the user's data version; the rest run concurrently on a
+bounded, process-wide thread pool, so a cold dashboard costs roughly its
+slowest section rather than the sum of all of them.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.budgets.models import Budget
+from apps.budgets.services import budget_progress
+from apps.core.cache import get_data_version, versioned_cache_key
+from apps.goals.models import Goal
+from apps.notifications.models import Notification
+from .services import income_vs_expenses, net_worth
+
+DASHBOARD_DAYS = 30
+LATEST_NOTIFICATIONS = 5
+
+
+def _accounts(user):
+    return list(Account.objects.filter(user=user, is_active=True).order_by("name"))
+
+
+def _net_worth(user):
+    return net_worth(user)
+
+
+def _income_vs_expenses(user):
+    start_date = timezone.localdate() - timedelta(days=DASHBOARD_DAYS)
+    return income_vs_expenses(user, start_date)
+
+
+def _budgets(user):
+    budgets = Budget.objects.filter(user=user, is_active=True).order_by("end_date")
+    return list(budget_progress(budgets).values())
+
+
+def _goals(user):
+    return list(
+        Goal.objects.filter(user=user, is_achieved=False).order_by(
+            F("deadline").asc(nulls_last=True), "name"
+        )
+    )
+
+
+def _notifications(user):
+    unread = Notification.objects.filter(user=user, is_read=False)
+    return {
+        "unread_count": unread.count(),
+        "latest": list(unread.order_by("-created_at")[:LATEST_NOTIFICATIONS]),
+    }
+
+
+SECTIONS = {
+    "accounts": _accounts,
+    "net_worth": _net_worth,
+    "income_vs_expenses": _income_vs_expenses,
+    "budgets": _budgets,
+    "goals": _goals,
+    "notifications": _notifications,
+}
+
+# Sections over a window ending today; their cache keys carry the date, as
+# the window moves at midnight without a write.
+WINDOWED_SECTIONS = {"income_vs_expenses"}
+
+
+def build_dashboard(user, sections=None):
+    """
+    Return ``{section: data}`` for ``user``, every section unless ``sections``.
+
+    Lists hold model instances (``BudgetProgress`` for budgets) so each API
+    can render them with its own serializers or types.
+    """
+    names = [name for name in SECTIONS if sections is None or name in sections]
+    timeouts = settings.DASHBOARD_CACHE_TIMEOUTS
+    version = get_data_version(user.pk)
+    dated = [("localdate", timezone.localdate().isoformat())]
+    keys = {
+        name: versioned_cache_key(
+            user.pk,
+            f"dashboard:{name}",
+            dated if name in WINDOWED_SECTIONS else (),
+            version=version,
+        )
+        for name in names
+        if timeouts.get(name)
+    }
+
+    cached = cache.get_many(keys.values()) if keys else {}
+    dashboard = {name: cached[key] for name, key in keys.items() if key in cached}
+    missing = [name for name in names if name not in dashboard]
+    for name, data in zip(missing, _compute(user, missing)):
+        dashboard[name] = data
+        if name in keys:
+            cache.set(keys[name], data, timeouts[name])
+    return {name: dashboard[name] for name in names}
+
+
+def _compute(user, names):
+    # Pool threads use their own connections, which can't see writes the
+    # caller hasn't committed yet, so sections inside a transaction run here.
+    if (
+        len(names) < 2
+        or settings.DASHBOARD_MAX_WORKERS < 2
+        or connection.in_atomic_block
+    ):
+        return [SECTIONS[name](user) for name in names]
+    futures = [_executor().submit(_run_section, name, user) for name in names]
+    return [future.result() for future in futures]
+
+
+def _run_section(name, user):
+    # Pool threads outlive requests, so apply the request cycle's connection
+    # housekeeping (CONN_MAX_AGE, broken connections) around each section.
+    close_old_connections()
+    try:
+        return SECTIONS[name](user)
+    finally:
+        close_old_connections()
+
+
+@lru_cache(maxsize=None)
+def _executor():
+    return ThreadPoolExecutor(
+        max_workers=settings.DASHBOARD_MAX_WORKERS, thread_name_prefix="dashboard"
+    )
@@ -0,0 +1,44 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from apps.analytics.services import rebuild_snapshots
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily financial snapshot rollup from transaction history"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="Number of users to rebuild per database transaction",
+        )
+        parser.add_argument(
+            "--user",
+            help="Only rebuild snapshots for this user email",
+        )
+        parser.add_argument(
+            "--start-after",
+            help="Resume after this user ID (printed after every chunk)",
+        )
+
+    def handle(self, *args, **options):
+        queryset = get_user_model().objects.all()
+        if options["user"]:
+            queryset = queryset.filter(email=options["user"])
+
+        chunks = 0
+        for last_pk in rebuild_snapshots(
+            queryset,
+            chunk_size=options["chunk_size"],
+            start_after=options["start_after"],
+        ):
+            chunks += 1
+            self.stdout.write(f"↻ Rebuilt through user {last_pk}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n✓ Snapshot backfill complete! Processed {chunks} chunks"
+            )
+        )
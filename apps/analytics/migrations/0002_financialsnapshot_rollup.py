@@ -0,0 +1,81 @@
+# Generated by Django 5.2.11 on 2026-10-17 06:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def clear_unowned_snapshots(apps, schema_editor):
+    # Existing rows have no owner and nothing ever wrote them; the rollup is
+    # rebuilt from transactions with ``manage.py backfill_snapshots``.
+    FinancialSnapshot = apps.get_model("analytics", "FinancialSnapshot")
+    FinancialSnapshot.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+        ("categories", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_unowned_snapshots, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="financialsnapshot",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="financial_snapshots",
+                to=settings.AUTH_USER_MODEL,
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="financialsnapshot",
+            name="category",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="financial_snapshots",
+                to="categories.category",
+            ),
+        ),
+        migrations.AddField(
+            model_name="financialsnapshot",
+            name="currency",
+            field=models.CharField(
+                choices=[("NGN", "Nigerian Naira"), ("USD", "US Dollar")],
+                default="NGN",
+                max_length=3,
+            ),
+        ),
+        migrations.AddField(
+            model_name="financialsnapshot",
+            name="income_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="financialsnapshot",
+            name="expense_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name="financialsnapshot",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("category__isnull", False)),
+                fields=("user", "created_for_date", "category", "currency"),
+                name="snapshot_user_day_category_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="financialsnapshot",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("category__isnull", True)),
+                fields=("user", "created_for_date", "currency"),
+                name="snapshot_user_day_uncategorized_uniq",
+            ),
+        ),
+    ]
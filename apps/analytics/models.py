@@ -1,12 +1,56 @@
+from django.conf import settings
 from django.db import models
 
+from apps.categories.models import Category
+from apps.core.constants import CURRENCY_CHOICES
 from apps.core.models import TimeStampedModel, UUIDModel
 
 
 class FinancialSnapshot(UUIDModel, TimeStampedModel):
+    """
+    Daily income and expense totals per user, category and currency.
+
+    Rows are maintained incrementally by transaction writes (see
+    ``apps.transactions.services``) and can be rebuilt from transaction
+    history with the ``backfill_snapshots`` command.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="financial_snapshots",
+    )
+    # Deleting a category folds its rows into the uncategorized ones first
+    # (see ``apps.analytics.signals``), so nothing is left to cascade.
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
+        related_name="financial_snapshots",
+    )
+    currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES, default="NGN")
     created_for_date = models.DateField()
     total_income = models.DecimalField(max_digits=15, decimal_places=2, default=0)
     total_expense = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    income_count = models.IntegerField(default=0)
+    expense_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "created_for_date", "category", "currency"],
+                condition=models.Q(category__isnull=False),
+                name="snapshot_user_day_category_uniq",
+            ),
+            # NULLs are distinct in unique indexes, so uncategorized rows
+            # need their own constraint.
+            models.UniqueConstraint(
+                fields=["user", "created_for_date", "currency"],
+                condition=models.Q(category__isnull=True),
+                name="snapshot_user_day_uncategorized_uniq",
+            ),
+        ]
 
     def __str__(self):
         return str(self.created_for_date)
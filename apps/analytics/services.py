@@ -0,0 +1,210 @@
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction as db_transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.core.cache import bump_data_version
+from apps.transactions.models import Transaction
+from .models import FinancialSnapshot
+
+INSERT_BATCH_SIZE = 1000
+
+
+@dataclass
+class SnapshotDelta:
+    """A change to one FinancialSnapshot row."""
+
+    total_income: Decimal = Decimal("0")
+    total_expense: Decimal = Decimal("0")
+    income_count: int = 0
+    expense_count: int = 0
+
+    def add(self, transaction_type, amount, count=1):
+        if transaction_type == "income":
+            self.total_income += amount
+            self.income_count += count
+        else:
+            self.total_expense += amount
+            self.expense_count += count
+
+    def __bool__(self):
+        return any(asdict(self).values())
+
+
+def _key_order(key):
+    user_id, day, category_id, currency = key
+    return (str(user_id), day, str(category_id or ""), currency)
+
+
+def apply_snapshot_deltas(deltas):
+    """
+    Add deltas ({(user_id, date, category_id, currency): SnapshotDelta}) to
+    the matching snapshot rows, creating rows that do not exist yet.
+
+    Rows are updated with ``F()`` expressions in a stable order, like account
+    balances, so concurrent writers neither lose updates nor deadlock. Must
+    be called inside a database transaction.
+    """
+    now = timezone.now()
+    for key in sorted(deltas, key=_key_order):
+        delta = deltas[key]
+        if not delta:
+            continue
+        user_id, day, category_id, currency = key
+        rows = FinancialSnapshot.objects.filter(
+            user_id=user_id,
+            created_for_date=day,
+            category_id=category_id,
+            currency=currency,
+        )
+        increments = {
+            name: F(name) + value for name, value in asdict(delta).items() if value
+        }
+        if rows.update(updated_at=now, **increments):
+            continue
+        try:
+            with db_transaction.atomic():
+                FinancialSnapshot.objects.create(
+                    user_id=user_id,
+                    created_for_date=day,
+                    category_id=category_id,
+                    currency=currency,
+                    **asdict(delta),
+                )
+        except IntegrityError:
+            # A concurrent writer created the row first.
+            rows.update(updated_at=now, **increments)
+
+
+def fold_category_snapshots(category):
+    """Move a category's snapshot rows into the uncategorized rows."""
+    with db_transaction.atomic():
+        rows = FinancialSnapshot.objects.filter(category=category)
+        deltas = defaultdict(SnapshotDelta)
+        for row in rows.values(
+            "user_id",
+            "created_for_date",
+            "currency",
+            "total_income",
+            "total_expense",
+            "income_count",
+            "expense_count",
+        ):
+            key = (row["user_id"], row["created_for_date"], None, row["currency"])
+            deltas[key].add("income", row["total_income"], row["income_count"])
+            deltas[key].add("expense", row["total_expense"], row["expense_count"])
+        rows.delete()
+        apply_snapshot_deltas(deltas)
+
+
+def rebuild_snapshots(user_queryset, chunk_size=100, start_after=None):
+    """
+    Rebuild snapshot rows from transaction history, a chunk of users at a time.
+
+    Users are walked in primary-key order starting after ``start_after``.
+    Each chunk runs in its own transaction holding the users' account row
+    locks, which transaction writes also take, so a concurrent write either
+    lands before the rebuild reads or applies its delta on top of it.
+
+    Yields the last user primary key of every committed chunk, which can be
+    passed back as ``start_after`` to resume an interrupted run.
+    """
+    queryset = user_queryset.order_by("pk")
+    last_pk = start_after
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(page.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        with db_transaction.atomic():
+            locked = Account.objects.select_for_update().filter(user_id__in=pks)
+            list(locked.values_list("pk", flat=True))
+            FinancialSnapshot.objects.filter(user_id__in=pks).delete()
+
+            totals = (
+                Transaction.objects.filter(user_id__in=pks)
+                .values("user_id", "date", "category_id", "currency")
+                .annotate(
+                    total_income=Sum("amount", filter=Q(transaction_type="income")),
+                    total_expense=Sum("amount", filter=Q(transaction_type="expense")),
+                    income_count=Count("id", filter=Q(transaction_type="income")),
+                    expense_count=Count("id", filter=Q(transaction_type="expense")),
+                )
+                .order_by()
+            )
+            batch = []
+            for row in totals.iterator(chunk_size=INSERT_BATCH_SIZE):
+                batch.append(
+                    FinancialSnapshot(
+                        user_id=row["user_id"],
+                        created_for_date=row["date"],
+                        category_id=row["category_id"],
+                        currency=row["currency"],
+                        total_income=row["total_income"] or Decimal("0"),
+                        total_expense=row["total_expense"] or Decimal("0"),
+                        income_count=row["income_count"],
+                        expense_count=row["expense_count"],
+                    )
+                )
+                if len(batch) == INSERT_BATCH_SIZE:
+                    FinancialSnapshot.objects.bulk_create(batch)
+                    batch = []
+            if batch:
+                FinancialSnapshot.objects.bulk_create(batch)
+            for pk in pks:
+                bump_data_version(pk)
+
+        yield last_pk
+
+        if len(pks) < chunk_size:
+            break
+
+
+def net_worth(user):
+    """
+    Sum the balances of ``user``'s active accounts, per currency.
+
+    Balances are maintained incrementally by transaction writes, so this is
+    a single grouped aggregate over the user's accounts.
+    """
+    totals = (
+        Account.objects.filter(user=user, is_active=True)
+        .values("currency")
+        .annotate(total=Sum("balance"), count=Count("id"))
+        .order_by("currency")
+    )
+
+    total_by_currency = {}
+    accounts_count = 0
+    for row in totals:
+        total_by_currency[row["currency"]] = float(row["total"])
+        accounts_count += row["count"]
+    return {"by_currency": total_by_currency, "accounts_count": accounts_count}
+
+
+def income_vs_expenses(user, start_date, currency=None):
+    """Total income and expenses of ``user`` since ``start_date`` from the rollup."""
+    queryset = FinancialSnapshot.objects.filter(
+        user=user, created_for_date__gte=start_date
+    )
+    if currency:
+        queryset = queryset.filter(currency=currency)
+    totals = queryset.aggregate(
+        income=Sum("total_income"), expenses=Sum("total_expense")
+    )
+    income = totals["income"] or 0
+    expenses = totals["expenses"] or 0
+    return {
+        "income": income,
+        "expenses": expenses,
+        "net": income - expenses,
+        "savings_rate": (
+            round(((income - expenses) / income) * 100, 2) if income > 0 else 0
+        ),
+    }
@@ -0,0 +1,53 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.accounts.models import Account
+from apps.budgets.models import Budget, BudgetCategory
+from apps.categories.models import Category
+from apps.core.cache import bump_data_version
+from apps.goals.models import Goal
+from apps.transactions.models import Transaction
+from apps.transactions.services import reverse_account_transactions
+from .services import fold_category_snapshots
+
+
+@receiver(pre_delete, sender=Category)
+def fold_deleted_category(sender, instance, **kwargs):
+    """Its transactions become uncategorized, so move its rollup rows too."""
+    fold_category_snapshots(instance)
+
+
+@receiver(pre_delete, sender=Account)
+def reverse_deleted_account(sender, instance, **kwargs):
+    """Its transactions cascade with it, so take them out of rollups and budgets."""
+    reverse_account_transactions(instance)
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+def bump_owner_data_version(sender, instance, **kwargs):
+    """Invalidate the owner's cached analytics and dashboard after a write."""
+    # System categories have no owner; their cached names age out by timeout.
+    if instance.user_id is not None:
+        bump_data_version(instance.user_id)
+
+
+@receiver(post_save, sender=BudgetCategory)
+@receiver(post_delete, sender=BudgetCategory)
+def bump_budget_owner_data_version(sender, instance, **kwargs):
+    """Invalidate the budget owner's cached analytics after a write."""
+    user_id = (
+        Budget.objects.filter(pk=instance.budget_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    if user_id is not None:
+        bump_data_version(user_id)
@@ -0,0 +1,35 @@
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from .services import rebuild_snapshots
+
+CHUNKS_PER_TASK = 10
+
+
+@shared_task(priority=9)
+def backfill_snapshots(
+    user_ids=None, chunk_size=100, start_after=None, chunks_per_task=CHUNKS_PER_TASK
+):
+    """
+    Rebuild the daily rollup a bounded number of user chunks at a time.
+
+    Each run re-enqueues itself after the last committed chunk, so a full
+    backfill never ties up a worker for hours and a lost run resumes from
+    where it stopped. Returns the last user primary key rebuilt.
+    """
+    queryset = get_user_model().objects.all()
+    if user_ids is not None:
+        queryset = queryset.filter(pk__in=user_ids)
+
+    last_pk = None
+    chunks = rebuild_snapshots(queryset, chunk_size=chunk_size, start_after=start_after)
+    for index, last_pk in enumerate(chunks, start=1):
+        if index >= chunks_per_task:
+            backfill_snapshots.delay(
+                user_ids=user_ids,
+                chunk_size=chunk_size,
+                start_after=last_pk,
+                chunks_per_task=chunks_per_task,
+            )
+            break
+    return last_pk
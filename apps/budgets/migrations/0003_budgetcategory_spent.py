@@ -0,0 +1,42 @@
+# Generated by Django 5.2.11 on 2026-10-17 06:28
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_spent(apps, schema_editor):
+    # Summed from transactions rather than the rollup, which may not have
+    # been backfilled yet when this runs.
+    BudgetCategory = apps.get_model("budgets", "BudgetCategory")
+    Transaction = apps.get_model("transactions", "Transaction")
+    for budget_category in BudgetCategory.objects.select_related("budget").iterator():
+        budget = budget_category.budget
+        spent = Transaction.objects.filter(
+            user_id=budget.user_id,
+            category_id=budget_category.category_id,
+            currency=budget.currency,
+            transaction_type="expense",
+            date__gte=budget.start_date,
+            date__lte=budget.end_date,
+        ).aggregate(total=Sum("amount"))["total"]
+        if spent:
+            BudgetCategory.objects.filter(pk=budget_category.pk).update(spent=spent)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budgets", "0002_initial"),
+        ("transactions", "0004_transaction_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="budgetcategory",
+            name="spent",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=15
+            ),
+        ),
+        migrations.RunPython(backfill_spent, migrations.RunPython.noop),
+    ]
@@ -36,6 +36,11 @@ class BudgetCategory(UUIDModel, TimeStampedModel):
     )
     allocated_amount = models.DecimalField(max_digits=15, decimal_places=2)
     alert_threshold = models.DecimalField(max_digits=5, decimal_places=2, default=0.8)
+    # Running expense total in the budget's currency and date range, kept up
+    # to date by transaction writes (see ``apps.budgets.services``).
+    spent = models.DecimalField(
+        max_digits=15, decimal_places=2, default=0, editable=False
+    )
 
     def __str__(self):
         return f"{self.budget.name}: {self.category.name}"
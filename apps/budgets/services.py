@@ -0,0 +1,232 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db.models import Case, DecimalField, Q, Sum, When, prefetch_related_objects
+
+from apps.analytics.models import FinancialSnapshot
+from apps.notifications.models import Notification
+from .models import Budget, BudgetCategory
+
+CENTS = Decimal("0.01")
+
+
+def percentage_of(spent, amount):
+    return round((spent / amount) * 100, 2) if amount > 0 else 0
+
+
+@dataclass
+class CategoryProgress:
+    """Spend against one ``BudgetCategory`` allocation."""
+
+    budget_category: BudgetCategory
+    spent: Decimal = Decimal("0")
+
+    @property
+    def allocated_amount(self):
+        return self.budget_category.allocated_amount
+
+    @property
+    def remaining(self):
+        return self.allocated_amount - self.spent
+
+    @property
+    def percentage_used(self):
+        return percentage_of(self.spent, self.allocated_amount)
+
+
+@dataclass
+class BudgetProgress:
+    """
+    Spend against a budget and each of its category allocations.
+
+    A budget with allocations counts spend in those categories only; one
+    without counts every expense in its currency and date range.
+    """
+
+    budget: Budget
+    spent: Decimal = Decimal("0")
+    categories: list = field(default_factory=list)
+
+    @property
+    def remaining(self):
+        return self.budget.total_amount - self.spent
+
+    @property
+    def percentage_used(self):
+        return percentage_of(self.spent, self.budget.total_amount)
+
+
+def budget_progress(budgets):
+    """
+    Compute progress for ``budgets``; returns ``{budget_id: BudgetProgress}``.
+
+    Spend comes from the daily rollup in one grouped query: rows are grouped
+    by category, with one conditional sum per budget over that budget's
+    owner, currency and date range. Allocations are prefetched once.
+    """
+    budgets = list(budgets)
+    if not budgets:
+        return {}
+    prefetch_related_objects(budgets, "categories")
+
+    columns = {
+        f"budget_{index}": Sum(
+            Case(
+                When(
+                    Q(
+                        user_id=budget.user_id,
+                        currency=budget.currency,
+                        created_for_date__gte=budget.start_date,
+                        created_for_date__lte=budget.end_date,
+                    ),
+                    then="total_expense",
+                ),
+                output_field=DecimalField(max_digits=15, decimal_places=2),
+            )
+        )
+        for index, budget in enumerate(budgets)
+    }
+    rows = (
+        FinancialSnapshot.objects.filter(
+            user_id__in={budget.user_id for budget in budgets},
+            created_for_date__gte=min(budget.start_date for budget in budgets),
+            created_for_date__lte=max(budget.end_date for budget in budgets),
+            expense_count__gt=0,
+        )
+        .values("category_id")
+        .annotate(**columns)
+        .order_by()
+    )
+
+    spend = [{} for _ in budgets]
+    for row in rows:
+        for index in range(len(budgets)):
+            amount = row[f"budget_{index}"]
+            if amount:
+                spend[index][row["category_id"]] = amount
+
+    progress = {}
+    for index, budget in enumerate(budgets):
+        categories = [
+            CategoryProgress(
+                budget_category,
+                spend[index].get(budget_category.category_id, Decimal("0")),
+            )
+            for budget_category in budget.categories.all()
+        ]
+        if categories:
+            spent = sum((category.spent for category in categories), Decimal("0"))
+        else:
+            spent = sum(spend[index].values(), Decimal("0"))
+        progress[budget.pk] = BudgetProgress(budget, spent, categories)
+    return progress
+
+
+def refresh_budget_spend(budgets):
+    """
+    Recompute the running spend of every allocation of ``budgets``.
+
+    Used when a budget or allocation is saved, since its window, currency
+    or category may have changed. Transaction writes apply deltas instead.
+    """
+    changed = []
+    for progress in budget_progress(budgets).values():
+        for category in progress.categories:
+            if category.budget_category.spent != category.spent:
+                category.budget_category.spent = category.spent
+                changed.append(category.budget_category)
+    BudgetCategory.objects.bulk_update(changed, ["spent"])
+
+
+def apply_budget_spend_deltas(deltas):
+    """
+    Add expense deltas ({(user_id, category_id, currency, date): Decimal}) to
+    the running spend of the allocations they fall into, and notify owners of
+    active budgets whose spend just crossed the alert threshold or 100%.
+
+    Only allocations matching the written transactions are read, so the cost
+    follows the number of affected budgets rather than transaction history.
+    They are locked in primary-key order, like account balances, so each
+    crossing is seen by exactly one writer. Must be called inside a database
+    transaction. Returns the notifications that were created.
+    """
+    days = defaultdict(list)
+    for (user_id, category_id, currency, day), amount in deltas.items():
+        if amount and category_id is not None:
+            days[(user_id, category_id, currency)].append((day, amount))
+    if not days:
+        return []
+
+    match = Q(pk__in=[])
+    for (user_id, category_id, currency), changes in days.items():
+        match |= Q(
+            budget__user_id=user_id,
+            category_id=category_id,
+            budget__currency=currency,
+            budget__start_date__lte=max(day for day, _ in changes),
+            budget__end_date__gte=min(day for day, _ in changes),
+        )
+    budget_categories = (
+        BudgetCategory.objects.select_for_update(of=("self",))
+        .select_related("budget", "category")
+        .filter(match)
+        .order_by("pk")
+    )
+
+    changed, notifications = [], []
+    for budget_category in budget_categories:
+        budget = budget_category.budget
+        delta = sum(
+            (
+                amount
+                for day, amount in days[
+                    (budget.user_id, budget_category.category_id, budget.currency)
+                ]
+                if budget.start_date <= day <= budget.end_date
+            ),
+            Decimal("0"),
+        )
+        if not delta:
+            continue
+        before = budget_category.spent
+        budget_category.spent = before + delta
+        changed.append(budget_category)
+        if budget.is_active:
+            notification = _crossing_notification(budget_category, before)
+            if notification is not None:
+                notifications.append(notification)
+
+    BudgetCategory.objects.bulk_update(changed, ["spent"])
+    Notification.objects.bulk_create(notifications, ignore_conflicts=True)
+    return notifications
+
+
+def _crossing_notification(budget_category, before):
+    """A notification if spend went from ``before`` past a level, else None."""
+    allocated = budget_category.allocated_amount
+    after = budget_category.spent
+    if allocated <= 0:
+        return None
+
+    budget = budget_category.budget
+    name = budget_category.category.name
+    if before < allocated <= after:
+        level, limit = "limit", allocated
+        title = f"{name} budget limit reached"
+    else:
+        limit = (allocated * budget_category.alert_threshold).quantize(CENTS)
+        if not (0 < limit < allocated and before < limit <= after):
+            return None
+        level = "threshold"
+        title = f"{name} budget at {percentage_of(after, allocated)}%"
+
+    return Notification(
+        user_id=budget.user_id,
+        title=title,
+        message=(
+            f"You have spent {after} {budget.currency} of the {allocated} "
+            f"{budget.currency} allocated to {name} in {budget.name}."
+        ),
+        dedup_key=f"budget-category:{budget_category.pk}:{level}:{limit}",
+    )
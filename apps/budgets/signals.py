@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Budget, BudgetCategory
+from .services import refresh_budget_spend
+
+
+@receiver(post_save, sender=Budget)
+def refresh_spend_on_budget_save(sender, instance, created, **kwargs):
+    """A changed window or currency changes what counts as spend."""
+    if not created:
+        refresh_budget_spend(Budget.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=BudgetCategory)
+def refresh_spend_on_allocation_save(sender, instance, **kwargs):
+    """New or re-pointed allocations start from the spend already recorded."""
+    # Fresh instances, so the caller's budget doesn't get a prefetch cache.
+    refresh_budget_spend(Budget.objects.filter(pk=instance.budget_id))
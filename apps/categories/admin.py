@@ -1,6 +1,7 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin
 
+from .cache import invalidate_system_categories
 from .models import Category
 
 
@@ -11,3 +12,19 @@ class CategoryAdmin(ModelAdmin):
     search_fields = ("name",)
     date_hierarchy = "created_at"
     readonly_fields = ("created_at", "updated_at")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if obj.is_system or "is_system" in form.changed_data:
+            invalidate_system_categories()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        if obj.is_system:
+            invalidate_system_categories()
+
+    def delete_queryset(self, request, queryset):
+        has_system = queryset.filter(is_system=True).exists()
+        super().delete_queryset(request, queryset)
+        if has_system:
+            invalidate_system_categories()
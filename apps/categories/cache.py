@@ -0,0 +1,82 @@
+"""
+Process-wide cache of the system categories.
+
+System categories are shared by every user and only change when they are
+seeded or edited in the admin. Their rows are held in two tiers: an
+in-process LRU keyed by version, backed by the shared Django cache so a
+worker's first read after a change is a cache hit rather than a query.
+Every read checks the shared version key, so an invalidation reaches all
+workers on their next request without a restart.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.core.cache import bump_version, get_version
+from .models import Category
+
+SYSTEM_CATEGORIES_VERSION_KEY = "system-categories-version"
+SYSTEM_CATEGORIES_KEY = "system-categories:{version}"
+SYSTEM_CATEGORIES_TIMEOUT = 24 * 60 * 60
+
+
+class SystemCategories(NamedTuple):
+    """The active system categories as raw field values, in name order."""
+
+    field_names: tuple
+    rows: tuple
+    ids: frozenset
+
+    def instances(self):
+        """Fresh ``Category`` instances, safe for the caller to modify."""
+        return [
+            Category.from_db(DEFAULT_DB_ALIAS, self.field_names, row)
+            for row in self.rows
+        ]
+
+
+def get_system_categories():
+    return _load(get_version(SYSTEM_CATEGORIES_VERSION_KEY))
+
+
+def system_category_ids():
+    return get_system_categories().ids
+
+
+def get_system_category(pk):
+    """The active system category with primary key ``pk``, or ``None``."""
+    cached = get_system_categories()
+    if pk not in cached.ids:
+        return None
+    index = cached.field_names.index("id")
+    for row in cached.rows:
+        if row[index] == pk:
+            return Category.from_db(DEFAULT_DB_ALIAS, cached.field_names, row)
+
+
+def invalidate_system_categories():
+    """Make every worker reload the system categories once the write commits."""
+    bump_version(SYSTEM_CATEGORIES_VERSION_KEY)
+
+
+@lru_cache(maxsize=4)
+def _load(version):
+    key = SYSTEM_CATEGORIES_KEY.format(version=version)
+    cached = cache.get(key)
+    if cached is None:
+        # Field names travel with the rows so a deploy that changes the
+        # model can still read entries cached by the previous release.
+        field_names = tuple(field.attname for field in Category._meta.concrete_fields)
+        rows = tuple(
+            Category.objects.filter(is_system=True, is_active=True)
+            .order_by("name")
+            .values_list(*field_names)
+        )
+        cached = (field_names, rows)
+        cache.set(key, cached, SYSTEM_CATEGORIES_TIMEOUT)
+    field_names, rows = cached
+    index = field_names.index("id")
+    return SystemCategories(field_names, rows, frozenset(row[index] for row in rows))
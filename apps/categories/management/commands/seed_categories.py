@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from apps.categories.cache import invalidate_system_categories
 from apps.categories.models import Category
 
 User = get_user_model()
@@ -235,17 +236,14 @@ class Command(BaseCommand):
         ]
 
         created_count = 0
-        updated_count = 0
+        existing_count = 0
 
         for category_data in categories_data:
             category, created = Category.objects.get_or_create(
                 name=category_data["name"],
-                type=category_data["type"],
+                category_type=category_data["type"],
                 is_system=True,
                 defaults={
-                    "icon": category_data.get("icon", ""),
-                    "color": category_data.get("color", "#6B7280"),
-                    "description": category_data.get("description", ""),
                     "user": None,  # System categories have no user
                 },
             )
@@ -256,20 +254,16 @@ class Command(BaseCommand):
                     self.style.SUCCESS(f"✓ Created system category: {category.name}")
                 )
             else:
-                # Update existing category with new data
-                category.icon = category_data.get("icon", category.icon)
-                category.color = category_data.get("color", category.color)
-                category.description = category_data.get(
-                    "description", category.description
-                )
-                category.save()
-                updated_count += 1
+                existing_count += 1
                 self.stdout.write(
-                    self.style.WARNING(f"↻ Updated system category: {category.name}")
+                    self.style.WARNING(f"↻ System category exists: {category.name}")
                 )
 
+        # Every worker reloads its cached system categories on its next request
+        invalidate_system_categories()
+
         self.stdout.write(
             self.style.SUCCESS(
-                f"\n✓ Seeding complete! Created: {created_count}, Updated: {updated_count}"
+                f"\n✓ Seeding complete! Created: {created_count}, Existing: {existing_count}"
             )
         )
@@ -0,0 +1,59 @@
+from collections import defaultdict
+
+from .cache import get_system_categories
+from .models import Category
+
+
+class CategoryTree:
+    """
+    Every category visible to one user, with parent/child links in memory.
+
+    Loading the whole hierarchy is at most one query (system categories come
+    from cache), after which any category's children or parent are a
+    dictionary lookup. Serializers and resolvers build one tree per request
+    instead of walking ``children`` per row.
+    """
+
+    def __init__(self, categories):
+        self._by_id = {}
+        self._children = defaultdict(list)
+        for category in sorted(categories, key=lambda category: category.name):
+            self._by_id[category.pk] = category
+        for category in self._by_id.values():
+            if category.parent_id in self._by_id:
+                self._children[category.parent_id].append(category)
+
+    @classmethod
+    def for_user(cls, user):
+        """The active system categories (from cache) plus ``user``'s own."""
+        categories = get_system_categories().instances()
+        if user is not None and user.is_authenticated:
+            categories.extend(
+                Category.objects.filter(user=user, is_active=True, is_system=False)
+            )
+        return cls(categories)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, pk):
+        return pk in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def get(self, pk):
+        return self._by_id.get(pk)
+
+    def children(self, category):
+        """Direct children of ``category`` (or a category id), by name."""
+        pk = getattr(category, "pk", category)
+        return self._children.get(pk, [])
+
+    def roots(self):
+        """Categories without a visible parent, by name."""
+        return [
+            category
+            for category in self._by_id.values()
+            if category.parent_id not in self._by_id
+        ]
@@ -0,0 +1,73 @@
+import hashlib
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction as db_transaction
+
+DATA_VERSION_KEY = "user-data-version:{user_id}"
+
+
+def get_version(key):
+    """
+    Return the current version token stored under ``key``.
+
+    Tokens are random rather than counters, so a version key lost to cache
+    eviction or a restart can never resurrect entries cached under an old
+    token. ``cache.add`` keeps concurrent first readers on the same token.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_token(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """
+    Replace the version token under ``key``, orphaning entries cached under it.
+
+    The bump runs after the surrounding transaction commits; bumping earlier
+    would let a concurrent reader cache pre-commit data under the new token.
+    """
+    db_transaction.on_commit(
+        lambda: cache.set(key, _new_token(), timeout=None), robust=True
+    )
+
+
+def version_timestamp(version):
+    """When ``version`` was issued, in seconds since the epoch, or ``None``."""
+    issued, _, _ = str(version).partition("-")
+    try:
+        return float(issued)
+    except ValueError:
+        return None
+
+
+def _new_token():
+    # The issue time leads the token so responses can send it as Last-Modified.
+    return f"{time.time():.6f}-{uuid.uuid4().hex}"
+
+
+def get_data_version(user_id):
+    """Return the current data version token for a user."""
+    return get_version(DATA_VERSION_KEY.format(user_id=user_id))
+
+
+def bump_data_version(user_id):
+    """Invalidate every entry cached for a user's data once the write commits."""
+    bump_version(DATA_VERSION_KEY.format(user_id=user_id))
+
+
+def versioned_cache_key(user_id, namespace, params=(), version=None):
+    """
+    Cache key for ``namespace`` and ``params`` under the user's data version.
+
+    Pass ``version`` to build several keys from one version lookup.
+    """
+    if version is None:
+        version = get_data_version(user_id)
+    digest = hashlib.md5(
+        repr(sorted(params)).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"{namespace}:{user_id}:{version}:{digest}"
@@ -0,0 +1,83 @@
+"""
+Fast JSON encoding shared by the REST renderer, GraphQL and exports.
+
+Backed by orjson, which serializes dicts, lists, strings, numbers and
+UUIDs natively in C. Decimals are written as strings so amounts stay exact.
+Dates, times and datetimes are formatted in ``_default`` exactly as DRF's
+encoder formats them, along with the remaining types it knows about. NaN
+and infinities raise ``ValueError`` like DRF's strict JSON, where orjson
+alone would write ``null``.
+"""
+
+import datetime
+import decimal
+import math
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def dumps(data, indent=False, sort_keys=False):
+    """Encode ``data`` to UTF-8 JSON bytes."""
+    options = DUMPS_OPTIONS
+    if indent:
+        options |= orjson.OPT_INDENT_2
+    if sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+    output = orjson.dumps(data, default=_default, option=options)
+    # Only a payload with a null can hold a NaN or infinity.
+    if b"null" in output and _has_non_finite(data):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return output
+
+
+def loads(data):
+    """Decode JSON bytes or text; raises ``JSONDecodeError`` if malformed."""
+    return orjson.loads(data)
+
+
+def _has_non_finite(data):
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def _default(obj):
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        if representation.endswith("+00:00"):
+            representation = representation[:-6] + "Z"
+        return representation
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, datetime.time):
+        if obj.utcoffset() is not None:
+            raise ValueError("JSON can't represent timezone-aware times.")
+        return obj.isoformat()
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "__getitem__") and hasattr(obj, "keys"):
+        return dict(obj)
+    if hasattr(obj, "__iter__"):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,33 @@
+"""
+Migration operations shared across apps.
+"""
+
+from django.contrib.postgres.operations import AddIndexConcurrently as _Concurrently
+from django.db.migrations.operations import AddIndex
+
+
+class AddIndexConcurrently(_Concurrently):
+    """
+    ``CREATE INDEX CONCURRENTLY`` on PostgreSQL, so adding an index to a
+    large table doesn't block writes to it; a plain ``AddIndex`` elsewhere
+    (SQLite in development and tests). The migration must set
+    ``atomic = False``.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        return AddIndex.database_forwards(
+            self, app_label, schema_editor, from_state, to_state
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        return AddIndex.database_backwards(
+            self, app_label, schema_editor, from_state, to_state
+        )
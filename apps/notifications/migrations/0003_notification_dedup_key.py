@@ -0,0 +1,30 @@
+# Generated by Django 5.2.11 on 2026-10-17 06:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="dedup_key",
+            field=models.CharField(
+                blank=True, editable=False, max_length=200, null=True
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="notification",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("dedup_key__isnull", False)),
+                fields=("user", "dedup_key"),
+                name="notification_user_dedup_uniq",
+            ),
+        ),
+    ]
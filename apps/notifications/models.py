@@ -13,6 +13,18 @@ class Notification(UUIDModel, TimeStampedModel):
     title = models.CharField(max_length=120)
     message = models.TextField()
     is_read = models.BooleanField(default=False)
+    # Identifies the event a notification is about, so the same event is
+    # never announced twice (e.g. "budget-category:<id>:limit:<amount>").
+    dedup_key = models.CharField(max_length=200, null=True, blank=True, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "dedup_key"],
+                condition=models.Q(dedup_key__isnull=False),
+                name="notification_user_dedup_uniq",
+            ),
+        ]
 
     def __str__(self):
         return self.title
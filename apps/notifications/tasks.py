@@ -0,0 +1,40 @@
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from .models import Notification
+
+FAN_OUT_BATCH_SIZE = 1000
+
+
+@shared_task(priority=4)
+def fan_out_notification(title, message, user_ids=None, dedup_key=None):
+    """
+    Send the same notification to many users (every active user by default).
+
+    Recipients are walked in primary-key order and inserted in batches. With
+    a ``dedup_key``, users who already have it are skipped, so a retried
+    fan-out doesn't notify anyone twice. Returns the number of recipients.
+    """
+    users = get_user_model().objects.filter(is_active=True).order_by("pk")
+    if user_ids is not None:
+        users = users.filter(pk__in=user_ids)
+
+    sent = 0
+    last_pk = None
+    while True:
+        page = users if last_pk is None else users.filter(pk__gt=last_pk)
+        pks = list(page.values_list("pk", flat=True)[:FAN_OUT_BATCH_SIZE])
+        if not pks:
+            break
+        last_pk = pks[-1]
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    user_id=pk, title=title, message=message, dedup_key=dedup_key
+                )
+                for pk in pks
+            ],
+            ignore_conflicts=True,
+        )
+        sent += len(pks)
+    return sent
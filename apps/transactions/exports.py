@@ -0,0 +1,60 @@
+import csv
+
+from apps.core.encoding import dumps
+
+
+# (column name, queryset lookup) in export order.
+EXPORT_COLUMNS = (
+    ("id", "id"),
+    ("date", "date"),
+    ("transaction_type", "transaction_type"),
+    ("amount", "amount"),
+    ("currency", "currency"),
+    ("account", "account__name"),
+    ("category", "category__name"),
+    ("payment_method", "payment_method"),
+    ("description", "description"),
+    ("notes", "notes"),
+    ("created_at", "created_at"),
+)
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield export rows as tuples using a server-side cursor.
+
+    Only the exported columns are selected and no model instances are built,
+    so memory stays flat regardless of how many rows the user has.
+    """
+    lookups = [lookup for _, lookup in EXPORT_COLUMNS]
+    return queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
+
+
+def iter_csv(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield a CSV document line by line."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for row in export_rows(queryset, chunk_size):
+        yield writer.writerow(row)
+
+
+def iter_ndjson(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield one JSON object per line; amounts are kept as exact strings."""
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for row in export_rows(queryset, chunk_size):
+        yield dumps(dict(zip(names, row))) + b"\n"
+
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", iter_csv),
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+}
@@ -0,0 +1,250 @@
+import codecs
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models import Q
+
+from apps.accounts.models import Account
+from apps.categories.models import Category
+from apps.core.constants import CURRENCY_CHOICES
+from .models import Transaction
+from .services import record_transactions_created
+
+MAX_REPORTED_ERRORS = 100
+MAX_AMOUNT = Decimal(10) ** 13  # Transaction.amount is max_digits=15, 2 dp
+
+# Header spellings seen on bank and mobile money statements.
+HEADER_ALIASES = {
+    "date": ("date", "transaction date", "trans date", "value date", "posted date"),
+    "amount": ("amount", "transaction amount"),
+    "debit": ("debit", "withdrawal", "withdrawals", "money out", "dr"),
+    "credit": ("credit", "deposit", "deposits", "money in", "cr"),
+    "transaction_type": ("transaction_type", "type"),
+    "description": ("description", "narration", "details", "remarks", "memo"),
+    "notes": ("notes",),
+    "category": ("category",),
+    "account": ("account", "account_id"),
+    "currency": ("currency",),
+    "payment_method": ("payment_method", "channel"),
+}
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d-%b-%Y", "%d %b %Y")
+
+PAYMENT_METHOD_BY_ACCOUNT_TYPE = {
+    "bank": "bank_transfer",
+    "mobile_money": "mobile_money",
+    "cash": "cash",
+}
+
+PAYMENT_METHODS = {value for value, _ in Transaction.PAYMENT_METHODS}
+TRANSACTION_TYPES = {value for value, _ in Transaction.TRANSACTION_TYPES}
+CURRENCIES = {value for value, _ in CURRENCY_CHOICES}
+
+
+class StatementError(ValueError):
+    """A statement file that cannot be imported."""
+
+
+class RowError(StatementError):
+    """A statement row that cannot be imported."""
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    skipped: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, line, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+
+class StatementImporter:
+    """
+    Import a CSV bank or mobile money statement for one user.
+
+    The file is parsed row by row. Accounts and categories are preloaded
+    once into in-memory lookups, so validation issues no per-row queries.
+    Valid rows are inserted with ``bulk_create`` in batches, and each batch
+    adjusts account balances once, inside the same database transaction.
+    """
+
+    def __init__(self, user, account=None, batch_size=None):
+        self.user = user
+        self.default_account_id = account.pk if account is not None else None
+        self.batch_size = batch_size or settings.TRANSACTION_IMPORT_BATCH_SIZE
+
+        self.accounts = {
+            str(pk): (pk, account_type, currency)
+            for pk, account_type, currency in Account.objects.filter(
+                user=user
+            ).values_list("pk", "account_type", "currency")
+        }
+        self.categories_by_id = {}
+        self.categories_by_name = {}
+        for pk, name, user_id in Category.objects.filter(
+            Q(is_system=True) | Q(user=user), is_active=True
+        ).values_list("pk", "name", "user_id"):
+            self.categories_by_id[str(pk)] = pk
+            # The user's own category wins over a system one with the same name.
+            key = name.strip().lower()
+            if user_id is not None or key not in self.categories_by_name:
+                self.categories_by_name[key] = pk
+
+    def run(self, stream):
+        """
+        Import from a binary file object and return an ImportResult.
+
+        Works with open files and Django uploads alike; both are consumed
+        line by line, so large statements are never held in memory.
+        """
+        result = ImportResult()
+        reader = csv.reader(codecs.iterdecode(stream, "utf-8-sig"))
+        try:
+            header = next(reader, None)
+            if header is None:
+                return result
+            columns = self._map_header(header)
+
+            batch = []
+            for line, values in enumerate(reader, start=2):
+                if not any(value.strip() for value in values):
+                    continue
+                try:
+                    batch.append(self._build(columns, values))
+                except RowError as e:
+                    result.add_error(line, str(e))
+                    continue
+                if len(batch) >= self.batch_size:
+                    result.created += self._flush(batch)
+                    batch = []
+            if batch:
+                result.created += self._flush(batch)
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Batches already flushed stay committed; report how far we got.
+            raise StatementError(
+                f"Could not read statement after {result.created} rows: {e}"
+            )
+        return result
+
+    def _flush(self, batch):
+        with db_transaction.atomic():
+            created = Transaction.objects.bulk_create(batch)
+            record_transactions_created(created)
+        return len(created)
+
+    def _map_header(self, header):
+        normalized = [name.strip().lower() for name in header]
+        columns = {}
+        for key, aliases in HEADER_ALIASES.items():
+            for alias in aliases:
+                if alias in normalized:
+                    columns[key] = normalized.index(alias)
+                    break
+        if "date" not in columns:
+            raise StatementError("Statement has no date column")
+        if "amount" not in columns and not ({"debit", "credit"} & columns.keys()):
+            raise StatementError("Statement has no amount or debit/credit columns")
+        return columns
+
+    def _build(self, columns, values):
+        def get(key):
+            index = columns.get(key)
+            if index is None or index >= len(values):
+                return ""
+            return values[index].strip()
+
+        account_id, account_type, account_currency = self._account(get("account"))
+        amount, inferred_type = self._amount(get)
+        transaction_type = get("transaction_type").lower() or inferred_type
+        if transaction_type not in TRANSACTION_TYPES:
+            raise RowError(f"Unknown transaction type '{transaction_type}'")
+
+        currency = get("currency").upper() or account_currency
+        if currency not in CURRENCIES:
+            raise RowError(f"Unsupported currency '{currency}'")
+
+        payment_method = get("payment_method").lower() or (
+            PAYMENT_METHOD_BY_ACCOUNT_TYPE.get(account_type, "bank_transfer")
+        )
+        if payment_method not in PAYMENT_METHODS:
+            raise RowError(f"Unknown payment method '{payment_method}'")
+
+        return Transaction(
+            user=self.user,
+            account_id=account_id,
+            category_id=self._category(get("category")),
+            amount=amount,
+            currency=currency,
+            transaction_type=transaction_type,
+            date=self._date(get("date")),
+            description=get("description")[:255],
+            notes=get("notes"),
+            payment_method=payment_method,
+        )
+
+    def _account(self, value):
+        key = value or (
+            str(self.default_account_id) if self.default_account_id else None
+        )
+        if key is None:
+            raise RowError("No account given for row")
+        if key not in self.accounts:
+            raise RowError("Account does not belong to you")
+        return self.accounts[key]
+
+    def _category(self, value):
+        if not value:
+            return None
+        category_id = self.categories_by_id.get(value) or self.categories_by_name.get(
+            value.lower()
+        )
+        if category_id is None:
+            raise RowError(f"Unknown category '{value}'")
+        return category_id
+
+    def _amount(self, get):
+        """Return (absolute amount, inferred transaction type)."""
+        raw = get("amount")
+        if raw:
+            amount = self._decimal(raw)
+            transaction_type = "expense" if amount < 0 else "income"
+        else:
+            debit, credit = get("debit"), get("credit")
+            amount = self._decimal(debit) if debit else Decimal(0)
+            transaction_type = "expense"
+            if not amount and credit:
+                amount = self._decimal(credit)
+                transaction_type = "income"
+        if not amount:
+            raise RowError("Row has no amount")
+        return abs(amount), transaction_type
+
+    @staticmethod
+    def _decimal(value):
+        cleaned = value.replace(",", "").replace("₦", "").replace("NGN", "").strip()
+        negative = cleaned.startswith("(") and cleaned.endswith(")")
+        try:
+            amount = Decimal(cleaned.strip("()"))
+        except InvalidOperation:
+            raise RowError(f"Invalid amount '{value}'")
+        if not amount.is_finite() or amount.as_tuple().exponent < -2:
+            raise RowError(f"Invalid amount '{value}'")
+        if abs(amount) >= MAX_AMOUNT:
+            raise RowError(f"Amount '{value}' is too large")
+        return -amount if negative else amount
+
+    @staticmethod
+    def _date(value):
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(value, date_format).date()
+            except ValueError:
+                continue
+        raise RowError(f"Invalid date '{value}'")
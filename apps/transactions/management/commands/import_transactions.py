@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import Account
+from apps.transactions.imports import StatementError, StatementImporter
+
+
+class Command(BaseCommand):
+    help = "Import transactions for a user from a CSV bank or mobile money statement"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the CSV statement file")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Email of the user the transactions belong to",
+        )
+        parser.add_argument(
+            "--account",
+            help="Account ID used for rows without an account column",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of rows to insert per batch",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(email=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['user']} not found")
+
+        account = None
+        if options["account"]:
+            try:
+                account = Account.objects.get(pk=options["account"], user=user)
+            except (Account.DoesNotExist, ValidationError):
+                raise CommandError(f"Account {options['account']} not found")
+
+        importer = StatementImporter(
+            user, account=account, batch_size=options["batch_size"]
+        )
+        try:
+            with open(options["path"], "rb") as statement:
+                result = importer.run(statement)
+        except (OSError, StatementError) as e:
+            raise CommandError(str(e))
+
+        for error in result.errors:
+            self.stdout.write(
+                self.style.WARNING(f"↻ Line {error['line']}: {error['error']}")
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n✓ Import complete! Created {result.created} transactions, "
+                f"skipped {result.skipped} rows"
+            )
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.11 on 2026-10-17 06:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # Concurrent index builds can't run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0002_initial"),
+        ("categories", "0002_initial"),
+        ("transactions", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "date", "created_at"], name="txn_user_date_created_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "transaction_type", "date"],
+                include=("amount",),
+                name="txn_user_type_date_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "category", "date"], name="txn_user_category_date_idx"
+            ),
+        ),
+    ]
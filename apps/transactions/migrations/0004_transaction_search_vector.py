@@ -0,0 +1,63 @@
+# Generated by Django 5.2.11 on 2026-10-17 06:07
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TABLE = "transactions_transaction"
+
+FORWARD_SQL = [
+    f"""
+    CREATE TRIGGER txn_search_vector_update
+    BEFORE INSERT OR UPDATE OF description, notes ON {TABLE}
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.simple', description, notes)
+    """,
+    f"""
+    UPDATE {TABLE} SET search_vector = to_tsvector(
+        'pg_catalog.simple', coalesce(description, '') || ' ' || coalesce(notes, '')
+    )
+    """,
+    f"CREATE INDEX txn_search_vector_idx ON {TABLE} USING gin (search_vector)",
+    # Matches the UPPER(col::text) LIKE expression Django emits for icontains.
+    f"""
+    CREATE INDEX txn_description_trgm_idx ON {TABLE}
+    USING gin (UPPER(description::text) gin_trgm_ops)
+    """,
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS txn_description_trgm_idx",
+    "DROP INDEX IF EXISTS txn_search_vector_idx",
+    f"DROP TRIGGER IF EXISTS txn_search_vector_update ON {TABLE}",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        # Search falls back to substring matching on other databases.
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0003_transaction_query_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="transaction",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(_run(FORWARD_SQL), _run(REVERSE_SQL)),
+    ]
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 
@@ -44,6 +45,29 @@ class Transaction(UUIDModel, TimeStampedModel):
     description = models.CharField(max_length=255, blank=True)
     notes = models.TextField(blank=True)
     payment_method = models.CharField(max_length=20, choices=PAYMENT_METHODS)
+    # Maintained by a database trigger on PostgreSQL; always NULL elsewhere.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Transaction list: filter by user, order by -date, -created_at.
+            models.Index(
+                fields=["user", "date", "created_at"],
+                name="txn_user_date_created_idx",
+            ),
+            # Analytics and budget sums: user + type + date range. ``amount``
+            # is carried in the index (PostgreSQL INCLUDE) for index-only scans.
+            models.Index(
+                fields=["user", "transaction_type", "date"],
+                include=["amount"],
+                name="txn_user_type_date_idx",
+            ),
+            # Category filters and breakdowns over a date range.
+            models.Index(
+                fields=["user", "category", "date"],
+                name="txn_user_category_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.transaction_type} {self.amount} {self.currency}"
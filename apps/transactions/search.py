@@ -0,0 +1,27 @@
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections
+from django.db.models import Q
+
+# Merchant names and narrations are mixed-language, so no stemming.
+SEARCH_CONFIG = "simple"
+
+
+def search_transactions(queryset, terms):
+    """
+    Filter transactions matching every search term.
+
+    On PostgreSQL each term matches the trigger-maintained ``search_vector``
+    (GIN index) or a substring of the description, which the trigram index
+    serves for partial merchant names. Other databases fall back to
+    case-insensitive substring matching on description and notes.
+    """
+    postgres = connections[queryset.db].vendor == "postgresql"
+    for term in terms:
+        if postgres:
+            condition = Q(search_vector=SearchQuery(term, config=SEARCH_CONFIG)) | Q(
+                description__icontains=term
+            )
+        else:
+            condition = Q(description__icontains=term) | Q(notes__icontains=term)
+        queryset = queryset.filter(condition)
+    return queryset
@@ -0,0 +1,161 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from django.db import transaction as db_transaction
+
+from apps.accounts.services import apply_balance_deltas
+from apps.analytics.services import SnapshotDelta, apply_snapshot_deltas
+from apps.budgets.services import apply_budget_spend_deltas
+from apps.core.cache import bump_data_version
+from .models import Transaction
+
+
+class TransactionEffect(NamedTuple):
+    """
+    The parts of a transaction that derived data (balances, rollups) depend on.
+
+    Snapshots are taken before and after a write so side effects can be
+    applied as deltas instead of recomputing from the full history.
+    """
+
+    user_id: object
+    account_id: object
+    category_id: object
+    transaction_type: str
+    currency: str
+    date: object
+    amount: Decimal
+
+    @classmethod
+    def of(cls, transaction):
+        return cls(
+            user_id=transaction.user_id,
+            account_id=transaction.account_id,
+            category_id=transaction.category_id,
+            transaction_type=transaction.transaction_type,
+            currency=transaction.currency,
+            # Normalised the way the DateField stores it (datetimes -> dates).
+            date=Transaction._meta.get_field("date").to_python(transaction.date),
+            amount=Decimal(transaction.amount),
+        )
+
+    @property
+    def signed_amount(self):
+        """Amount as it affects the account balance (expenses are negative)."""
+        if self.transaction_type == "expense":
+            return -self.amount
+        return self.amount
+
+    @property
+    def snapshot_key(self):
+        """The FinancialSnapshot row this transaction is rolled up into."""
+        return (self.user_id, self.date, self.category_id, self.currency)
+
+    @property
+    def budget_key(self):
+        """The budget allocations this transaction counts against, if any."""
+        return (self.user_id, self.category_id, self.currency, self.date)
+
+
+def _apply_effects(removed=(), added=()):
+    """
+    Move balances, daily rollups and budget spend from ``removed`` to
+    ``added`` effects, raising budget alerts on the way.
+    """
+    balance_deltas = defaultdict(Decimal)
+    snapshot_deltas = defaultdict(SnapshotDelta)
+    spend_deltas = defaultdict(Decimal)
+    for sign, effects in ((-1, removed), (1, added)):
+        for effect in effects:
+            balance_deltas[effect.account_id] += sign * effect.signed_amount
+            snapshot_deltas[effect.snapshot_key].add(
+                effect.transaction_type, sign * effect.amount, sign
+            )
+            if effect.transaction_type == "expense":
+                spend_deltas[effect.budget_key] += sign * effect.amount
+    apply_balance_deltas(balance_deltas)
+    apply_snapshot_deltas(snapshot_deltas)
+    apply_budget_spend_deltas(spend_deltas)
+
+
+def record_transaction_change(
+    before: Optional[TransactionEffect], after: Optional[TransactionEffect]
+):
+    """
+    Apply the side effects of a single transaction write.
+
+    ``before`` is None for creates and ``after`` is None for deletes. Must be
+    called inside the same database transaction as the write itself.
+    """
+    _apply_effects(
+        removed=[before] if before is not None else [],
+        added=[after] if after is not None else [],
+    )
+
+
+def record_transactions_created(transactions):
+    """
+    Apply the side effects of a batch of newly inserted transactions.
+
+    Deltas are summed across the batch so each account and rollup row is
+    updated once, however many transactions it received. Used after
+    ``bulk_create``, which skips ``save()``; must run in the same database
+    transaction as the insert.
+    """
+    effects = [TransactionEffect.of(t) for t in transactions]
+    _apply_effects(added=effects)
+    # bulk_create sends no post_save signals.
+    for user_id in {effect.user_id for effect in effects}:
+        bump_data_version(user_id)
+
+
+def reverse_account_transactions(account):
+    """
+    Reverse the side effects of every transaction on ``account``.
+
+    Deleting an account cascades to its transactions without going through
+    ``delete_transaction``, so their rollups and budget spend are reversed
+    here first. Must be called inside the same database transaction as the
+    delete (the ``pre_delete`` signal is).
+    """
+    transactions = Transaction.objects.select_for_update().filter(account=account)
+    _apply_effects(removed=[TransactionEffect.of(t) for t in transactions])
+
+
+def create_transaction(**fields):
+    """Create a transaction and update the affected balance and rollup."""
+    with db_transaction.atomic():
+        transaction = Transaction.objects.create(**fields)
+        record_transaction_change(None, TransactionEffect.of(transaction))
+    return transaction
+
+
+def update_transaction(transaction, **changes):
+    """
+    Apply ``changes`` to a transaction and move its balance effect.
+
+    The persisted row is re-read under a row lock so the "before" snapshot
+    reflects what the balance actually contains, not a stale instance.
+    """
+    with db_transaction.atomic():
+        current = Transaction.objects.select_for_update().get(pk=transaction.pk)
+        before = TransactionEffect.of(current)
+        for field, value in changes.items():
+            setattr(transaction, field, value)
+        transaction.save()
+        record_transaction_change(before, TransactionEffect.of(transaction))
+    return transaction
+
+
+def delete_transaction(transaction):
+    """Delete a transaction and reverse its balance effect."""
+    with db_transaction.atomic():
+        current = (
+            Transaction.objects.select_for_update().filter(pk=transaction.pk).first()
+        )
+        if current is None:
+            return
+        before = TransactionEffect.of(current)
+        current.delete()
+        record_transaction_change(before, None)
@@ -0,0 +1,48 @@
+from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+
+from apps.accounts.models import Account
+from apps.notifications.models import Notification
+from .imports import StatementError, StatementImporter
+
+
+# Not acked late: a redelivered import would insert its committed batches
+# a second time.
+@shared_task(priority=2, acks_late=False)
+def import_statement(user_id, path, account_id=None, batch_size=None):
+    """
+    Import a statement saved to ``default_storage`` at ``path``.
+
+    The file is deleted afterwards and the user is notified of the outcome.
+    Returns the import result as a dict.
+    """
+    user = get_user_model().objects.get(pk=user_id)
+    account = None
+    if account_id is not None:
+        account = Account.objects.get(pk=account_id, user=user)
+
+    try:
+        with default_storage.open(path, "rb") as stream:
+            result = StatementImporter(user, account, batch_size).run(stream)
+    except StatementError as e:
+        Notification.objects.create(
+            user=user, title="Statement import failed", message=str(e)
+        )
+        return {"created": 0, "skipped": 0, "errors": [{"error": str(e)}]}
+    finally:
+        default_storage.delete(path)
+
+    Notification.objects.create(
+        user=user,
+        title="Statement import finished",
+        message=(
+            f"{result.created} transactions imported, "
+            f"{result.skipped} rows skipped."
+        ),
+    )
+    return {
+        "created": result.created,
+        "skipped": result.skipped,
+        "errors": result.errors,
+    }
@@ -0,0 +1,122 @@
+"""
+Refresh-token blacklist checks without a query per refresh.
+
+SimpleJWT checks every refresh token against ``BlacklistedToken`` with a
+join query. Almost every token it checks is not blacklisted, so each process
+keeps a Bloom filter of the unexpired blacklisted jtis, rebuilt every
+``TOKEN_BLACKLIST_FILTER_REFRESH`` seconds. Tokens blacklisted after a
+filter was built are recorded in the cache under their jti until they
+expire. A jti that is not in the cache and is ruled out by the filter is
+not blacklisted. A filter hit is confirmed against the database.
+
+This only holds if every process sees the same cache (Redis), so a record
+written by one is read by all. ``TOKEN_BLACKLIST_FILTER`` is off without
+``REDIS_URL``, and every check then queries the database as SimpleJWT does.
+
+A generation token in the cache marks which records the filters may rely
+on. If the cache is flushed, the token changes and every process rebuilds
+its filter before answering again. A single record evicted under memory
+pressure leaves the generation alone, so its token is accepted until the
+next rebuild: for up to ``TOKEN_BLACKLIST_FILTER_REFRESH`` seconds after it
+was blacklisted.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from apps.core.bloom import BloomFilter
+from apps.core.cache import get_version
+
+BLACKLIST_GENERATION_KEY = "token-blacklist-generation"
+BLACKLISTED_TOKEN_KEY = "token-blacklisted:{jti}"
+FILTER_ERROR_RATE = 0.001
+# Sizing floor, so a filter built from a handful of tokens isn't mostly set bits.
+FILTER_MIN_CAPACITY = 10000
+
+_lock = threading.Lock()
+_filter = {"generation": None, "built_at": 0.0, "bloom": None}
+
+
+def is_blacklisted(jti):
+    """Whether the refresh token ``jti`` has been blacklisted."""
+    if not settings.TOKEN_BLACKLIST_FILTER:
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    record_key = BLACKLISTED_TOKEN_KEY.format(jti=jti)
+    cached = cache.get_many([BLACKLIST_GENERATION_KEY, record_key])
+    if cached.get(record_key):
+        return True
+
+    generation = cached.get(BLACKLIST_GENERATION_KEY)
+    if generation is None:
+        generation = get_version(BLACKLIST_GENERATION_KEY)
+    if jti not in _get_filter(generation):
+        return False
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+def record_blacklisted(jti, expires_at):
+    """Publish a newly blacklisted ``jti`` to every process once it commits."""
+    if not settings.TOKEN_BLACKLIST_FILTER:
+        return
+    timeout = int((expires_at - timezone.now()).total_seconds())
+    if timeout > 0:
+        db_transaction.on_commit(
+            lambda: cache.set(BLACKLISTED_TOKEN_KEY.format(jti=jti), True, timeout),
+            robust=True,
+        )
+
+
+def prune_expired_tokens(batch_size=1000):
+    """
+    Delete expired outstanding tokens and their blacklist entries in batches.
+
+    Each batch is deleted on its own, so a large backlog never holds long
+    locks on the token tables. SimpleJWT's ``flushexpiredtokens`` deletes
+    everything in one statement. Returns the number of outstanding tokens
+    deleted.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+    deleted = 0
+    while True:
+        pks = list(expired.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return deleted
+        # Blacklist entries go with their token (on_delete=CASCADE).
+        _, counts = OutstandingToken.objects.filter(pk__in=pks).delete()
+        deleted += counts.get(OutstandingToken._meta.label, 0)
+
+
+def _get_filter(generation):
+    refresh = settings.TOKEN_BLACKLIST_FILTER_REFRESH
+    if _is_current(generation, refresh):
+        return _filter["bloom"]
+    with _lock:
+        if not _is_current(generation, refresh):
+            _filter.update(
+                generation=generation, built_at=time.monotonic(), bloom=_build()
+            )
+        return _filter["bloom"]
+
+
+def _is_current(generation, refresh):
+    return (
+        _filter["generation"] == generation
+        and time.monotonic() - _filter["built_at"] < refresh
+    )
+
+
+def _build():
+    live = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+    bloom = BloomFilter(max(live.count(), FILTER_MIN_CAPACITY), FILTER_ERROR_RATE)
+    bloom.update(live.values_list("token__jti", flat=True).iterator())
+    return bloom
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import invalidate_token_users
+from .blacklist import record_blacklisted
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_token_users(sender, instance, **kwargs):
+    """Saves cover deactivation and password changes as well as profile edits."""
+    invalidate_token_users(instance.pk)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def publish_blacklisted_token(sender, instance, created, **kwargs):
+    """Rotation, logout and the admin all blacklist through this model."""
+    if created:
+        record_blacklisted(instance.token.jti, instance.token.expires_at)
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .blacklist import prune_expired_tokens
+
+
+@shared_task(priority=9)
+def prune_token_blacklist(batch_size=1000):
+    """Delete expired refresh tokens; returns the number deleted."""
+    return prune_expired_tokens(batch_size=batch_size)
@@ -0,0 +1,20 @@
+"""
+Celery application for PersoniFi.
+
+Tasks are routed to separate queues so slow analytics jobs can't starve
+user-facing work (see ``CELERY_TASK_ROUTES``). Run one worker pool per
+class of work, for example::
+
+    celery -A config worker -Q user,notifications,default -l info
+    celery -A config worker -Q analytics --concurrency 2 -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -146,9 +146,18 @@ SOCIALACCOUNT_PROVIDERS = {
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.v1.rest.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.v1.rest.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 50,
     "DEFAULT_FILTER_BACKENDS": (
@@ -168,6 +177,10 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
 }
 
+# Seconds between rebuilds of each process's blacklisted refresh-token
+# filter; tokens blacklisted in between are looked up in the cache.
+TOKEN_BLACKLIST_FILTER_REFRESH = int(os.getenv("TOKEN_BLACKLIST_FILTER_REFRESH", "300"))
+
 DJ_REST_AUTH = {
     "USE_JWT": True,
     "JWT_AUTH_COOKIE": "personifi-auth",
@@ -176,7 +189,28 @@ DJ_REST_AUTH = {
 
 GRAPHENE = {
     "SCHEMA": "api.v1.graphql.schema.schema",
-    "MIDDLEWARE": ["graphql_jwt.middleware.JSONWebTokenMiddleware"],
+    "RELAY_CONNECTION_MAX_LIMIT": 100,
+    "MIDDLEWARE": [
+        "api.v1.graphql.loaders.DataLoaderMiddleware",
+    ],
+}
+
+# Parsed, validated GraphQL documents kept per process, by query hash. With
+# an allow-list (a JSON file mapping SHA-256 hashes to queries), only the
+# listed operations are accepted.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("GRAPHQL_DOCUMENT_CACHE_SIZE", "500"))
+GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST = os.getenv("GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST")
+
+# Static GraphQL query limits, checked before execution. A field costs 1 if
+# it selects an object (scalars are free) unless weighted here; nested
+# selections multiply by a connection's page size or, for plain lists, by
+# GRAPHQL_LIST_SIZE_ESTIMATE.
+GRAPHQL_MAX_QUERY_COST = int(os.getenv("GRAPHQL_MAX_QUERY_COST", "5000"))
+GRAPHQL_MAX_QUERY_DEPTH = int(os.getenv("GRAPHQL_MAX_QUERY_DEPTH", "10"))
+GRAPHQL_LIST_SIZE_ESTIMATE = 20
+GRAPHQL_FIELD_COSTS = {
+    "Query.dashboard": 10,
+    "BudgetType.progress": 5,
 }
 
 SPECTACULAR_SETTINGS = {
@@ -318,9 +352,65 @@ else:
         }
     }
 
+# The blacklist filter relies on every process seeing the same cache; with a
+# per-process cache each check goes to the database instead.
+TOKEN_BLACKLIST_FILTER = bool(REDIS_URL)
+
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
+# Without a broker (local development, tests) tasks run inline.
+CELERY_TASK_ALWAYS_EAGER = (
+    os.getenv("CELERY_TASK_ALWAYS_EAGER", "" if REDIS_URL else "true").lower() == "true"
+)
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "apps.transactions.tasks.*": {"queue": "user"},
+    "apps.notifications.tasks.*": {"queue": "notifications"},
+    "apps.analytics.tasks.*": {"queue": "analytics"},
+    "apps.accounts.tasks.*": {"queue": "analytics"},
+    "apps.users.tasks.*": {"queue": "analytics"},
+}
+# Redis emulates priorities with one list per step; 0 is consumed first.
+CELERY_TASK_DEFAULT_PRIORITY = 5
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+CELERY_BEAT_SCHEDULE = {
+    "reconcile-balances": {
+        "task": "apps.accounts.tasks.reconcile_account_balances",
+        "schedule": timedelta(days=1),
+    },
+    "prune-token-blacklist": {
+        "task": "apps.users.tasks.prune_token_blacklist",
+        "schedule": timedelta(days=1),
+    },
+}
 
 DEFAULT_CURRENCY = "NGN"
 SUPPORTED_CURRENCIES = ["NGN", "USD"]
 SUPPORTED_COUNTRIES = ["NG"]
+
+TRANSACTION_IMPORT_BATCH_SIZE = int(os.getenv("TRANSACTION_IMPORT_BATCH_SIZE", "1000"))
+
+# Entries are invalidated by per-user data versions; the timeout only bounds
+# how long superseded entries linger.
+ANALYTICS_CACHE_TIMEOUT = int(os.getenv("ANALYTICS_CACHE_TIMEOUT", "3600"))
+
+# Dashboard sections run concurrently on one shared pool per process, which
+# also bounds the extra database connections it holds. Each section has its
+# own cache timeout in seconds; 0 disables caching for that section.
+DASHBOARD_MAX_WORKERS = int(os.getenv("DASHBOARD_MAX_WORKERS", "4"))
+DASHBOARD_CACHE_TIMEOUTS = {
+    "accounts": 300,
+    "net_worth": 300,
+    "income_vs_expenses": 900,
+    "budgets": 300,
+    "goals": 900,
+    # Marking notifications read doesn't bump the data version.
+    "notifications": 0,
+}
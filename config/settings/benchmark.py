@@ -0,0 +1,9 @@
+import dj_database_url
+
+from .testing import *  # noqa: F401,F403
+
+# The test settings pin in-memory SQLite; benchmarks that compare query plans
+# need the database DATABASE_URL names (PostgreSQL for the index benchmarks).
+DATABASES = {
+    "default": dj_database_url.config(default="sqlite://:memory:", conn_max_age=0)
+}
@@ -0,0 +1,117 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from apps.core.cache import bump_data_version, get_data_version
+from tests.factories import AccountFactory, BudgetFactory
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestAnalyticsCache:
+    """Test suite for per-user versioned analytics caching."""
+
+    def _expenses(self, client):
+        url = reverse("analytics-income-vs-expenses")
+        return Decimal(client.get(url).json()["expenses"])
+
+    def test_repeat_request_is_served_from_cache(self, authenticated_api_client):
+        """Test a repeated request skips the rollup query."""
+        url = reverse("analytics-spending-trends")
+        authenticated_api_client.get(url, {"days": 7})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_api_client.get(url, {"days": 7})
+
+        assert response.status_code == 200
+        assert not any(
+            "analytics_financialsnapshot" in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_query_params_are_part_of_key(self, authenticated_api_client):
+        """Test different query strings are cached separately."""
+        url = reverse("analytics-spending-trends")
+        authenticated_api_client.get(url, {"days": 7})
+
+        with CaptureQueriesContext(connection) as queries:
+            authenticated_api_client.get(url, {"days": 30})
+
+        assert any(
+            "analytics_financialsnapshot" in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_key_rolls_over_at_local_midnight(self, api_client, auth_user):
+        """Test a cached window isn't served once the local date changes."""
+        from freezegun import freeze_time
+
+        api_client.force_authenticate(auth_user)
+        url = reverse("analytics-spending-trends")
+        # 23:50 and 00:10 in Lagos (UTC+1), both on the same UTC date.
+        with freeze_time("2026-03-01 22:50:00"):
+            assert api_client.get(url).status_code == 200
+        with freeze_time("2026-03-01 23:10:00"):
+            with CaptureQueriesContext(connection) as queries:
+                assert api_client.get(url).status_code == 200
+
+        assert any(
+            "analytics_financialsnapshot" in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_transaction_write_invalidates(
+        self, authenticated_api_client, auth_user, django_capture_on_commit_callbacks
+    ):
+        """Test a transaction write makes the next request recompute."""
+        account = AccountFactory(user=auth_user)
+        assert self._expenses(authenticated_api_client) == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_api_client.post(
+                reverse("transaction-list"),
+                {
+                    "account": str(account.id),
+                    "amount": "250.00",
+                    "transaction_type": "expense",
+                    "payment_method": "cash",
+                    "date": str(timezone.now().date()),
+                },
+                format="json",
+            )
+
+        assert self._expenses(authenticated_api_client) == Decimal("250")
+
+    def test_account_and_budget_writes_bump_version(
+        self, auth_user, django_capture_on_commit_callbacks
+    ):
+        """Test account and budget saves bump the owner's data version."""
+        version = get_data_version(auth_user.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account = AccountFactory(user=auth_user)
+        assert get_data_version(auth_user.pk) != version
+        version = get_data_version(auth_user.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetFactory(user=auth_user)
+        assert get_data_version(auth_user.pk) != version
+        version = get_data_version(auth_user.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account.balance = Decimal("1")
+            account.save()
+        assert get_data_version(auth_user.pk) != version
+
+    def test_bump_waits_for_commit(self, auth_user, django_capture_on_commit_callbacks):
+        """Test the version only changes once the write commits."""
+        version = get_data_version(auth_user.pk)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            bump_data_version(auth_user.pk)
+            assert get_data_version(auth_user.pk) == version
+
+        callbacks[0]()
+        assert get_data_version(auth_user.pk) != version
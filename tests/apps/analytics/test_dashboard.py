@@ -0,0 +1,149 @@
+import threading
+import pytest
+from decimal import Decimal
+from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from apps.analytics import dashboard
+from apps.analytics.dashboard import build_dashboard
+from tests.factories import (
+    AccountFactory,
+    BudgetCategoryFactory,
+    BudgetFactory,
+    GoalFactory,
+    NotificationFactory,
+    UserFactory,
+)
+
+
+def _tables(queries):
+    return " ".join(query["sql"] for query in queries.captured_queries)
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestDashboardAPI:
+    """Test suite for the unified dashboard endpoint."""
+
+    def test_dashboard_sections(self, authenticated_api_client, auth_user):
+        """Test one request returns every home screen section."""
+        AccountFactory(user=auth_user, currency="NGN", balance=Decimal("1500"))
+        AccountFactory(user=auth_user, is_active=False)
+        BudgetCategoryFactory(budget=BudgetFactory(user=auth_user))
+        GoalFactory(user=auth_user, is_achieved=False)
+        GoalFactory(user=auth_user, is_achieved=True)
+        NotificationFactory(user=auth_user, is_read=False)
+        NotificationFactory(user=auth_user, is_read=True)
+
+        response = authenticated_api_client.get(reverse("dashboard-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["accounts"]) == 1
+        assert data["net_worth"] == {
+            "by_currency": {"NGN": 1500.0},
+            "accounts_count": 1,
+        }
+        assert data["income_vs_expenses"]["net"] == 0
+        assert len(data["budgets"]) == 1
+        assert len(data["budgets"][0]["categories"]) == 1
+        assert len(data["goals"]) == 1
+        assert data["notifications"]["unread_count"] == 1
+        assert len(data["notifications"]["latest"]) == 1
+
+    def test_sections_filter(self, authenticated_api_client):
+        """Test ?sections= limits the response and rejects unknown names."""
+        url = reverse("dashboard-list")
+
+        response = authenticated_api_client.get(url, {"sections": "goals,net_worth"})
+        invalid = authenticated_api_client.get(url, {"sections": "goals,weather"})
+
+        assert set(response.json()) == {"goals", "net_worth"}
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_sections_are_cached_separately(
+        self, authenticated_api_client, auth_user, django_capture_on_commit_callbacks
+    ):
+        """Test cached sections skip their queries until the user's data changes."""
+        account = AccountFactory(user=auth_user)
+        url = reverse("dashboard-list")
+        authenticated_api_client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            authenticated_api_client.get(url)
+
+        # Notifications are never cached; every other section is.
+        assert "notifications_notification" in _tables(queries)
+        for table in ("accounts_account", "budgets_budget", "goals_goal"):
+            assert table not in _tables(queries)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account.name = "Renamed"
+            account.save()
+        response = authenticated_api_client.get(url)
+
+        assert response.json()["accounts"][0]["name"] == "Renamed"
+
+    def test_windowed_sections_roll_over_at_midnight(self, auth_user):
+        """Test windowed sections are recomputed once the local date changes."""
+        from datetime import datetime, timezone as dt_timezone
+
+        def at(hour, minute):
+            moment = datetime(2026, 3, 1, hour, minute, tzinfo=dt_timezone.utc)
+            return patch("django.utils.timezone.now", return_value=moment)
+
+        sections = {"income_vs_expenses", "goals"}
+        # 23:50 on 1 March, then 00:10 on 2 March, in Lagos (UTC+1).
+        with at(22, 50):
+            build_dashboard(auth_user, sections)
+        with at(23, 10), CaptureQueriesContext(connection) as queries:
+            build_dashboard(auth_user, sections)
+
+        assert "analytics_financialsnapshot" in _tables(queries)
+        assert "goals_goal" not in _tables(queries)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDashboardConcurrency:
+    """Test suite for building dashboard sections on the thread pool."""
+
+    def test_sections_run_on_pool(self, settings):
+        """Test uncached sections run concurrently outside a transaction."""
+        settings.DASHBOARD_CACHE_TIMEOUTS = {}
+        user = UserFactory()
+        AccountFactory(user=user, balance=Decimal("10"))
+        threads = set()
+
+        def record(name):
+            section = dashboard.SECTIONS[name]
+
+            def wrapper(user):
+                threads.add(threading.current_thread().name)
+                return section(user)
+
+            return wrapper
+
+        with patch.dict(
+            dashboard.SECTIONS, {name: record(name) for name in dashboard.SECTIONS}
+        ):
+            data = build_dashboard(user)
+
+        assert list(data) == list(dashboard.SECTIONS)
+        assert data["net_worth"]["accounts_count"] == 1
+        assert all(name.startswith("dashboard") for name in threads)
+
+    def test_sections_run_inline_in_transaction(self, settings):
+        """Test a caller inside a transaction computes sections itself."""
+        from django.db import transaction
+
+        settings.DASHBOARD_CACHE_TIMEOUTS = {}
+        user = UserFactory()
+
+        with transaction.atomic():
+            AccountFactory(user=user)
+            data = build_dashboard(user, ["accounts", "net_worth"])
+
+        assert len(data["accounts"]) == 1
+        assert data["net_worth"]["accounts_count"] == 1
@@ -21,6 +21,7 @@ def financial_snapshot_factories():
             date = timezone.now().date()
 
         return FinancialSnapshot.objects.create(
+            user=UserFactory(),
             created_for_date=date,
             total_income=income,
             total_expense=expense,
@@ -33,9 +34,10 @@ def financial_snapshot_factories():
 class TestFinancialSnapshot:
     """Test suite for FinancialSnapshot model."""
 
-    def test_snapshot_creation(self):
+    def test_snapshot_creation(self, user):
         """Test creating a financial snapshot."""
         snapshot = FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=timezone.now().date(),
             total_income=Decimal("50000"),
             total_expense=Decimal("30000"),
@@ -44,30 +46,32 @@ class TestFinancialSnapshot:
         assert snapshot.total_income == Decimal("50000")
         assert snapshot.total_expense == Decimal("30000")
 
-    def test_snapshot_str_representation(self):
+    def test_snapshot_str_representation(self, user):
         """Test snapshot string representation."""
         date = timezone.now().date()
         snapshot = FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=date,
             total_income=Decimal("50000"),
             total_expense=Decimal("30000"),
         )
         assert str(snapshot) == str(date)
 
-    def test_snapshot_date_field(self):
+    def test_snapshot_date_field(self, user):
         """Test snapshot date field."""
         date = timezone.now().date()
         snapshot = FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=date,
             total_income=Decimal("50000"),
             total_expense=Decimal("30000"),
         )
         assert snapshot.created_for_date == date
 
-    def test_snapshot_default_amounts(self):
+    def test_snapshot_default_amounts(self, user):
         """Test snapshot default amounts are zero."""
         snapshot = FinancialSnapshot.objects.create(
-            created_for_date=timezone.now().date()
+            user=user, created_for_date=timezone.now().date()
         )
         assert snapshot.total_income == Decimal("0")
         assert snapshot.total_expense == Decimal("0")
@@ -77,12 +81,13 @@ class TestFinancialSnapshot:
 class TestAnalyticsCalculations:
     """Test suite for analytics calculations."""
 
-    def test_net_income_calculation(self):
+    def test_net_income_calculation(self, user):
         """Test calculating net income from snapshots."""
         income = Decimal("100000")
         expense = Decimal("60000")
 
         snapshot = FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=timezone.now().date(),
             total_income=income,
             total_expense=expense,
@@ -91,12 +96,13 @@ class TestAnalyticsCalculations:
         net = snapshot.total_income - snapshot.total_expense
         assert net == Decimal("40000")
 
-    def test_expense_ratio(self):
+    def test_expense_ratio(self, user):
         """Test calculating expense ratio."""
         income = Decimal("100000")
         expense = Decimal("30000")
 
         snapshot = FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=timezone.now().date(),
             total_income=income,
             total_expense=expense,
@@ -105,12 +111,13 @@ class TestAnalyticsCalculations:
         ratio = (snapshot.total_expense / snapshot.total_income) * 100
         assert ratio == Decimal("30")
 
-    def test_savings_rate(self):
+    def test_savings_rate(self, user):
         """Test calculating savings rate."""
         income = Decimal("100000")
         expense = Decimal("70000")
 
         snapshot = FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=timezone.now().date(),
             total_income=income,
             total_expense=expense,
@@ -125,27 +132,30 @@ class TestAnalyticsCalculations:
 class TestSnapshotQuerySet:
     """Test suite for FinancialSnapshot QuerySet."""
 
-    def test_snapshot_count(self):
+    def test_snapshot_count(self, user):
         """Test counting snapshots."""
         today = timezone.now().date()
         for i in range(5):
             FinancialSnapshot.objects.create(
+                user=user,
                 created_for_date=today - timedelta(days=i),
                 total_income=Decimal("50000"),
                 total_expense=Decimal("30000"),
             )
         assert FinancialSnapshot.objects.count() == 5
 
-    def test_filter_snapshots_by_date(self):
+    def test_filter_snapshots_by_date(self, user):
         """Test filtering snapshots by date."""
         today = timezone.now().date()
         yesterday = today - timedelta(days=1)
 
         FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=today,
             total_income=Decimal("50000"),
         )
         FinancialSnapshot.objects.create(
+            user=user,
             created_for_date=yesterday,
             total_income=Decimal("40000"),
         )
@@ -153,13 +163,14 @@ class TestSnapshotQuerySet:
         today_snapshot = FinancialSnapshot.objects.filter(created_for_date=today)
         assert today_snapshot.count() == 1
 
-    def test_filter_snapshots_by_date_range(self):
+    def test_filter_snapshots_by_date_range(self, user):
         """Test filtering snapshots by date range."""
         today = timezone.now().date()
         start_date = today - timedelta(days=7)
 
         for i in range(10):
             FinancialSnapshot.objects.create(
+                user=user,
                 created_for_date=today - timedelta(days=i),
                 total_income=Decimal("50000"),
             )
@@ -169,13 +180,17 @@ class TestSnapshotQuerySet:
         )
         assert recent.count() > 0
 
-    def test_order_snapshots_chronologically(self):
+    def test_order_snapshots_chronologically(self, user):
         """Test ordering snapshots chronologically."""
         today = timezone.now().date()
 
-        FinancialSnapshot.objects.create(created_for_date=today)
-        FinancialSnapshot.objects.create(created_for_date=today - timedelta(days=1))
-        FinancialSnapshot.objects.create(created_for_date=today - timedelta(days=2))
+        FinancialSnapshot.objects.create(user=user, created_for_date=today)
+        FinancialSnapshot.objects.create(
+            user=user, created_for_date=today - timedelta(days=1)
+        )
+        FinancialSnapshot.objects.create(
+            user=user, created_for_date=today - timedelta(days=2)
+        )
 
         ordered = FinancialSnapshot.objects.order_by("created_for_date")
         dates = [snap.created_for_date for snap in ordered]
@@ -250,17 +265,17 @@ class TestAnalyticsWithTransactions:
 class TestSnapshotTimestamps:
     """Test suite for snapshot timestamps."""
 
-    def test_snapshot_created_timestamp(self):
+    def test_snapshot_created_timestamp(self, user):
         """Test snapshot creation timestamp."""
         snapshot = FinancialSnapshot.objects.create(
-            created_for_date=timezone.now().date()
+            user=user, created_for_date=timezone.now().date()
         )
         assert snapshot.created_at is not None
 
-    def test_snapshot_updated_timestamp(self):
+    def test_snapshot_updated_timestamp(self, user):
         """Test snapshot updated timestamp."""
         snapshot = FinancialSnapshot.objects.create(
-            created_for_date=timezone.now().date()
+            user=user, created_for_date=timezone.now().date()
         )
         original_updated = snapshot.updated_at
 
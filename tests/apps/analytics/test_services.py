@@ -0,0 +1,240 @@
+import pytest
+from unittest.mock import patch
+from decimal import Decimal
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from apps.analytics.models import FinancialSnapshot
+from apps.analytics.services import rebuild_snapshots
+from apps.analytics.tasks import backfill_snapshots
+from apps.transactions.services import (
+    create_transaction,
+    update_transaction,
+    delete_transaction,
+)
+from tests.factories import (
+    AccountFactory,
+    TransactionCategoryFactory,
+    TransactionFactory,
+    UserFactory,
+)
+
+
+def _create(user, account, amount, transaction_type="expense", **extra):
+    extra.setdefault("date", timezone.now().date())
+    return create_transaction(
+        user=user,
+        account=account,
+        amount=Decimal(amount),
+        currency="NGN",
+        transaction_type=transaction_type,
+        payment_method="cash",
+        **extra,
+    )
+
+
+def _rollup(user):
+    return {
+        (row.created_for_date, row.category_id, row.currency): (
+            row.total_income,
+            row.total_expense,
+            row.income_count,
+            row.expense_count,
+        )
+        for row in FinancialSnapshot.objects.filter(user=user)
+        if row.income_count or row.expense_count
+    }
+
+
+@pytest.mark.django_db
+class TestSnapshotRollup:
+    """Test suite for incremental FinancialSnapshot maintenance."""
+
+    def test_writes_maintain_rollup(self, auth_user):
+        """Test create, update and delete move totals between rollup rows."""
+        account = AccountFactory(user=auth_user)
+        food = TransactionCategoryFactory(user=auth_user)
+        today = timezone.now().date()
+        yesterday = today - timedelta(days=1)
+
+        first = _create(auth_user, account, "1000", category=food)
+        _create(auth_user, account, "500", category=food)
+        _create(auth_user, account, "9000", "income")
+        assert _rollup(auth_user) == {
+            (today, food.id, "NGN"): (Decimal("0"), Decimal("1500"), 0, 2),
+            (today, None, "NGN"): (Decimal("9000"), Decimal("0"), 1, 0),
+        }
+
+        update_transaction(first, date=yesterday, category=None)
+        assert _rollup(auth_user) == {
+            (today, food.id, "NGN"): (Decimal("0"), Decimal("500"), 0, 1),
+            (today, None, "NGN"): (Decimal("9000"), Decimal("0"), 1, 0),
+            (yesterday, None, "NGN"): (Decimal("0"), Decimal("1000"), 0, 1),
+        }
+
+        delete_transaction(first)
+        assert (yesterday, None, "NGN") not in _rollup(auth_user)
+
+    def test_category_delete_folds_into_uncategorized(self, auth_user):
+        """Test deleting a category keeps its totals as uncategorized."""
+        account = AccountFactory(user=auth_user)
+        food = TransactionCategoryFactory(user=auth_user)
+        today = timezone.now().date()
+        _create(auth_user, account, "700", category=food)
+        _create(auth_user, account, "300")
+
+        food.delete()
+
+        assert _rollup(auth_user) == {
+            (today, None, "NGN"): (Decimal("0"), Decimal("1000"), 0, 2),
+        }
+
+    def test_account_delete_reverses_its_transactions(
+        self, authenticated_api_client, auth_user
+    ):
+        """Test deleting an account takes its transactions out of rollups and budgets."""
+        from tests.factories import BudgetCategoryFactory
+
+        account = AccountFactory(user=auth_user)
+        allocation = BudgetCategoryFactory(budget__user=auth_user)
+        _create(auth_user, account, "100", category=allocation.category)
+
+        response = authenticated_api_client.delete(
+            reverse("account-detail", args=[account.id])
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert _rollup(auth_user) == {}
+        allocation.refresh_from_db()
+        assert allocation.spent == 0
+
+    def test_rebuild_matches_incremental(self, auth_user):
+        """Test a backfill reproduces the incrementally maintained rollup."""
+        account = AccountFactory(user=auth_user)
+        category = TransactionCategoryFactory(user=auth_user)
+        for days, amount in enumerate(["100", "250", "75"]):
+            _create(
+                auth_user,
+                account,
+                amount,
+                category=category,
+                date=timezone.now().date() - timedelta(days=days),
+            )
+        _create(auth_user, account, "5000", "income")
+        expected = _rollup(auth_user)
+
+        FinancialSnapshot.objects.all().delete()
+        list(rebuild_snapshots(get_user_model().objects.all()))
+
+        assert _rollup(auth_user) == expected
+
+    def test_backfill_command_resumes(self, auth_user):
+        """Test the backfill command skips users before --start-after."""
+        other = UserFactory()
+        first, second = sorted([auth_user, other], key=lambda user: user.pk)
+        TransactionFactory(user=first, currency="NGN")
+        TransactionFactory(user=second, currency="NGN")
+
+        call_command("backfill_snapshots", start_after=str(first.pk), chunk_size=1)
+
+        assert not FinancialSnapshot.objects.filter(user=first).exists()
+        assert FinancialSnapshot.objects.filter(user=second).exists()
+
+    def test_backfill_task_continues_in_new_tasks(self, auth_user):
+        """Test the backfill task re-enqueues itself until every user is done."""
+        users = [auth_user, UserFactory(), UserFactory()]
+        for user in users:
+            TransactionFactory(user=user, currency="NGN")
+        FinancialSnapshot.objects.all().delete()
+
+        with patch.object(
+            backfill_snapshots, "delay", wraps=backfill_snapshots.delay
+        ) as delay:
+            backfill_snapshots.delay(chunk_size=1, chunks_per_task=1)
+
+        # Each run rebuilds one user and hands the rest to the next run.
+        assert delay.call_count == 4
+        assert [call.kwargs.get("start_after") for call in delay.call_args_list] == [
+            None,
+            *sorted(user.pk for user in users),
+        ]
+        for user in users:
+            assert FinancialSnapshot.objects.filter(user=user).exists()
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestAnalyticsAPI:
+    """Test suite for analytics endpoints backed by the rollup."""
+
+    def test_actions_read_rollup(self, authenticated_api_client, auth_user):
+        """Test analytics actions aggregate snapshots, not transactions."""
+        account = AccountFactory(user=auth_user)
+        rent = TransactionCategoryFactory(user=auth_user, name="Rent")
+        today = timezone.now().date()
+        _create(auth_user, account, "20000", "income")
+        _create(auth_user, account, "3000", category=rent)
+        _create(auth_user, account, "2000", category=rent)
+
+        with CaptureQueriesContext(connection) as queries:
+            trends = authenticated_api_client.get(
+                reverse("analytics-spending-trends")
+            ).json()
+            breakdown = authenticated_api_client.get(
+                reverse("analytics-category-breakdown")
+            ).json()
+            comparison = authenticated_api_client.get(
+                reverse("analytics-income-vs-expenses")
+            ).json()
+            monthly = authenticated_api_client.get(reverse("analytics-monthly-summary"))
+
+        assert monthly.status_code == status.HTTP_200_OK
+        # Decimal sums render as exact strings.
+        assert trends == [{"day": str(today), "total": "5000", "count": 2}]
+        assert breakdown == [{"category__name": "Rent", "total": "5000", "count": 2}]
+        assert Decimal(comparison["net"]) == Decimal("15000")
+        assert monthly.json()[-1]["net"] == 15000.0
+        assert not any(
+            "transactions_transaction" in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_currency_filter(self, authenticated_api_client, auth_user):
+        """Test ?currency= narrows analytics to one currency."""
+        account = AccountFactory(user=auth_user)
+        _create(auth_user, account, "100")
+        create_transaction(
+            user=auth_user,
+            account=account,
+            amount=Decimal("7"),
+            currency="USD",
+            transaction_type="expense",
+            payment_method="card",
+            date=timezone.now().date(),
+        )
+
+        url = reverse("analytics-income-vs-expenses")
+        response = authenticated_api_client.get(url, {"currency": "USD"})
+        assert Decimal(response.json()["expenses"]) == Decimal("7")
+
+    def test_emptied_window_matches_transaction_queries(
+        self, authenticated_api_client, auth_user
+    ):
+        """Test zeroed rollup rows read like no transactions at all."""
+        account = AccountFactory(user=auth_user)
+        delete_transaction(_create(auth_user, account, "100"))
+
+        comparison = authenticated_api_client.get(
+            reverse("analytics-income-vs-expenses")
+        ).json()
+        monthly = authenticated_api_client.get(
+            reverse("analytics-monthly-summary")
+        ).json()
+
+        assert comparison == {"income": 0, "expenses": 0, "net": 0, "savings_rate": 0}
+        assert monthly == []
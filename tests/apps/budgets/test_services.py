@@ -0,0 +1,282 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from django.db import transaction as db_transaction
+from django.urls import reverse
+from apps.budgets.services import budget_progress
+from apps.notifications.models import Notification
+from apps.transactions.models import Transaction
+from apps.transactions.services import (
+    create_transaction,
+    delete_transaction,
+    record_transactions_created,
+    update_transaction,
+)
+from tests.factories import (
+    AccountFactory,
+    BudgetCategoryFactory,
+    BudgetFactory,
+    TransactionCategoryFactory,
+    TransactionFactory,
+)
+
+
+def _spend(user, account, amount, day, category=None, currency="NGN"):
+    return create_transaction(
+        user=user,
+        account=account,
+        category=category,
+        amount=Decimal(amount),
+        currency=currency,
+        transaction_type="expense",
+        payment_method="cash",
+        date=day,
+    )
+
+
+def _budget(user, **kwargs):
+    return BudgetFactory(
+        user=user,
+        start_date=date(2024, 3, 1),
+        end_date=date(2024, 3, 31),
+        total_amount=Decimal("1000"),
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestBudgetProgress:
+    """Test suite for the budget progress engine."""
+
+    def test_spend_per_allocation(self, auth_user):
+        """Test spend is split by category and limited to the budget window."""
+        account = AccountFactory(user=auth_user)
+        food = TransactionCategoryFactory(user=auth_user, category_type="expense")
+        rent = TransactionCategoryFactory(user=auth_user, category_type="expense")
+        other = TransactionCategoryFactory(user=auth_user, category_type="expense")
+        budget = _budget(auth_user)
+        food_allocation = BudgetCategoryFactory(
+            budget=budget, category=food, allocated_amount=Decimal("200")
+        )
+        BudgetCategoryFactory(
+            budget=budget, category=rent, allocated_amount=Decimal("500")
+        )
+
+        _spend(auth_user, account, "150", date(2024, 3, 2), food)
+        _spend(auth_user, account, "10", date(2024, 3, 31), food)
+        _spend(auth_user, account, "400", date(2024, 3, 15), rent)
+        _spend(auth_user, account, "999", date(2024, 4, 1), food)  # After the end
+        _spend(auth_user, account, "999", date(2024, 3, 3), other)  # Unallocated
+        _spend(auth_user, account, "999", date(2024, 3, 3), food, currency="USD")
+
+        progress = budget_progress([budget])[budget.pk]
+
+        assert progress.spent == Decimal("560")
+        assert progress.remaining == Decimal("440")
+        assert progress.percentage_used == Decimal("56.00")
+        by_category = {item.budget_category.pk: item for item in progress.categories}
+        assert by_category[food_allocation.pk].spent == Decimal("160")
+        assert by_category[food_allocation.pk].percentage_used == Decimal("80.00")
+
+    def test_budget_without_allocations_counts_all_expenses(self, auth_user):
+        """Test a budget with no categories tracks every expense."""
+        account = AccountFactory(user=auth_user)
+        budget = _budget(auth_user)
+
+        _spend(auth_user, account, "120", date(2024, 3, 5))
+        _spend(
+            auth_user,
+            account,
+            "80",
+            date(2024, 3, 6),
+            TransactionCategoryFactory(user=auth_user),
+        )
+
+        assert budget_progress([budget])[budget.pk].spent == Decimal("200")
+
+    def test_many_budgets_in_constant_queries(
+        self, auth_user, django_assert_num_queries
+    ):
+        """Test progress for any number of budgets costs two queries."""
+        account = AccountFactory(user=auth_user)
+        budgets = []
+        for month in range(1, 6):
+            budget = BudgetFactory(
+                user=auth_user,
+                start_date=date(2024, month, 1),
+                end_date=date(2024, month, 28),
+            )
+            allocation = BudgetCategoryFactory(budget=budget)
+            _spend(
+                auth_user, account, "100", date(2024, month, 10), allocation.category
+            )
+            budgets.append(budget)
+
+        with django_assert_num_queries(2):
+            progress = budget_progress(budgets)
+
+        assert [progress[budget.pk].spent for budget in budgets] == [Decimal("100")] * 5
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestBudgetProgressAPI:
+    """Test suite for budget progress over REST."""
+
+    def test_progress_action_lists_active_budgets(
+        self, authenticated_api_client, auth_user
+    ):
+        """Test the progress action covers active budgets only."""
+        account = AccountFactory(user=auth_user)
+        budget = _budget(auth_user)
+        _budget(auth_user, is_active=False)
+        allocation = BudgetCategoryFactory(budget=budget)
+        _spend(auth_user, account, "250", date(2024, 3, 10), allocation.category)
+
+        response = authenticated_api_client.get(reverse("budget-progress"))
+
+        assert response.status_code == 200
+        assert len(response.data) == 1
+        assert response.data[0]["budget_id"] == str(budget.pk)
+        assert Decimal(response.data[0]["spent"]) == Decimal("250")
+        assert response.data[0]["categories"][0]["id"] == str(allocation.pk)
+
+    def test_progress_embedded_in_list(
+        self, authenticated_api_client, auth_user, django_assert_max_num_queries
+    ):
+        """Test the budget list embeds progress without a query per budget."""
+        account = AccountFactory(user=auth_user)
+        for _ in range(4):
+            allocation = BudgetCategoryFactory(budget=_budget(auth_user))
+            _spend(auth_user, account, "50", date(2024, 3, 1), allocation.category)
+
+        # Session, user, count, budgets, allocations, categories, progress
+        # allocations, rollup.
+        with django_assert_max_num_queries(8):
+            response = authenticated_api_client.get(reverse("budget-list"))
+
+        assert [row["progress"]["spent"] for row in response.data["results"]] == [
+            "50.00"
+        ] * 4
+
+    def test_summary_uses_allocations(self, authenticated_api_client, auth_user):
+        """Test the summary action ignores spend outside the allocations."""
+        account = AccountFactory(user=auth_user)
+        budget = _budget(auth_user)
+        allocation = BudgetCategoryFactory(budget=budget)
+        _spend(auth_user, account, "300", date(2024, 3, 10), allocation.category)
+        _spend(auth_user, account, "700", date(2024, 3, 10))
+
+        url = reverse("budget-summary", args=[budget.pk])
+        response = authenticated_api_client.get(url)
+
+        assert response.data["spent"] == Decimal("300")
+
+
+@pytest.mark.django_db
+class TestBudgetAlerts:
+    """Test suite for incremental budget spend and alerts."""
+
+    def _allocation(self, user, **kwargs):
+        return BudgetCategoryFactory(
+            budget=_budget(user, **kwargs),
+            allocated_amount=Decimal("100"),
+            alert_threshold=Decimal("0.80"),
+        )
+
+    def _alerts(self, user):
+        return list(
+            Notification.objects.filter(user=user)
+            .order_by("created_at")
+            .values_list("title", flat=True)
+        )
+
+    def test_threshold_then_limit(self, auth_user):
+        """Test each level is announced once, when it is crossed."""
+        account = AccountFactory(user=auth_user)
+        allocation = self._allocation(auth_user)
+        category = allocation.category
+
+        _spend(auth_user, account, "70", date(2024, 3, 1), category)
+        assert self._alerts(auth_user) == []
+
+        _spend(auth_user, account, "15", date(2024, 3, 2), category)
+        _spend(auth_user, account, "5", date(2024, 3, 3), category)
+        assert self._alerts(auth_user) == [f"{category.name} budget at 85.00%"]
+
+        _spend(auth_user, account, "10", date(2024, 3, 4), category)
+        assert self._alerts(auth_user)[1:] == [f"{category.name} budget limit reached"]
+
+        allocation.refresh_from_db()
+        assert allocation.spent == Decimal("100")
+
+    def test_recrossing_is_deduplicated(self, auth_user):
+        """Test dropping below a level and crossing it again stays quiet."""
+        account = AccountFactory(user=auth_user)
+        category = self._allocation(auth_user).category
+
+        transaction = _spend(auth_user, account, "90", date(2024, 3, 1), category)
+        delete_transaction(transaction)
+        _spend(auth_user, account, "90", date(2024, 3, 1), category)
+
+        assert len(self._alerts(auth_user)) == 1
+
+    def test_updates_move_spend_between_windows(self, auth_user):
+        """Test moving an expense out of the budget window reverses its spend."""
+        account = AccountFactory(user=auth_user)
+        allocation = self._allocation(auth_user)
+
+        transaction = _spend(
+            auth_user, account, "40", date(2024, 3, 1), allocation.category
+        )
+        update_transaction(transaction, date=date(2024, 4, 1))
+
+        allocation.refresh_from_db()
+        assert allocation.spent == Decimal("0")
+
+    def test_bulk_insert_reports_highest_level(self, auth_user):
+        """Test a batch that jumps past both levels sends one alert."""
+        account = AccountFactory(user=auth_user)
+        allocation = self._allocation(auth_user)
+
+        with db_transaction.atomic():
+            rows = Transaction.objects.bulk_create(
+                TransactionFactory.build(
+                    user=auth_user,
+                    account=account,
+                    category=allocation.category,
+                    amount=Decimal("60"),
+                    currency="NGN",
+                    transaction_type="expense",
+                    date=date(2024, 3, day),
+                )
+                for day in (1, 2)
+            )
+            record_transactions_created(rows)
+
+        assert self._alerts(auth_user) == [
+            f"{allocation.category.name} budget limit reached"
+        ]
+
+    def test_inactive_budget_tracks_spend_silently(self, auth_user):
+        """Test inactive budgets keep their running spend but raise nothing."""
+        account = AccountFactory(user=auth_user)
+        allocation = self._allocation(auth_user, is_active=False)
+
+        _spend(auth_user, account, "150", date(2024, 3, 1), allocation.category)
+
+        allocation.refresh_from_db()
+        assert allocation.spent == Decimal("150")
+        assert self._alerts(auth_user) == []
+
+    def test_new_allocation_starts_from_recorded_spend(self, auth_user):
+        """Test an allocation added mid-period picks up earlier expenses."""
+        account = AccountFactory(user=auth_user)
+        budget = _budget(auth_user)
+        category = TransactionCategoryFactory(user=auth_user)
+        _spend(auth_user, account, "35", date(2024, 3, 1), category)
+
+        allocation = BudgetCategoryFactory(budget=budget, category=category)
+
+        allocation.refresh_from_db()
+        assert allocation.spent == Decimal("35")
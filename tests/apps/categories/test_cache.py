@@ -0,0 +1,82 @@
+import pytest
+from types import SimpleNamespace
+from django.contrib import admin
+from django.core.management import call_command
+from apps.categories.admin import CategoryAdmin
+from apps.categories.cache import get_system_category, system_category_ids
+from apps.categories.models import Category
+from api.v1.rest.serializers.categories import CategoryRelatedField
+from tests.factories import TransactionCategoryFactory
+
+
+@pytest.mark.django_db
+class TestSystemCategoryCache:
+    """Test suite for the process-wide system category cache."""
+
+    def _system_category(self, **kwargs):
+        return Category.objects.create(
+            name=kwargs.pop("name", "Utilities"),
+            category_type="expense",
+            is_system=True,
+            **kwargs,
+        )
+
+    def test_reads_are_served_from_cache(self, django_assert_num_queries):
+        """Test only the first read queries the database."""
+        category = self._system_category()
+        TransactionCategoryFactory()
+        with django_assert_num_queries(1):
+            assert system_category_ids() == {category.pk}
+
+        with django_assert_num_queries(0):
+            assert system_category_ids() == {category.pk}
+            assert get_system_category(category.pk).name == "Utilities"
+
+    def test_related_field_skips_database(self, django_assert_num_queries):
+        """Test system category ids resolve without a query once cached."""
+        category = self._system_category()
+        field = CategoryRelatedField(queryset=Category.objects.all())
+        system_category_ids()
+
+        with django_assert_num_queries(0):
+            assert field.to_internal_value(str(category.pk)).pk == category.pk
+
+    def test_seed_command_invalidates(self, django_capture_on_commit_callbacks):
+        """Test seeding makes the new categories visible immediately."""
+        assert system_category_ids() == frozenset()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command("seed_categories", stdout=open("/dev/null", "w"))
+
+        names = {get_system_category(pk).name for pk in system_category_ids()}
+        assert "Salary" in names
+
+    def test_admin_save_invalidates(self, django_capture_on_commit_callbacks):
+        """Test renaming a system category in the admin is seen by readers."""
+        category = self._system_category()
+        system_category_ids()
+        model_admin = CategoryAdmin(Category, admin.site)
+
+        category.name = "Power"
+        with django_capture_on_commit_callbacks(execute=True):
+            model_admin.save_model(
+                None, category, SimpleNamespace(changed_data=["name"]), True
+            )
+
+        assert get_system_category(category.pk).name == "Power"
+
+    def test_admin_unmarking_system_invalidates(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test a category stops being cached once it is no longer system."""
+        category = self._system_category()
+        system_category_ids()
+        model_admin = CategoryAdmin(Category, admin.site)
+
+        category.is_system = False
+        with django_capture_on_commit_callbacks(execute=True):
+            model_admin.save_model(
+                None, category, SimpleNamespace(changed_data=["is_system"]), True
+            )
+
+        assert category.pk not in system_category_ids()
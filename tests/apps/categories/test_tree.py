@@ -0,0 +1,102 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apps.categories.models import Category
+from apps.categories.tree import CategoryTree
+from tests.factories import (
+    AccountFactory,
+    AuthUserFactory,
+    TransactionCategoryFactory,
+    TransactionFactory,
+)
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return response.json(), len(queries.captured_queries)
+
+
+@pytest.mark.django_db
+class TestCategoryTree:
+    """Test suite for the in-memory category tree."""
+
+    def test_links_children_to_parents(self, auth_user):
+        """Test children are grouped under their parent, by name."""
+        food = Category.objects.create(
+            name="Food", category_type="expense", is_system=True
+        )
+        TransactionCategoryFactory(user=auth_user, name="Takeout", parent=food)
+        TransactionCategoryFactory(user=auth_user, name="Groceries", parent=food)
+
+        CategoryTree.for_user(auth_user)  # System categories are now cached.
+        with CaptureQueriesContext(connection) as queries:
+            tree = CategoryTree.for_user(auth_user)
+            children = tree.children(food)
+
+        assert len(queries.captured_queries) == 1
+        assert [child.name for child in children] == ["Groceries", "Takeout"]
+        assert food.pk in [root.pk for root in tree.roots()]
+
+    def test_only_visible_categories(self, auth_user):
+        """Test other users' and inactive categories are left out."""
+        system = Category.objects.create(
+            name="Bills", category_type="expense", is_system=True
+        )
+        TransactionCategoryFactory(user=AuthUserFactory(), parent=system)
+        hidden = TransactionCategoryFactory(
+            user=auth_user, parent=system, is_active=False
+        )
+
+        tree = CategoryTree.for_user(auth_user)
+
+        assert tree.children(system) == []
+        assert hidden.pk not in tree
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestCategoryTreeQueries:
+    """Test list endpoints serialize the hierarchy in constant queries."""
+
+    def _add_categories(self, user, count):
+        for _ in range(count):
+            parent = TransactionCategoryFactory(user=user)
+            child = TransactionCategoryFactory(user=user, parent=parent)
+            TransactionCategoryFactory(user=user, parent=child)
+
+    def test_category_list(self, authenticated_api_client, auth_user):
+        """Test the category list cost does not grow with the tree."""
+        url = reverse("category-list")
+        self._add_categories(auth_user, 1)
+        authenticated_api_client.get(url)
+        _, small = _count_queries(authenticated_api_client, url)
+        self._add_categories(auth_user, 5)
+        data, large = _count_queries(authenticated_api_client, url)
+
+        assert large == small
+        nested = [row for row in data["results"] if row["children"]]
+        assert any(row["children"][0]["children"] for row in nested)
+
+    def test_transaction_list(self, authenticated_api_client, auth_user):
+        """Test category details on transactions do not query per row."""
+        url = reverse("transaction-list") + "?expand=category"
+        account = AccountFactory(user=auth_user)
+
+        def add_transactions(count):
+            for _ in range(count):
+                parent = TransactionCategoryFactory(user=auth_user)
+                category = TransactionCategoryFactory(user=auth_user, parent=parent)
+                TransactionFactory(user=auth_user, account=account, category=parent)
+                TransactionFactory(user=auth_user, account=account, category=category)
+
+        add_transactions(1)
+        authenticated_api_client.get(url)
+        _, small = _count_queries(authenticated_api_client, url)
+        add_transactions(5)
+        data, large = _count_queries(authenticated_api_client, url)
+
+        assert large == small
+        assert any(row["category_detail"]["children"] for row in data["results"])
@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import patch
+from apps.notifications.models import Notification
+from apps.notifications.tasks import fan_out_notification
+from config.celery import app
+from tests.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestFanOutNotification:
+    """Test suite for the notification fan-out task."""
+
+    def test_fan_out_in_batches(self):
+        """Test every active user is notified, a batch at a time."""
+        users = UserFactory.create_batch(5)
+        UserFactory(is_active=False)
+
+        with patch("apps.notifications.tasks.FAN_OUT_BATCH_SIZE", 2):
+            sent = fan_out_notification.delay("Maintenance", "Back soon.").get()
+
+        assert sent == 5
+        assert set(Notification.objects.values_list("user_id", flat=True)) == {
+            user.pk for user in users
+        }
+
+    def test_fan_out_is_idempotent_with_dedup_key(self):
+        """Test a retried fan-out with a dedup key notifies nobody twice."""
+        users = UserFactory.create_batch(2)
+        user_ids = [user.pk for user in users]
+
+        for _ in range(2):
+            fan_out_notification.delay(
+                "New feature", "Try it out.", user_ids=user_ids, dedup_key="feature-1"
+            )
+
+        assert Notification.objects.count() == 2
+
+
+class TestTaskRouting:
+    """Test suite for Celery queue routing."""
+
+    @pytest.mark.parametrize(
+        "task, queue",
+        [
+            ("apps.transactions.tasks.import_statement", "user"),
+            ("apps.notifications.tasks.fan_out_notification", "notifications"),
+            ("apps.analytics.tasks.backfill_snapshots", "analytics"),
+            ("apps.accounts.tasks.reconcile_account_balances", "analytics"),
+        ],
+    )
+    def test_tasks_are_routed_by_app(self, task, queue):
+        """Test slow analytics jobs don't share a queue with user-facing work."""
+        route = app.amqp.router.route({}, task)
+        assert route["queue"].name == queue
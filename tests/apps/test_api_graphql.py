@@ -8,6 +8,7 @@ from tests.factories import (
     TransactionCategoryFactory,
     BudgetFactory,
     GoalFactory,
+    NotificationFactory,
 )
 
 
@@ -21,8 +22,12 @@ class TestGraphQLAuthentication:
         query = """
         query {
             accounts {
-                id
-                name
+                edges {
+                    node {
+                        id
+                        name
+                    }
+                }
             }
         }
         """
@@ -43,8 +48,12 @@ class TestGraphQLAuthentication:
         query = """
         query {
             accounts {
-                id
-                name
+                edges {
+                    node {
+                        id
+                        name
+                    }
+                }
             }
         }
         """
@@ -67,10 +76,14 @@ class TestGraphQLQueries:
         query = """
         query {
             accounts {
-                id
-                name
-                accountType
-                balance
+                edges {
+                    node {
+                        id
+                        name
+                        accountType
+                        balance
+                    }
+                }
             }
         }
         """
@@ -93,9 +106,13 @@ class TestGraphQLQueries:
         query = """
         query {
             transactions {
-                id
-                amount
-                transactionType
+                edges {
+                    node {
+                        id
+                        amount
+                        transactionType
+                    }
+                }
             }
         }
         """
@@ -112,9 +129,13 @@ class TestGraphQLQueries:
         query = """
         query {
             budgets {
-                id
-                name
-                totalAmount
+                edges {
+                    node {
+                        id
+                        name
+                        totalAmount
+                    }
+                }
             }
         }
         """
@@ -131,10 +152,14 @@ class TestGraphQLQueries:
         query = """
         query {
             goals {
-                id
-                name
-                targetAmount
-                currentAmount
+                edges {
+                    node {
+                        id
+                        name
+                        targetAmount
+                        currentAmount
+                    }
+                }
             }
         }
         """
@@ -330,11 +355,15 @@ class TestGraphQLFieldResolution:
         query = """
         query {
             accounts {
-                id
-                name
-                user {
-                    id
-                    email
+                edges {
+                    node {
+                        id
+                        name
+                        user {
+                            id
+                            email
+                        }
+                    }
                 }
             }
         }
@@ -356,15 +385,19 @@ class TestGraphQLFieldResolution:
         query = """
         query {
             transactions {
-                id
-                amount
-                account {
-                    id
-                    name
-                }
-                category {
-                    id
-                    name
+                edges {
+                    node {
+                        id
+                        amount
+                        account {
+                            id
+                            name
+                        }
+                        category {
+                            id
+                            name
+                        }
+                    }
                 }
             }
         }
@@ -374,3 +407,627 @@ class TestGraphQLFieldResolution:
             url, json={"query": query}, content_type="application/json"
         )
         assert response.status_code == 200
+
+
+def _execute(client, query):
+    response = client.post(
+        reverse("graphql"),
+        json.dumps({"query": query}),
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    body = json.loads(response.content)
+    assert "errors" not in body, body.get("errors")
+    return body["data"]
+
+
+@pytest.mark.graphql
+@pytest.mark.django_db
+class TestGraphQLDataLoaders:
+    """Test batched loading of GraphQL relations."""
+
+    def _count_queries(self, client, query):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            data = _execute(client, query)
+        return data, len(queries.captured_queries)
+
+    def test_relations_batch_per_level(self, client, auth_user):
+        """Test nested relations cost one query per level, whatever the size."""
+        from apps.categories.models import Category
+
+        client.force_login(auth_user)
+        query = """
+        query {
+            transactions {
+                edges {
+                    node {
+                        account { name }
+                        category { name parent { name } }
+                    }
+                }
+            }
+        }
+        """
+
+        def add_transactions(count):
+            for _ in range(count):
+                parent = Category.objects.create(
+                    user=auth_user, name="Parent", category_type="expense"
+                )
+                child = TransactionCategoryFactory(user=auth_user, parent=parent)
+                account = AccountFactory(user=auth_user)
+                TransactionFactory(user=auth_user, account=account, category=child)
+
+        add_transactions(2)
+        _execute(client, query)  # Warm the system category cache.
+        _, small = self._count_queries(client, query)
+        add_transactions(10)
+        data, large = self._count_queries(client, query)
+
+        nodes = [edge["node"] for edge in data["transactions"]["edges"]]
+        assert len(nodes) == 12
+        assert all(node["category"]["parent"]["name"] for node in nodes)
+        assert large == small
+
+    def test_budget_categories_reverse_relation(self, client, auth_user):
+        """Test budgets load their categories with one batched query."""
+        from tests.factories import BudgetCategoryFactory
+
+        client.force_login(auth_user)
+        for _ in range(3):
+            budget = BudgetFactory(user=auth_user)
+            BudgetCategoryFactory.create_batch(2, budget=budget)
+
+        data, queries = self._count_queries(
+            client,
+            "query { budgets { edges { node { categories { category { name } } } } } }",
+        )
+
+        budgets = [edge["node"] for edge in data["budgets"]["edges"]]
+        assert [len(budget["categories"]) for budget in budgets] == [2, 2, 2]
+        # Session + user, budgets, budget categories, categories.
+        assert queries <= 5
+
+    def test_category_hierarchy_from_tree(self, client, auth_user):
+        """Test categories, parents and children load with one category query."""
+        client.force_login(auth_user)
+        for _ in range(3):
+            parent = TransactionCategoryFactory(user=auth_user)
+            TransactionCategoryFactory.create_batch(2, user=auth_user, parent=parent)
+
+        query = "query { categories { name parent { name } children { name } } }"
+        _execute(client, query)  # Warm the system category cache.
+        data, queries = self._count_queries(client, query)
+
+        assert sum(len(row["children"]) for row in data["categories"]) == 6
+        assert sum(1 for row in data["categories"] if row["parent"]) == 6
+        # Session + user, categories.
+        assert queries <= 3
+
+    def test_budget_progress_batches(self, client, auth_user):
+        """Test budget progress is computed for the whole page at once."""
+        from tests.factories import BudgetCategoryFactory
+
+        client.force_login(auth_user)
+        query = """
+        query {
+            budgets {
+                edges { node { progress { spent categories { spent } } } }
+            }
+        }
+        """
+
+        BudgetCategoryFactory(budget=BudgetFactory(user=auth_user))
+        _, small = self._count_queries(client, query)
+        for _ in range(4):
+            BudgetCategoryFactory(budget=BudgetFactory(user=auth_user))
+        data, large = self._count_queries(client, query)
+
+        assert len(data["budgets"]["edges"]) == 5
+        assert large == small
+
+
+@pytest.mark.graphql
+@pytest.mark.django_db
+class TestGraphQLConnections:
+    """Test keyset-paginated Relay connections."""
+
+    def _page(self, client, field, arguments="", node="id"):
+        selection = f"{field}({arguments})" if arguments else field
+        data = _execute(
+            client,
+            f"""
+            query {{
+                {selection} {{
+                    edges {{ cursor node {{ {node} }} }}
+                    pageInfo {{
+                        hasNextPage hasPreviousPage startCursor endCursor
+                    }}
+                }}
+            }}
+            """,
+        )
+        return data[field]
+
+    def _errors(self, client, query):
+        response = client.post(
+            reverse("graphql"),
+            json.dumps({"query": query}),
+            content_type="application/json",
+        )
+        return json.loads(response.content).get("errors")
+
+    def test_forward_pages_follow_resolver_ordering(self, client, auth_user):
+        """Test first/after walks every transaction once in -date order."""
+        from datetime import date, timedelta
+
+        client.force_login(auth_user)
+        account = AccountFactory(user=auth_user)
+        # Several transactions per day so the tie-breakers matter.
+        for offset in range(7):
+            TransactionFactory(
+                user=auth_user,
+                account=account,
+                date=date(2024, 1, 1) + timedelta(days=offset // 3),
+            )
+
+        seen, after = [], ""
+        while True:
+            page = self._page(client, "transactions", f'first: 3, after: "{after}"')
+            seen.extend(edge["node"]["id"] for edge in page["edges"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+        from apps.transactions.models import Transaction
+
+        expected = Transaction.objects.filter(user=auth_user).order_by(
+            "-date", "-created_at", "-pk"
+        )
+        assert seen == [str(pk) for pk in expected.values_list("pk", flat=True)]
+
+    def test_backward_page(self, client, auth_user):
+        """Test last/before returns the rows just before the cursor."""
+        client.force_login(auth_user)
+        for _ in range(5):
+            AccountFactory(user=auth_user)
+
+        everything = self._page(client, "accounts", "first: 5")
+        ids = [edge["node"]["id"] for edge in everything["edges"]]
+        before = everything["edges"][3]["cursor"]
+
+        page = self._page(client, "accounts", f'last: 2, before: "{before}"')
+
+        assert [edge["node"]["id"] for edge in page["edges"]] == ids[1:3]
+        assert page["pageInfo"]["hasPreviousPage"] is True
+        assert page["pageInfo"]["hasNextPage"] is True
+
+    def test_nullable_ordering_column(self, client, auth_user):
+        """Test goals without a deadline page after those with one."""
+        from datetime import date
+
+        client.force_login(auth_user)
+        GoalFactory(user=auth_user, deadline=None)
+        GoalFactory(user=auth_user, deadline=date(2030, 1, 1))
+        GoalFactory(user=auth_user, deadline=None)
+        GoalFactory(user=auth_user, deadline=date(2029, 1, 1))
+
+        deadlines, after = [], ""
+        while True:
+            page = self._page(
+                client, "goals", f'first: 1, after: "{after}"', node="deadline"
+            )
+            deadlines.extend(edge["node"]["deadline"] for edge in page["edges"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+        assert deadlines == ["2029-01-01", "2030-01-01", None, None]
+
+    def test_default_and_maximum_page_size(self, client, auth_user, monkeypatch):
+        """Test the server caps page sizes."""
+        from graphene_django.settings import graphene_settings
+
+        client.force_login(auth_user)
+        for _ in range(3):
+            NotificationFactory(user=auth_user)
+        monkeypatch.setattr(graphene_settings, "RELAY_CONNECTION_MAX_LIMIT", 2)
+
+        page = self._page(client, "notifications")
+        errors = self._errors(
+            client, "query { notifications(first: 3) { edges { cursor } } }"
+        )
+
+        assert len(page["edges"]) == 2
+        assert page["pageInfo"]["hasNextPage"] is True
+        assert "exceeds the `first` limit of 2 records" in errors[0]["message"]
+
+    def test_invalid_cursor(self, client, auth_user):
+        """Test a tampered cursor is rejected."""
+        client.force_login(auth_user)
+
+        errors = self._errors(
+            client, 'query { budgets(after: "bm9wZQ") { edges { cursor } } }'
+        )
+
+        assert errors[0]["message"] == "Invalid cursor."
+
+
+@pytest.mark.graphql
+@pytest.mark.django_db
+class TestGraphQLDashboard:
+    """Test the dashboard query."""
+
+    def test_only_selected_sections_are_built(self, client, auth_user):
+        """Test unselected sections are skipped and budget progress is reused."""
+        from unittest.mock import patch
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.analytics import dashboard
+        from tests.factories import BudgetCategoryFactory
+
+        client.force_login(auth_user)
+        BudgetCategoryFactory(budget=BudgetFactory(user=auth_user))
+        AccountFactory(user=auth_user)
+        query = """
+        query {
+            dashboard {
+                netWorth { accountsCount byCurrency { currency total } }
+                budgets { name progress { spent categories { spent } } }
+            }
+        }
+        """
+
+        with patch.dict(dashboard.SECTIONS, {"accounts": None, "goals": None}):
+            with CaptureQueriesContext(connection) as queries:
+                data = _execute(client, query)["dashboard"]
+
+        assert data["netWorth"]["accountsCount"] == 1
+        assert len(data["budgets"]) == 1
+        assert data["budgets"][0]["progress"]["categories"] == [{"spent": "0"}]
+        assert (
+            sum(
+                "analytics_financialsnapshot" in query["sql"]
+                for query in queries.captured_queries
+            )
+            == 1
+        )
+
+
+@pytest.mark.graphql
+@pytest.mark.django_db
+class TestGraphQLPersistedQueries:
+    """Test automatic persisted queries and the document cache."""
+
+    QUERY = "query Me { me { email } }"
+
+    @pytest.fixture(autouse=True)
+    def _fresh_documents(self):
+        from api.v1.graphql.persisted import documents, get_allow_list
+
+        documents.clear()
+        get_allow_list.cache_clear()
+        yield
+        documents.clear()
+        get_allow_list.cache_clear()
+
+    def _post(self, client, query=None, sha256=None):
+        body = {}
+        if query is not None:
+            body["query"] = query
+        if sha256 is not None:
+            body["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": sha256}
+            }
+        return client.post(
+            reverse("graphql"), json.dumps(body), content_type="application/json"
+        )
+
+    def _codes(self, response):
+        body = json.loads(response.content)
+        return [error["extensions"]["code"] for error in body.get("errors", [])]
+
+    def test_hash_registration_round_trip(self, client, auth_user):
+        """Test an unknown hash is reported, registered, then served alone."""
+        from api.v1.graphql.persisted import documents, query_hash
+
+        client.force_login(auth_user)
+        sha256 = query_hash(self.QUERY)
+
+        missing = self._post(client, sha256=sha256)
+        registered = self._post(client, self.QUERY, sha256)
+        documents.clear()  # As if the next request reached another process.
+        served = self._post(client, sha256=sha256)
+
+        assert self._codes(missing) == ["PERSISTED_QUERY_NOT_FOUND"]
+        assert json.loads(registered.content)["data"]["me"]["email"] == auth_user.email
+        assert json.loads(served.content)["data"]["me"]["email"] == auth_user.email
+
+    def test_hash_mismatch_is_rejected(self, client, auth_user):
+        """Test a query is not registered under someone else's hash."""
+        client.force_login(auth_user)
+
+        response = self._post(client, self.QUERY, "0" * 64)
+
+        assert self._codes(response) == ["PERSISTED_QUERY_HASH_MISMATCH"]
+
+    def test_repeated_query_is_parsed_once(self, client, auth_user):
+        """Test the document cache skips parsing for a repeated query."""
+        from unittest import mock
+        from api.v1.graphql import persisted
+
+        client.force_login(auth_user)
+        with mock.patch.object(persisted, "parse", wraps=persisted.parse) as parse:
+            for _ in range(3):
+                _execute(client, self.QUERY)
+
+        assert parse.call_count == 1
+
+    def test_allow_list_only(self, client, auth_user, settings, tmp_path):
+        """Test only allow-listed operations run in allow-list mode."""
+        from api.v1.graphql.persisted import query_hash
+
+        manifest = tmp_path / "operations.json"
+        manifest.write_text(json.dumps({query_hash(self.QUERY): self.QUERY}))
+        settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST = str(manifest)
+        client.force_login(auth_user)
+
+        listed = self._post(client, sha256=query_hash(self.QUERY))
+        by_text = self._post(client, self.QUERY)
+        unlisted = self._post(client, "query { me { id } }")
+
+        assert json.loads(listed.content)["data"]["me"]["email"] == auth_user.email
+        assert json.loads(by_text.content)["data"]["me"]["email"] == auth_user.email
+        assert self._codes(unlisted) == ["PERSISTED_QUERY_NOT_ALLOWED"]
+
+
+@pytest.mark.graphql
+@pytest.mark.django_db
+class TestGraphQLQueryCost:
+    """Test static query cost and depth limits."""
+
+    QUERY = (
+        "query { transactions(first: 10) { edges { node { id account { name } } } } }"
+    )
+
+    @pytest.fixture(autouse=True)
+    def _fresh_documents(self):
+        from api.v1.graphql.persisted import documents
+
+        documents.clear()
+        yield
+        documents.clear()
+
+    def _post(self, client, query, variables=None):
+        response = client.post(
+            reverse("graphql"),
+            json.dumps({"query": query, "variables": variables}),
+            content_type="application/json",
+        )
+        return json.loads(response.content)
+
+    def test_cost_is_reported(self, client, auth_user):
+        """Test the measured cost is returned in the response extensions."""
+        client.force_login(auth_user)
+
+        body = self._post(client, self.QUERY)
+        # transactions + 10 * (edges + node + account); scalars are free.
+        assert body["extensions"]["cost"] == {
+            "requested": 31,
+            "maximum": 5000,
+            "depth": 5,
+            "maximumDepth": 10,
+        }
+        assert body["data"]["transactions"]["edges"] == []
+
+    def test_cached_document_reports_cost(self, client, auth_user):
+        """Test a repeated query reports its cost without being validated."""
+        client.force_login(auth_user)
+
+        first = self._post(client, self.QUERY)
+        second = self._post(client, self.QUERY)
+
+        assert second["extensions"] == first["extensions"]
+
+    def test_aliases_count_toward_cost(self, client, auth_user, settings):
+        """Test aliased copies of a field are each counted."""
+        settings.GRAPHQL_MAX_QUERY_COST = 50
+        client.force_login(auth_user)
+        page = "transactions(first: 10) { edges { node { account { name } } } }"
+
+        allowed = self._post(client, f"query {{ a: {page} }}")
+        rejected = self._post(client, f"query {{ a: {page} b: {page} }}")
+
+        assert "errors" not in allowed
+        assert [e["extensions"]["code"] for e in rejected["errors"]] == [
+            "QUERY_TOO_COSTLY"
+        ]
+        assert rejected["errors"][0]["extensions"]["cost"]["requested"] == 62
+        assert "data" not in rejected
+
+    def test_variable_page_size_counts_as_the_cap(self, client, auth_user, settings):
+        """Test a variable page size is costed at the cap, not its default."""
+        settings.GRAPHQL_MAX_QUERY_COST = 150
+        client.force_login(auth_user)
+        query = (
+            "query($n: Int = 1) { transactions(first: $n) "
+            "{ edges { node { account { name } } } } }"
+        )
+        literal = (
+            "query { transactions(first: 1) { edges { node { account { name } } } } }"
+        )
+
+        allowed = self._post(client, literal)
+        rejected = self._post(client, query, {"n": 100})
+
+        assert "errors" not in allowed
+        assert [e["extensions"]["code"] for e in rejected["errors"]] == [
+            "QUERY_TOO_COSTLY"
+        ]
+        assert rejected["errors"][0]["extensions"]["cost"]["requested"] == 301
+        assert "data" not in rejected
+
+    def test_deep_query_is_rejected(self, client, auth_user):
+        """Test nesting past the depth limit is rejected before execution."""
+        client.force_login(auth_user)
+        nested = "id"
+        for _ in range(10):
+            nested = f"parent {{ {nested} }}"
+
+        body = self._post(client, f"query {{ categories {{ {nested} }} }}")
+
+        assert [e["extensions"]["code"] for e in body["errors"]] == ["QUERY_TOO_DEEP"]
+        assert body["errors"][0]["extensions"]["cost"]["depth"] == 12
+
+    def test_fragments_are_measured(self, client, auth_user):
+        """Test fields selected through fragments are counted."""
+        client.force_login(auth_user)
+        query = (
+            "query { transactions(first: 10) { edges { node { ...Row } } } } "
+            "fragment Row on TransactionType { id account { name } }"
+        )
+
+        body = self._post(client, query)
+
+        assert body["extensions"]["cost"]["requested"] == 31
+
+    def test_introspection_is_free(self, client, auth_user):
+        """Test introspection fields don't count toward the cost."""
+        client.force_login(auth_user)
+
+        body = self._post(client, "query { __schema { types { name } } }")
+
+        assert body["extensions"]["cost"]["requested"] == 0
+        assert body["data"]["__schema"]["types"]
+
+
+@pytest.mark.graphql
+@pytest.mark.django_db
+class TestGraphQLProjection:
+    """Test resolvers load only the columns and relations a query selects."""
+
+    def _queries(self, client, query):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            data = _execute(client, query)
+        return data, [query["sql"] for query in queries.captured_queries]
+
+    def _select(self, queries, table):
+        [sql] = [sql for sql in queries if f'FROM "{table}"' in sql]
+        return sql
+
+    def test_only_selected_columns_are_loaded(self, client, auth_user):
+        """Test unselected columns such as notes are not read."""
+        client.force_login(auth_user)
+        TransactionFactory.create_batch(3, user=auth_user, notes="Long notes")
+
+        data, queries = self._queries(
+            client, "query { transactions { edges { node { id amount } } } }"
+        )
+
+        sql = self._select(queries, "transactions_transaction")
+        assert len(data["transactions"]["edges"]) == 3
+        assert '"transactions_transaction"."amount"' in sql
+        assert '"transactions_transaction"."notes"' not in sql
+        assert '"transactions_transaction"."updated_at"' not in sql
+
+    def test_relations_are_joined(self, client, auth_user):
+        """Test selected foreign keys are joined rather than loaded apart."""
+        client.force_login(auth_user)
+        for _ in range(3):
+            TransactionFactory(user=auth_user, account=AccountFactory(user=auth_user))
+
+        data, queries = self._queries(
+            client,
+            "query { transactions { edges { node { amount account { name } } } } }",
+        )
+
+        sql = self._select(queries, "transactions_transaction")
+        names = [
+            edge["node"]["account"]["name"] for edge in data["transactions"]["edges"]
+        ]
+        assert all(names)
+        assert "JOIN" in sql and '"accounts_account"."name"' in sql
+        assert '"accounts_account"."balance"' not in sql
+        assert not any('FROM "accounts_account"' in query for query in queries)
+
+    def test_reverse_relations_are_prefetched(self, client, auth_user):
+        """Test reverse relations are prefetched with their own projection."""
+        from tests.factories import BudgetCategoryFactory
+
+        client.force_login(auth_user)
+        for _ in range(2):
+            BudgetCategoryFactory.create_batch(2, budget=BudgetFactory(user=auth_user))
+
+        data, queries = self._queries(
+            client,
+            "query { budgets { edges { node { categories { allocatedAmount } } } } }",
+        )
+
+        sql = self._select(queries, "budgets_budgetcategory")
+        budgets = [edge["node"] for edge in data["budgets"]["edges"]]
+        assert [len(budget["categories"]) for budget in budgets] == [2, 2]
+        assert '"budgets_budgetcategory"."alert_threshold"' not in sql
+
+    def test_prefetched_relations_batch_their_own_relations(self, client, auth_user):
+        """Test a relation prefetched for a computed field still batches."""
+        from tests.factories import BudgetCategoryFactory
+
+        client.force_login(auth_user)
+        query = """
+        query {
+            budgets(first: 10) {
+                edges {
+                    node { categories { category { name } } progress { spent } }
+                }
+            }
+        }
+        """
+
+        def add_budgets(count):
+            for _ in range(count):
+                BudgetCategoryFactory.create_batch(
+                    2, budget=BudgetFactory(user=auth_user)
+                )
+
+        add_budgets(2)
+        _, small = self._queries(client, query)
+        add_budgets(4)
+        data, large = self._queries(client, query)
+
+        budgets = [edge["node"] for edge in data["budgets"]["edges"]]
+        assert [len(budget["categories"]) for budget in budgets] == [2] * 6
+        assert all(c["category"]["name"] for b in budgets for c in b["categories"])
+        assert len(large) == len(small)
+
+    def test_computed_fields_load_their_sources(self, client, auth_user):
+        """Test a computed field's declared columns are loaded with the row."""
+        client.force_login(auth_user)
+        GoalFactory.create_batch(3, user=auth_user)
+
+        data, queries = self._queries(
+            client, "query { goals { edges { node { progressPercentage } } } }"
+        )
+
+        sql = self._select(queries, "goals_goal")
+        assert len(data["goals"]["edges"]) == 3
+        assert '"goals_goal"."target_amount"' in sql
+        assert '"goals_goal"."name"' not in sql
+
+    def test_fragments_are_projected(self, client, auth_user):
+        """Test fields selected through fragments are loaded."""
+        client.force_login(auth_user)
+        account = AccountFactory(user=auth_user)
+
+        data = _execute(
+            client,
+            f'query {{ account(id: "{account.id}") {{ ...Row }} }} '
+            "fragment Row on AccountType { name balance }",
+        )
+
+        assert data["account"]["name"] == account.name
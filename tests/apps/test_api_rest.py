@@ -1,5 +1,8 @@
+import csv
+import io
 import pytest
 import json
+from datetime import date, timedelta
 from rest_framework import status
 from django.urls import reverse
 from tests.factories import (
@@ -9,6 +12,7 @@ from tests.factories import (
     TransactionCategoryFactory,
     BudgetFactory,
     GoalFactory,
+    NotificationFactory,
 )
 
 
@@ -142,6 +146,81 @@ class TestTransactionAPI:
         response = authenticated_api_client.get(url, {"category": str(category.id)})
         assert response.status_code == status.HTTP_200_OK
 
+    def test_export_transactions_csv(self, authenticated_api_client, auth_user):
+        """Test streaming a filtered CSV export."""
+        account = AccountFactory(user=auth_user)
+        TransactionFactory.create_batch(
+            3, user=auth_user, account=account, transaction_type="expense"
+        )
+        TransactionFactory(user=auth_user, account=account, transaction_type="income")
+
+        url = reverse("transaction-export")
+        response = authenticated_api_client.get(url, {"transaction_type": "expense"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.reader(io.StringIO(content)))
+        assert rows[0][:4] == ["id", "date", "transaction_type", "amount"]
+        assert len(rows) == 4
+
+    def test_export_transactions_ndjson(self, authenticated_api_client, auth_user):
+        """Test streaming an NDJSON export with exact decimal amounts."""
+        account = AccountFactory(user=auth_user)
+        TransactionFactory(user=auth_user, account=account, amount="1234.50")
+
+        url = reverse("transaction-export")
+        response = authenticated_api_client.get(url, {"file_format": "ndjson"})
+        assert response.status_code == status.HTTP_200_OK
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        assert rows[0]["amount"] == "1234.50"
+        assert rows[0]["account"] == account.name
+
+    def test_list_is_slim_unless_expanded(self, authenticated_api_client, auth_user):
+        """Test lists name related objects and nest them only on ?expand=."""
+        account = AccountFactory(user=auth_user, name="Wallet")
+        category = TransactionCategoryFactory(user=auth_user, name="Food")
+        transaction = TransactionFactory(
+            user=auth_user, account=account, category=category
+        )
+        url = reverse("transaction-list")
+
+        slim = authenticated_api_client.get(url).json()["results"][0]
+        expanded = authenticated_api_client.get(url, {"expand": "account"}).json()
+        detail = authenticated_api_client.get(
+            reverse("transaction-detail", args=[transaction.id])
+        ).json()
+
+        assert slim["account_name"] == "Wallet"
+        assert slim["category_name"] == "Food"
+        assert "account_detail" not in slim and "category_detail" not in slim
+        assert expanded["results"][0]["account_detail"]["name"] == "Wallet"
+        assert "category_detail" not in expanded["results"][0]
+        assert detail["account_detail"]["name"] == "Wallet"
+        assert detail["category_detail"]["name"] == "Food"
+
+    def test_sparse_fields_narrow_the_query(self, authenticated_api_client, auth_user):
+        """Test ?fields= trims the payload and the selected columns."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        TransactionFactory(user=auth_user, account=AccountFactory(user=auth_user))
+        url = reverse("transaction-list")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_api_client.get(url, {"fields": "id,amount"})
+
+        assert set(response.json()["results"][0]) == {"id", "amount"}
+        select = next(
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "transactions_transaction"."id"')
+        )
+        assert '"transactions_transaction"."description"' not in select
+        assert "accounts_account" not in select
+
 
 @pytest.mark.rest
 @pytest.mark.django_db
@@ -243,6 +322,49 @@ class TestAPIPagination:
         # Check pagination structure
         assert "results" in response.json() or "data" in response.json()
 
+    def test_transaction_cursor_pagination(self, authenticated_api_client, auth_user):
+        """Test keyset pagination walks transactions forwards and backwards."""
+        account = AccountFactory(user=auth_user)
+        today = date.today()
+        transactions = [
+            TransactionFactory(
+                user=auth_user, account=account, date=today - timedelta(days=i % 3)
+            )
+            for i in range(7)
+        ]
+        expected = [
+            str(t.id)
+            for t in sorted(
+                transactions, key=lambda t: (t.date, t.created_at, t.id), reverse=True
+            )
+        ]
+
+        url = reverse("transaction-list")
+        response = authenticated_api_client.get(
+            url, {"pagination": "cursor", "page_size": 3}
+        )
+        body = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in body
+        assert body["previous"] is None
+
+        seen = [row["id"] for row in body["results"]]
+        pages = [body]
+        while body["next"]:
+            body = authenticated_api_client.get(body["next"]).json()
+            pages.append(body)
+            seen.extend(row["id"] for row in body["results"])
+        assert seen == expected
+
+        previous = authenticated_api_client.get(pages[-1]["previous"]).json()
+        assert previous["results"] == pages[-2]["results"]
+
+    def test_transaction_invalid_cursor(self, authenticated_api_client):
+        """Test that a malformed cursor is rejected."""
+        url = reverse("transaction-list")
+        response = authenticated_api_client.get(url, {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 @pytest.mark.rest
 @pytest.mark.django_db
@@ -280,3 +402,292 @@ class TestAPIPermissions:
             status.HTTP_404_NOT_FOUND,
             status.HTTP_403_FORBIDDEN,
         ]
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Test suite for ETag / Last-Modified conditional requests."""
+
+    def test_unchanged_list_returns_304_without_queries(
+        self, authenticated_api_client, auth_user
+    ):
+        """Test a matching If-None-Match skips the query and serialization."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        AccountFactory(user=auth_user)
+        url = reverse("account-list")
+        first = authenticated_api_client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_api_client.get(
+                url, HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+
+        assert first.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == first["ETag"]
+        assert not response.content
+        assert not any(
+            "accounts_account" in query["sql"] for query in queries.captured_queries
+        )
+
+    def test_write_changes_etag(
+        self, authenticated_api_client, auth_user, django_capture_on_commit_callbacks
+    ):
+        """Test a write to the user's data makes the next poll a 200."""
+        account = AccountFactory(user=auth_user)
+        url = reverse("account-detail", args=[account.id])
+        etag = authenticated_api_client.get(url)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_api_client.patch(url, {"name": "Renamed"}, format="json")
+        response = authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.json()["name"] == "Renamed"
+
+    def test_if_modified_since(self, authenticated_api_client, auth_user):
+        """Test Last-Modified can be used for revalidation too."""
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+
+        GoalFactory(user=auth_user)
+        url = reverse("goal-list")
+        fresh = authenticated_api_client.get(url)
+        later = timezone.now() + timedelta(seconds=2)
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            last_modified = authenticated_api_client.get(url)["Last-Modified"]
+            response = authenticated_api_client.get(
+                url, HTTP_IF_MODIFIED_SINCE=last_modified
+            )
+
+        # Not sent within the second of the change, which a second write
+        # could share.
+        assert "Last-Modified" not in fresh
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_varies_with_query_and_user(self, authenticated_api_client):
+        """Test different query strings and users never share a tag."""
+        from rest_framework.test import APIClient
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        url = reverse("category-list")
+        etag = authenticated_api_client.get(url)["ETag"]
+        other = APIClient()
+        other.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(AuthUserFactory()).access_token}"
+        )
+
+        filtered = authenticated_api_client.get(
+            url, {"fields": "id"}, HTTP_IF_NONE_MATCH=etag
+        )
+        other_user = other.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert filtered.status_code == status.HTTP_200_OK
+        assert other_user.status_code == status.HTTP_200_OK
+
+    def test_analytics_actions(self, authenticated_api_client):
+        """Test analytics actions answer conditional requests."""
+        url = reverse("analytics-net-worth")
+        etag = authenticated_api_client.get(url)["ETag"]
+
+        response = authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_cached_window_after_midnight(self, api_client, auth_user):
+        """Test a new day revalidates to the new window, not yesterday's."""
+        from datetime import date, datetime, timezone as dt_timezone
+        from decimal import Decimal
+        from unittest import mock
+        from apps.analytics.models import FinancialSnapshot
+
+        FinancialSnapshot.objects.create(
+            user=auth_user,
+            created_for_date=date(2026, 3, 1),
+            total_expense=Decimal("100"),
+            expense_count=1,
+        )
+        api_client.force_authenticate(auth_user)
+        url = reverse("analytics-spending-trends")
+
+        def at(hour, minute):
+            moment = datetime(2026, 3, 1, hour, minute, tzinfo=dt_timezone.utc)
+            return mock.patch("django.utils.timezone.now", return_value=moment)
+
+        # 23:50 on 1 March, then 00:10 on 2 March, in Lagos (UTC+1).
+        with at(22, 50):
+            before = api_client.get(url, {"days": 0})
+        with at(23, 10):
+            after = api_client.get(url, {"days": 0}, HTTP_IF_NONE_MATCH=before["ETag"])
+            revalidated = api_client.get(
+                url, {"days": 0}, HTTP_IF_NONE_MATCH=after["ETag"]
+            )
+
+        assert len(before.json()) == 1
+        assert after.status_code == status.HTTP_200_OK
+        assert after.json() == []
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.rest
+class TestFastJSON:
+    """Test suite for the orjson renderer and parser."""
+
+    def test_renderer_types(self):
+        """Test decimals stay exact and other model types render like DRF."""
+        import uuid
+        from datetime import datetime, timezone as dt_timezone
+        from decimal import Decimal
+        from django.utils.translation import gettext_lazy
+        from api.v1.rest.renderers import FastJSONRenderer
+
+        pk = uuid.uuid4()
+        data = {
+            "amount": Decimal("1234.50"),
+            "id": pk,
+            "at": datetime(2024, 5, 1, 12, 30, tzinfo=dt_timezone.utc),
+            "day": date(2024, 5, 1),
+            "label": gettext_lazy("Income"),
+        }
+
+        rendered = json.loads(FastJSONRenderer().render(data))
+
+        assert rendered == {
+            "amount": "1234.50",
+            "id": str(pk),
+            "at": "2024-05-01T12:30:00Z",
+            "day": "2024-05-01",
+            "label": "Income",
+        }
+
+    def test_renderer_matches_drf(self):
+        """Test dates, times and datetimes render byte for byte like DRF."""
+        from datetime import datetime, time, timedelta, timezone as dt_timezone
+        from rest_framework.renderers import JSONRenderer
+        from api.v1.rest.renderers import FastJSONRenderer
+
+        lagos = dt_timezone(timedelta(hours=1))
+        data = {
+            "utc": datetime(2024, 5, 1, 12, 30, 5, 123456, tzinfo=dt_timezone.utc),
+            "whole": datetime(2024, 5, 1, 12, 30, tzinfo=dt_timezone.utc),
+            "offset": datetime(2024, 5, 1, 12, 30, 5, 120000, tzinfo=lagos),
+            "naive": datetime(2024, 5, 1, 12, 30, 5, 1),
+            "day": date(2024, 5, 1),
+            "time": time(8, 15, 30, 250000),
+            "nested": [{"at": datetime(2024, 5, 1, tzinfo=dt_timezone.utc)}],
+        }
+
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+    def test_renderer_rejects_non_finite(self, value):
+        """Test NaN and infinities raise like DRF's strict JSON."""
+        from rest_framework.renderers import JSONRenderer
+        from api.v1.rest.renderers import FastJSONRenderer
+
+        data = {"rates": [1.5, value], "note": None}
+
+        with pytest.raises(ValueError):
+            JSONRenderer().render(data)
+        with pytest.raises(ValueError):
+            FastJSONRenderer().render(data)
+
+    @pytest.mark.django_db
+    def test_malformed_body(self, authenticated_api_client):
+        """Test malformed JSON is a 400, not a server error."""
+        response = authenticated_api_client.post(
+            reverse("account-list"), b"{not json", content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"].startswith("JSON parse error")
+
+
+@pytest.mark.rest
+@pytest.mark.django_db
+class TestValuesList:
+    """Test suite for the serializer-free list path."""
+
+    def _both(self, client, view, url, **params):
+        view.values_list_enabled = True
+        fast = client.get(url, params)
+        view.values_list_enabled = False
+        try:
+            slow = client.get(url, params)
+        finally:
+            view.values_list_enabled = True
+        assert fast.status_code == slow.status_code == status.HTTP_200_OK
+        return fast, slow
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"fields": "id,amount,category_name,created_at"},
+            {"pagination": "cursor", "page_size": 2},
+            {"expand": "account,category"},
+        ],
+    )
+    def test_transaction_list_parity(self, authenticated_api_client, auth_user, params):
+        """Test transaction lists render the same bytes either way."""
+        from api.v1.rest.views import TransactionViewSet
+
+        account = AccountFactory(user=auth_user)
+        category = TransactionCategoryFactory(user=auth_user)
+        TransactionFactory.create_batch(
+            3, user=auth_user, account=account, category=category
+        )
+        TransactionFactory(user=auth_user, account=account, category=None, notes="")
+
+        fast, slow = self._both(
+            authenticated_api_client,
+            TransactionViewSet,
+            reverse("transaction-list"),
+            **params,
+        )
+
+        assert fast.content == slow.content
+        assert fast.json()["results"]
+
+    @pytest.mark.parametrize(
+        "view_name, url_name, factory",
+        [
+            ("AccountViewSet", "account-list", AccountFactory),
+            ("GoalViewSet", "goal-list", GoalFactory),
+            ("NotificationViewSet", "notification-list", NotificationFactory),
+        ],
+    )
+    def test_list_parity(
+        self, authenticated_api_client, auth_user, view_name, url_name, factory
+    ):
+        """Test account, goal and notification lists render the same bytes."""
+        from api.v1.rest import views
+
+        factory.create_batch(3, user=auth_user)
+
+        fast, slow = self._both(
+            authenticated_api_client, getattr(views, view_name), reverse(url_name)
+        )
+
+        assert fast.content == slow.content
+        assert len(fast.json()["results"]) == 3
+
+    def test_goal_progress_without_target(self, authenticated_api_client, auth_user):
+        """Test method fields read their declared columns from the row."""
+        from api.v1.rest.views import GoalViewSet
+
+        GoalFactory(user=auth_user, target_amount=0)
+        GoalFactory(user=auth_user, target_amount=400, current_amount=100)
+
+        fast, slow = self._both(
+            authenticated_api_client, GoalViewSet, reverse("goal-list")
+        )
+
+        assert fast.content == slow.content
+        progress = [goal["progress_percentage"] for goal in fast.json()["results"]]
+        assert sorted(progress, key=str) == [0, "25.00"]
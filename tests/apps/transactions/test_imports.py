@@ -0,0 +1,155 @@
+import pytest
+from decimal import Decimal
+from io import BytesIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from apps.transactions.imports import StatementError, StatementImporter
+from apps.notifications.models import Notification
+from apps.transactions.models import Transaction
+from tests.factories import AccountFactory, TransactionCategoryFactory, UserFactory
+
+
+def _statement(*lines):
+    return BytesIO(("\n".join(lines) + "\n").encode())
+
+
+@pytest.mark.django_db
+class TestStatementImporter:
+    """Test suite for bulk CSV statement imports."""
+
+    def test_import_in_batches(self, auth_user):
+        """Test rows are inserted in batches with one balance update per batch."""
+        account = AccountFactory(
+            user=auth_user, account_type="bank", currency="NGN", balance=Decimal("0")
+        )
+        rows = [f"2024-01-{day:02d},-100.00,Airtime" for day in range(1, 8)]
+        statement = _statement("Date,Amount,Narration", *rows)
+
+        importer = StatementImporter(auth_user, account=account, batch_size=3)
+        with CaptureQueriesContext(connection) as queries:
+            result = importer.run(statement)
+
+        assert result.created == 7
+        assert result.skipped == 0
+        account.refresh_from_db()
+        assert account.balance == Decimal("-700.00")
+        # Three batches: one INSERT and one balance UPDATE each.
+        statements = [q["sql"] for q in queries.captured_queries]
+        inserts = [sql for sql in statements if sql.startswith("INSERT")]
+        updates = [sql for sql in statements if sql.startswith("UPDATE")]
+        assert sum("transactions_transaction" in sql for sql in inserts) == 3
+        assert sum("accounts_account" in sql for sql in updates) == 3
+        assert Transaction.objects.filter(payment_method="bank_transfer").count() == 7
+
+    def test_debit_credit_columns_and_categories(self, auth_user):
+        """Test debit/credit statements and category lookup by name."""
+        account = AccountFactory(
+            user=auth_user, account_type="mobile_money", balance=Decimal("0")
+        )
+        TransactionCategoryFactory(user=auth_user, name="Salary")
+        statement = _statement(
+            "Transaction Date,Details,Debit,Credit,Category",
+            '05/02/2024,Transfer in,,"50,000.00",salary',
+            "06/02/2024,Food,1500,,",
+        )
+
+        result = StatementImporter(auth_user, account=account).run(statement)
+
+        assert result.created == 2
+        account.refresh_from_db()
+        assert account.balance == Decimal("48500.00")
+        income = Transaction.objects.get(transaction_type="income")
+        assert income.category.name == "Salary"
+        assert income.payment_method == "mobile_money"
+
+    def test_invalid_rows_are_reported(self, auth_user):
+        """Test rows with foreign accounts or bad values are skipped."""
+        account = AccountFactory(user=auth_user)
+        foreign = AccountFactory(user=UserFactory())
+        statement = _statement(
+            "date,amount,account,category",
+            f"2024-03-01,200,{account.id},",
+            f"2024-03-01,200,{foreign.id},",
+            f"2024-13-01,200,{account.id},",
+            f"2024-03-01,abc,{account.id},",
+            f"2024-03-01,200,{account.id},Unknown",
+        )
+
+        result = StatementImporter(auth_user).run(statement)
+
+        assert result.created == 1
+        assert result.skipped == 4
+        assert [error["line"] for error in result.errors] == [3, 4, 5, 6]
+        assert not Transaction.objects.filter(account=foreign).exists()
+
+    def test_missing_columns(self, auth_user):
+        """Test a statement without a date column is rejected."""
+        with pytest.raises(StatementError):
+            StatementImporter(auth_user).run(_statement("amount", "100"))
+
+    def test_import_command(self, auth_user, tmp_path):
+        """Test the import_transactions management command."""
+        account = AccountFactory(user=auth_user, balance=Decimal("0"))
+        path = tmp_path / "statement.csv"
+        path.write_text("date,amount\n2024-04-01,1000\n2024-04-02,-250\n")
+
+        call_command(
+            "import_transactions",
+            str(path),
+            user=auth_user.email,
+            account=str(account.id),
+        )
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("750")
+
+    def test_import_endpoint(self, authenticated_api_client, auth_user):
+        """Test uploading a statement through the REST API."""
+        account = AccountFactory(user=auth_user, balance=Decimal("0"))
+        upload = SimpleUploadedFile(
+            "statement.csv",
+            b"date,amount,description\n2024-05-01,-300,Fuel\n2024-05-01,x,Bad\n",
+            content_type="text/csv",
+        )
+
+        url = reverse("transaction-import-statement")
+        response = authenticated_api_client.post(
+            url, {"file": upload, "account": str(account.id)}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["created"] == 1
+        assert response.json()["errors"] == [{"line": 3, "error": "Invalid amount 'x'"}]
+        account.refresh_from_db()
+        assert account.balance == Decimal("-300")
+
+    def test_import_endpoint_in_background(
+        self, authenticated_api_client, auth_user, settings, tmp_path
+    ):
+        """Test a background import is queued and the user notified."""
+        settings.MEDIA_ROOT = tmp_path
+        account = AccountFactory(user=auth_user, balance=Decimal("0"))
+        upload = SimpleUploadedFile(
+            "statement.csv",
+            b"date,amount\n2024-05-01,-300\n2024-05-02,-200\n",
+            content_type="text/csv",
+        )
+
+        url = reverse("transaction-import-statement")
+        response = authenticated_api_client.post(
+            url,
+            {"file": upload, "account": str(account.id), "background": "true"},
+            format="multipart",
+        )
+
+        # Tests run tasks eagerly, so the import has finished by now.
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        account.refresh_from_db()
+        assert account.balance == Decimal("-500")
+        notification = Notification.objects.get(user=auth_user)
+        assert notification.message == "2 transactions imported, 0 rows skipped."
+        assert not list((tmp_path / "imports").iterdir())
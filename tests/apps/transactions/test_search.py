@@ -0,0 +1,55 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from apps.transactions.models import Transaction
+from apps.transactions.search import search_transactions
+from tests.factories import AccountFactory, TransactionFactory
+
+
+@pytest.mark.django_db
+class TestTransactionSearch:
+    """Test suite for transaction ?search= filtering."""
+
+    def _create(self, user, description, notes=""):
+        account = AccountFactory(user=user, name="Main")
+        return TransactionFactory(
+            user=user, account=account, description=description, notes=notes
+        )
+
+    def test_search_description_and_notes(self, authenticated_api_client, auth_user):
+        """Test search matches description or notes, requiring every term."""
+        shoprite = self._create(auth_user, "Shoprite Lekki", "weekly groceries")
+        self._create(auth_user, "Uber trip", "airport")
+        fuel = self._create(auth_user, "Total fuel", "groceries run on the way")
+
+        url = reverse("transaction-list")
+        response = authenticated_api_client.get(url, {"search": "groceries"})
+        assert response.status_code == status.HTTP_200_OK
+        ids = {row["id"] for row in response.json()["results"]}
+        assert ids == {str(shoprite.id), str(fuel.id)}
+
+        response = authenticated_api_client.get(url, {"search": "shoprite groceries"})
+        ids = {row["id"] for row in response.json()["results"]}
+        assert ids == {str(shoprite.id)}
+
+    def test_search_partial_merchant_name(self, auth_user):
+        """Test a partial merchant name still matches the description."""
+        shoprite = self._create(auth_user, "SHOPRITE LEKKI POS")
+        self._create(auth_user, "Spar Ikeja")
+
+        queryset = Transaction.objects.filter(user=auth_user)
+        assert list(search_transactions(queryset, ["shopr"])) == [shoprite]
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="search_vector needs PostgreSQL"
+    )
+    def test_trigger_maintains_search_vector(self, auth_user):
+        """Test the database trigger fills search_vector on insert and update."""
+        transaction = self._create(auth_user, "Jumia order", "headphones")
+        queryset = Transaction.objects.filter(user=auth_user)
+        assert queryset.filter(search_vector="headphones").exists()
+
+        Transaction.objects.filter(pk=transaction.pk).update(notes="charger")
+        assert not queryset.filter(search_vector="headphones").exists()
+        assert queryset.filter(search_vector="charger").exists()
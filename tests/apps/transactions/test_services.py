@@ -0,0 +1,149 @@
+import pytest
+from decimal import Decimal
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from apps.accounts.models import Account
+from apps.accounts.services import reconcile_balances
+from apps.accounts.tasks import reconcile_account_balances
+from apps.transactions.services import (
+    create_transaction,
+    update_transaction,
+    delete_transaction,
+)
+from tests.factories import AccountFactory, TransactionFactory
+
+
+def _create(user, account, amount, transaction_type="expense", **extra):
+    return create_transaction(
+        user=user,
+        account=account,
+        amount=Decimal(amount),
+        currency="NGN",
+        transaction_type=transaction_type,
+        payment_method="cash",
+        **extra,
+    )
+
+
+@pytest.mark.django_db
+class TestBalanceEngine:
+    """Test suite for incremental account balance updates."""
+
+    def test_create_applies_signed_delta(self, auth_user):
+        """Test that income adds to and expenses subtract from the balance."""
+        account = AccountFactory(user=auth_user, balance=Decimal("0"))
+
+        _create(auth_user, account, "5000", "income")
+        _create(auth_user, account, "1200", "expense")
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("3800")
+
+    def test_update_moves_delta(self, auth_user):
+        """Test that updating amount, type or account moves the balance effect."""
+        source = AccountFactory(user=auth_user, name="Source", balance=Decimal("0"))
+        target = AccountFactory(user=auth_user, name="Target", balance=Decimal("0"))
+        transaction = _create(auth_user, source, "1000", "expense")
+
+        update_transaction(transaction, amount=Decimal("250"))
+        source.refresh_from_db()
+        assert source.balance == Decimal("-250")
+
+        update_transaction(transaction, transaction_type="income", account=target)
+        source.refresh_from_db()
+        target.refresh_from_db()
+        assert source.balance == Decimal("0")
+        assert target.balance == Decimal("250")
+
+    def test_delete_reverses_delta(self, auth_user):
+        """Test that deleting a transaction reverses its effect."""
+        account = AccountFactory(user=auth_user, balance=Decimal("0"))
+        transaction = _create(auth_user, account, "700", "income")
+
+        delete_transaction(transaction)
+        delete_transaction(transaction)
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("0")
+
+    def test_rest_writes_update_balance(self, authenticated_api_client, auth_user):
+        """Test that REST create/update/delete keep the balance in sync."""
+        account = AccountFactory(user=auth_user, balance=Decimal("0"))
+
+        response = authenticated_api_client.post(
+            reverse("transaction-list"),
+            {
+                "account": str(account.id),
+                "amount": "3000.00",
+                "transaction_type": "income",
+                "payment_method": "cash",
+                "date": "2026-01-15",
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        url = reverse("transaction-detail", kwargs={"pk": response.json()["id"]})
+
+        authenticated_api_client.patch(url, {"amount": "1000.00"}, format="json")
+        account.refresh_from_db()
+        assert account.balance == Decimal("1000")
+
+        authenticated_api_client.delete(url)
+        account.refresh_from_db()
+        assert account.balance == Decimal("0")
+
+
+@pytest.mark.django_db
+class TestBalanceReconciliation:
+    """Test suite for balance reconciliation."""
+
+    def test_reconcile_fixes_drift(self, auth_user):
+        """Test that drifted balances are recomputed from transactions."""
+        account = AccountFactory(user=auth_user, balance=Decimal("999"))
+        TransactionFactory(
+            user=auth_user,
+            account=account,
+            amount=Decimal("400"),
+            transaction_type="income",
+        )
+        TransactionFactory(
+            user=auth_user,
+            account=account,
+            amount=Decimal("150"),
+            transaction_type="expense",
+        )
+
+        drifted = reconcile_balances(chunk_size=1)
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("250")
+        assert [row[0] for row in drifted] == [account.id]
+
+    def test_reconcile_dry_run(self, auth_user):
+        """Test that dry runs report drift without writing."""
+        account = AccountFactory(user=auth_user, balance=Decimal("10"))
+
+        drifted = reconcile_balances(dry_run=True)
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("10")
+        assert drifted == [(account.id, Decimal("10"), Decimal("0"))]
+
+    def test_reconcile_command(self, auth_user):
+        """Test the reconcile_balances management command."""
+        AccountFactory.create_batch(3, user=auth_user)
+
+        call_command("reconcile_balances", "--chunk-size", "2")
+
+        assert set(Account.objects.values_list("balance", flat=True)) == {Decimal("0")}
+
+    def test_reconcile_task(self, auth_user):
+        """Test the scheduled reconciliation task reports drifted accounts."""
+        AccountFactory(user=auth_user, balance=Decimal("5"))
+        AccountFactory(user=auth_user, balance=Decimal("0"))
+
+        result = reconcile_account_balances.delay(chunk_size=1)
+
+        assert result.get() == 1
+        assert set(Account.objects.values_list("balance", flat=True)) == {Decimal("0")}
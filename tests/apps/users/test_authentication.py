@@ -0,0 +1,116 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.users.authentication import TOKEN_USER_KEY
+from tests.factories import AuthUserFactory
+
+
+def _user_queries(queries):
+    return [query for query in queries if '"users_user"' in query["sql"]]
+
+
+def _client(user):
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}"
+    )
+    return client
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Test suite for the per-token user cache."""
+
+    def test_repeat_requests_skip_user_query(self):
+        """Test only the first request with a token loads the user."""
+        user = AuthUserFactory()
+        client = _client(user)
+        url = reverse("account-list")
+
+        with CaptureQueriesContext(connection) as first:
+            assert client.get(url).status_code == status.HTTP_200_OK
+        with CaptureQueriesContext(connection) as second:
+            response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(_user_queries(first)) == 1
+        assert not _user_queries(second)
+
+    def test_snapshot_omits_password(self):
+        """Test the cached user carries no password hash."""
+        from django.core.cache import cache
+
+        user = AuthUserFactory()
+        token = RefreshToken.for_user(user).access_token
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        client.get(reverse("account-list"))
+
+        _, field_names, row = cache.get(TOKEN_USER_KEY.format(jti=token["jti"]))
+        assert "password" not in field_names
+        assert user.password not in row
+
+    def test_deactivation_invalidates(self, django_capture_on_commit_callbacks):
+        """Test a deactivated user is rejected on the next request."""
+        user = AuthUserFactory()
+        client = _client(user)
+        url = reverse("account-list")
+        assert client.get(url).status_code == status.HTTP_200_OK
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+
+        assert client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_password_change_reloads_user(self, django_capture_on_commit_callbacks):
+        """Test a password change drops the cached user."""
+        user = AuthUserFactory()
+        client = _client(user)
+        url = reverse("account-list")
+        client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.set_password("another-pass-456")
+            user.save()
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(_user_queries(queries)) == 1
+
+    def test_graphql_accepts_bearer_token(self):
+        """Test GraphQL resolves bearer tokens through the same cache."""
+        user = AuthUserFactory()
+        client = _client(user)
+        client.get(reverse("account-list"))
+        query = json.dumps({"query": "{ me { email } }"})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                reverse("graphql"), query, content_type="application/json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["me"]["email"] == user.email
+        assert not _user_queries(queries)
+
+    def test_graphql_rejects_invalid_token(self):
+        """Test a malformed bearer token is a 401 on GraphQL."""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+
+        response = client.post(
+            reverse("graphql"),
+            json.dumps({"query": "{ me { email } }"}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
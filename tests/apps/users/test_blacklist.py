@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from apps.core.bloom import BloomFilter
+from apps.users.blacklist import is_blacklisted, prune_expired_tokens
+from apps.users.tasks import prune_token_blacklist
+from apps.users.tokens import RefreshToken
+from tests.factories import AuthUserFactory
+
+
+def _blacklist_queries(queries):
+    return [query for query in queries if "token_blacklist" in query["sql"]]
+
+
+class TestBloomFilter:
+    """Test suite for the Bloom filter."""
+
+    def test_no_false_negatives(self):
+        """Test every added key is reported present."""
+        keys = [f"jti-{i}" for i in range(1000)]
+        bloom = BloomFilter(len(keys), 0.001)
+        bloom.update(keys)
+
+        assert all(key in bloom for key in keys)
+        assert sum(f"other-{i}" in bloom for i in range(1000)) < 20
+
+
+@pytest.mark.django_db
+class TestTokenBlacklist:
+    """Test suite for filter-backed refresh-token blacklist checks."""
+
+    @pytest.fixture(autouse=True)
+    def _filter_enabled(self, settings):
+        # The filter is off without a shared cache, as in the test settings.
+        settings.TOKEN_BLACKLIST_FILTER = True
+
+    def _refresh(self, client, token):
+        return client.post(
+            reverse("token_refresh"), {"refresh": str(token)}, format="json"
+        )
+
+    def test_rotated_token_is_rejected(self, django_capture_on_commit_callbacks):
+        """Test a refresh token can't be reused after rotation."""
+        token = RefreshToken.for_user(AuthUserFactory())
+        client = APIClient()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first = self._refresh(client, token)
+        replay = self._refresh(client, token)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert replay.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_unlisted_token_skips_database(self):
+        """Test a token that isn't blacklisted is cleared without a query."""
+        user = AuthUserFactory()
+        RefreshToken.for_user(user).blacklist()
+        token = RefreshToken.for_user(user)
+        assert not is_blacklisted("unknown")  # Builds the filter.
+
+        with CaptureQueriesContext(connection) as queries:
+            token.check_blacklist()
+
+        assert not _blacklist_queries(queries)
+
+    def test_filter_hit_is_confirmed(self):
+        """Test a token blacklisted before the filter was built is rejected."""
+        token = RefreshToken.for_user(AuthUserFactory())
+        token.blacklist()
+
+        assert is_blacklisted(token["jti"])
+
+    def test_prune_removes_expired_tokens(self):
+        """Test pruning deletes expired tokens and their blacklist entries."""
+        user = AuthUserFactory()
+        live = RefreshToken.for_user(user)
+        for _ in range(3):
+            RefreshToken.for_user(user).blacklist()
+        OutstandingToken.objects.exclude(jti=live["jti"]).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        assert prune_expired_tokens(batch_size=2) == 3
+        assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [
+            live["jti"]
+        ]
+        assert not BlacklistedToken.objects.exists()
+        assert prune_token_blacklist.delay().get() == 0
+
+    def test_unshared_cache_checks_database(self, settings):
+        """Test every check queries the database when the cache isn't shared."""
+        settings.TOKEN_BLACKLIST_FILTER = False
+        token = RefreshToken.for_user(AuthUserFactory())
+
+        with CaptureQueriesContext(connection) as queries:
+            assert not is_blacklisted(token["jti"])
+        token.blacklist()
+
+        assert _blacklist_queries(queries)
+        assert is_blacklisted(token["jti"])
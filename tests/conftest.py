@@ -1,7 +1,7 @@
 import os
 import django
 import pytest
-from django.conf import settings
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -23,17 +23,16 @@ from tests.factories import (
 
 
 # ============================================================================
-# SESSION FIXTURES - Database and Transactional Setup
+# ISOLATION FIXTURES
 # ============================================================================
 
 
-@pytest.fixture(scope="session")
-def django_db_setup():
-    """Configure Django database for tests."""
-    settings.DATABASES["default"] = {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
-    }
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached data (e.g. per-user analytics) from leaking between tests."""
+    cache.clear()
+    yield
+    cache.clear()
 
 
 # ============================================================================
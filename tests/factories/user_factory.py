@@ -13,12 +13,12 @@ class UserFactory(factory.django.DjangoModelFactory):
         model = User
         django_get_or_create = ("email",)
 
-    email = factory.LazyAttribute(lambda _: fake.email())
+    email = factory.LazyAttribute(lambda _: fake.unique.email())
+    username = factory.LazyAttribute(lambda o: o.email)
     first_name = factory.LazyAttribute(lambda _: fake.first_name())
     last_name = factory.LazyAttribute(lambda _: fake.last_name())
     phone_number = factory.LazyAttribute(lambda _: fake.phone_number())
     is_active = True
-    email_verified = True
 
     @factory.post_generation
     def password(obj, create, extracted, **kwargs):
@@ -33,10 +33,9 @@ class UserFactory(factory.django.DjangoModelFactory):
 
 
 class AuthUserFactory(UserFactory):
-    """Factory for authenticated users with verified emails."""
+    """Factory for active users that tests log in as."""
 
     is_active = True
-    email_verified = True
 
     @factory.post_generation
     def password(obj, create, extracted, **kwargs):
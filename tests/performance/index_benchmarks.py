@@ -0,0 +1,155 @@
+"""
+Query-plan and latency benchmark for the Transaction composite indexes.
+
+Loads BENCHMARK_ROWS transactions (1,000,000 by default) spread across
+BENCHMARK_USERS users, then runs each hot query shape with and without the
+indexes declared on ``Transaction.Meta.indexes`` and prints the plans and
+median latencies side by side.
+
+Meant to be run against PostgreSQL, with the settings that honour
+DATABASE_URL (the default test settings always use in-memory SQLite):
+    DATABASE_URL=postgresql://... pytest --ds=config.settings.benchmark \
+        tests/performance/index_benchmarks.py -s
+"""
+
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.transactions.models import Transaction
+from tests.factories import (
+    AccountFactory,
+    TransactionCategoryFactory,
+    UserFactory,
+)
+
+ROWS = int(os.getenv("BENCHMARK_ROWS", "1000000"))
+USERS = int(os.getenv("BENCHMARK_USERS", "1000"))
+BATCH_SIZE = 10000
+RUNS = 5
+
+
+def _load_transactions():
+    """Bulk load ROWS transactions and return the first user's fixtures."""
+    today = timezone.now().date()
+    owners = []
+    for _ in range(USERS):
+        user = UserFactory()
+        account = AccountFactory(user=user)
+        categories = TransactionCategoryFactory.create_batch(5, user=user)
+        owners.append((user, account, categories))
+
+    rng = random.Random(42)
+    batch = []
+    for i in range(ROWS):
+        user, account, categories = owners[i % USERS]
+        batch.append(
+            Transaction(
+                id=uuid.uuid4(),
+                user=user,
+                account=account,
+                category=rng.choice(categories),
+                amount=Decimal(rng.randint(100, 100000)),
+                currency="NGN",
+                transaction_type=rng.choice(["income", "expense"]),
+                date=today - timedelta(days=rng.randint(0, 365 * 5)),
+                payment_method="cash",
+            )
+        )
+        if len(batch) == BATCH_SIZE:
+            Transaction.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Transaction.objects.bulk_create(batch)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Transaction._meta.db_table}")
+
+    return owners[0]
+
+
+def _query_shapes(user, category):
+    """The query shapes issued by the transaction, analytics and budget views."""
+    start = timezone.now().date() - timedelta(days=30)
+    return {
+        "transaction_list": (
+            Transaction.objects.filter(user=user).order_by("-date", "-created_at")[:50]
+        ),
+        "expense_window_sum": (
+            Transaction.objects.filter(
+                user=user, transaction_type="expense", date__gte=start
+            )
+            .values("user")
+            .annotate(total=Sum("amount"))
+        ),
+        "spending_trends": (
+            Transaction.objects.filter(
+                user=user, transaction_type="expense", date__gte=start
+            )
+            .values("date")
+            .annotate(total=Sum("amount"), count=Count("id"))
+            .order_by("date")
+        ),
+        "category_window": (
+            Transaction.objects.filter(
+                user=user, category=category, date__gte=start
+            ).order_by("-date")
+        ),
+    }
+
+
+def _measure(queryset):
+    """Return (plan, median seconds) for a queryset."""
+    options = {"analyze": True} if connection.vendor == "postgresql" else {}
+    plan = queryset.explain(**options)
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        list(queryset.all())
+        timings.append(time.perf_counter() - started)
+    return plan, statistics.median(timings)
+
+
+def _set_indexes(enabled):
+    with connection.schema_editor() as editor:
+        for index in Transaction._meta.indexes:
+            if enabled:
+                editor.add_index(Transaction, index)
+            else:
+                editor.remove_index(Transaction, index)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+class TestTransactionIndexes:
+    """Compare query plans and latency with and without the composite indexes."""
+
+    def test_index_plans_and_latency(self):
+        """Each hot query shape should use one of the composite indexes."""
+        user, _, categories = _load_transactions()
+        shapes = _query_shapes(user, categories[0])
+
+        _set_indexes(False)
+        without = {name: _measure(qs) for name, qs in shapes.items()}
+        _set_indexes(True)
+        with_indexes = {name: _measure(qs) for name, qs in shapes.items()}
+
+        index_names = [index.name for index in Transaction._meta.indexes]
+        print(f"\n{ROWS:,} rows across {USERS:,} users ({connection.vendor})")
+        for name in shapes:
+            plan_before, before = without[name]
+            plan_after, after = with_indexes[name]
+            print(f"\n=== {name}: {before * 1000:.2f}ms -> {after * 1000:.2f}ms")
+            print(f"--- without indexes\n{plan_before}")
+            print(f"--- with indexes\n{plan_after}")
+            assert any(index_name in plan_after for index_name in index_names)
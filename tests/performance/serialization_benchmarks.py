@@ -0,0 +1,120 @@
+"""
+Rows/sec benchmark for the serializer-free list path.
+
+Renders BENCHMARK_LIST_ROWS transactions (5,000 by default) to JSON through
+``TransactionSerializer`` and through the compiled ``values_list()`` plan,
+then requests the transaction list page by page with the fast path off and
+on, and prints the throughput of each side by side.
+
+    pytest tests/performance/serialization_benchmarks.py -s
+"""
+
+import os
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from api.v1.rest.renderers import FastJSONRenderer
+from api.v1.rest.serializers import TransactionSerializer
+from api.v1.rest.values import compile_rows
+from api.v1.rest.views import TransactionViewSet
+from apps.transactions.models import Transaction
+from tests.factories import AccountFactory, TransactionCategoryFactory
+
+ROWS = int(os.getenv("BENCHMARK_LIST_ROWS", "5000"))
+PAGE_SIZE = 200
+RUNS = 5
+
+
+def _load_transactions(user):
+    account = AccountFactory(user=user)
+    categories = TransactionCategoryFactory.create_batch(5, user=user)
+    today = timezone.now().date()
+    Transaction.objects.bulk_create(
+        Transaction(
+            id=uuid.uuid4(),
+            user=user,
+            account=account,
+            category=categories[i % 5] if i % 7 else None,
+            amount=Decimal(i % 50000) + Decimal("0.25"),
+            currency="NGN",
+            transaction_type="expense" if i % 3 else "income",
+            date=today - timedelta(days=i % 365),
+            description=f"Transaction {i}",
+            payment_method="card",
+        )
+        for i in range(ROWS)
+    )
+
+
+def _rows_per_second(render):
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        rows = render()
+        timings.append(time.perf_counter() - started)
+    return rows / statistics.median(timings)
+
+
+def _walk_pages(client):
+    """Follow keyset pages over the whole list; returns the rows read."""
+    url = reverse("transaction-list")
+    params = {"pagination": "cursor", "page_size": PAGE_SIZE}
+    rows = 0
+    while url:
+        body = client.get(url, params).json()
+        rows += len(body["results"])
+        url, params = body["next"], None
+    return rows
+
+
+@pytest.mark.performance
+@pytest.mark.django_db
+class TestListSerialization:
+    """Compare list throughput with and without the values() fast path."""
+
+    def test_rows_per_second(self, authenticated_api_client, auth_user):
+        """The values() path should render more rows/sec than the serializer."""
+        _load_transactions(auth_user)
+        queryset = (
+            Transaction.objects.filter(user=auth_user)
+            .select_related("account", "category")
+            .order_by("-date", "-created_at", "-pk")
+        )
+        context = {"expand": set()}
+        renderer = FastJSONRenderer()
+
+        def serializer_path():
+            instances = list(queryset)
+            data = TransactionSerializer(instances, many=True, context=context).data
+            renderer.render(data)
+            return len(instances)
+
+        def values_path():
+            plan = compile_rows(TransactionSerializer(context=context))
+            rows = list(queryset.values_list(*plan.columns, named=True))
+            renderer.render(plan.to_list(rows))
+            return len(rows)
+
+        serialized = _rows_per_second(serializer_path)
+        compiled = _rows_per_second(values_path)
+
+        TransactionViewSet.values_list_enabled = False
+        try:
+            pages_before = _rows_per_second(
+                lambda: _walk_pages(authenticated_api_client)
+            )
+        finally:
+            TransactionViewSet.values_list_enabled = True
+        pages_after = _rows_per_second(lambda: _walk_pages(authenticated_api_client))
+
+        print(f"\n{ROWS:,} transactions, median of {RUNS} runs")
+        print(f"render:  {serialized:,.0f} -> {compiled:,.0f} rows/sec")
+        print(f"list:    {pages_before:,.0f} -> {pages_after:,.0f} rows/sec")
+        assert compiled > serialized